@@ -8,11 +8,11 @@ from sqlalchemy.ext.asyncio import create_async_engine
 from alembic import context
 from src.domains.common.association.author_genre import AuthorGenre
 from src.domains.author.models import Author
-from src.domains.common.models import Base, BaseModelMixin
+from src.domains.common.models import Base, BaseModelMixin, ReferenceDataVersion
 from src.domains.genre.models import Genre
 from src.domains.user.models import User
 from src.domains.role.models import Role
-from src.domains.book.models import Book
+from src.domains.book.models import Book, BookStats
 from src.domains.favorites.models import Favorites
 from src.domains.review.models import Review
 from src.setting import settings
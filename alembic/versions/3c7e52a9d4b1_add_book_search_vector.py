@@ -0,0 +1,125 @@
+"""add_book_search_vector
+
+Revision ID: 3c7e52a9d4b1
+Revises: 6b1f8b69cfc9
+Create Date: 2026-10-18 13:42:08.513904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c7e52a9d4b1'
+down_revision: Union[str, Sequence[str], None] = '6b1f8b69cfc9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Frozen copy of src/domains/book/search.py at the time of this revision
+SEARCH_VECTOR_DDL = [
+    '''
+    CREATE OR REPLACE FUNCTION book_search_vector(p_book_id uuid, p_title text, p_description text)
+    RETURNS tsvector AS $$
+        SELECT
+            setweight(to_tsvector('russian', coalesce(p_title, '')), 'A')
+            || setweight(to_tsvector('simple', coalesce(p_title, '')), 'A')
+            || setweight(to_tsvector('russian', coalesce(names.value, '')), 'B')
+            || setweight(to_tsvector('simple', coalesce(names.value, '')), 'B')
+            || setweight(to_tsvector('russian', coalesce(p_description, '')), 'C')
+            || setweight(to_tsvector('simple', coalesce(p_description, '')), 'C')
+        FROM (
+            SELECT string_agg(a.first_name || ' ' || a.last_name, ' ') AS value
+            FROM author_book ab
+            JOIN author a ON a.id = ab.author_id
+            WHERE ab.book_id = p_book_id
+        ) AS names
+    $$ LANGUAGE sql STABLE
+    ''',
+    '''
+    CREATE OR REPLACE FUNCTION book_search_vector_refresh() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector := book_search_vector(NEW.id, NEW.title, NEW.description);
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    ''',
+    '''
+    CREATE OR REPLACE TRIGGER book_search_vector_refresh
+    BEFORE INSERT OR UPDATE OF title, description ON book
+    FOR EACH ROW EXECUTE FUNCTION book_search_vector_refresh()
+    ''',
+    '''
+    CREATE OR REPLACE FUNCTION author_book_search_vector_refresh() RETURNS trigger AS $$
+    BEGIN
+        UPDATE book SET search_vector = book_search_vector(id, title, description)
+        WHERE id IN (SELECT book_id FROM changed_rows);
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    ''',
+    '''
+    CREATE OR REPLACE TRIGGER author_book_insert_search_vector
+    AFTER INSERT ON author_book REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION author_book_search_vector_refresh()
+    ''',
+    '''
+    CREATE OR REPLACE TRIGGER author_book_delete_search_vector
+    AFTER DELETE ON author_book REFERENCING OLD TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION author_book_search_vector_refresh()
+    ''',
+    '''
+    CREATE OR REPLACE FUNCTION author_search_vector_refresh() RETURNS trigger AS $$
+    BEGIN
+        UPDATE book SET search_vector = book_search_vector(id, title, description)
+        WHERE id IN (
+            SELECT ab.book_id
+            FROM author_book ab
+            JOIN new_rows n ON n.id = ab.author_id
+            JOIN old_rows o ON o.id = n.id
+            WHERE (n.first_name, n.last_name) IS DISTINCT FROM (o.first_name, o.last_name)
+        );
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    ''',
+    '''
+    CREATE OR REPLACE TRIGGER author_update_search_vector
+    AFTER UPDATE ON author REFERENCING NEW TABLE AS new_rows OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION author_search_vector_refresh()
+    ''',
+]
+
+DROP_SEARCH_VECTOR_DDL = [
+    'DROP TRIGGER IF EXISTS author_update_search_vector ON author',
+    'DROP TRIGGER IF EXISTS author_book_delete_search_vector ON author_book',
+    'DROP TRIGGER IF EXISTS author_book_insert_search_vector ON author_book',
+    'DROP TRIGGER IF EXISTS book_search_vector_refresh ON book',
+    'DROP FUNCTION IF EXISTS author_search_vector_refresh()',
+    'DROP FUNCTION IF EXISTS author_book_search_vector_refresh()',
+    'DROP FUNCTION IF EXISTS book_search_vector_refresh()',
+    'DROP FUNCTION IF EXISTS book_search_vector(uuid, text, text)',
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('book', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+
+    for statement in SEARCH_VECTOR_DDL:
+        op.execute(statement)
+
+    op.execute('UPDATE book SET search_vector = book_search_vector(id, title, description)')
+    op.create_index('ix_book_search_vector', 'book', ['search_vector'], postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_book_search_vector', table_name='book')
+
+    for statement in DROP_SEARCH_VECTOR_DDL:
+        op.execute(statement)
+
+    op.drop_column('book', 'search_vector')
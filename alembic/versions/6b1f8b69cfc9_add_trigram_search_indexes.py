@@ -0,0 +1,47 @@
+"""add_trigram_search_indexes
+
+Revision ID: 6b1f8b69cfc9
+Revises: f06f51b15780
+Create Date: 2026-10-18 11:03:17.226918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6b1f8b69cfc9'
+down_revision: Union[str, Sequence[str], None] = 'f06f51b15780'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRIGRAM_COLUMNS = [
+    ('book', 'title'),
+    ('author', 'first_name'),
+    ('author', 'last_name'),
+    ('user', 'username'),
+    ('user', 'first_name'),
+    ('user', 'last_name'),
+    ('user', 'email'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    for table_name, column_name in TRIGRAM_COLUMNS:
+        op.create_index(
+            f'ix_{table_name}_{column_name}_trgm',
+            table_name,
+            [column_name],
+            postgresql_using='gin',
+            postgresql_ops={column_name: 'gin_trgm_ops'},
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table_name, column_name in TRIGRAM_COLUMNS:
+        op.drop_index(f'ix_{table_name}_{column_name}_trgm', table_name=table_name)
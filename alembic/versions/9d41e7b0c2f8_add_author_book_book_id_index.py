@@ -0,0 +1,27 @@
+"""add_author_book_book_id_index
+
+Revision ID: 9d41e7b0c2f8
+Revises: 3c7e52a9d4b1
+Create Date: 2026-10-18 15:20:44.190382
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d41e7b0c2f8'
+down_revision: Union[str, Sequence[str], None] = '3c7e52a9d4b1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_author_book_book_id'), 'author_book', ['book_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_author_book_book_id'), table_name='author_book')
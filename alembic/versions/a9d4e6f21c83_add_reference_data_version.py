@@ -0,0 +1,37 @@
+"""add_reference_data_version
+
+Revision ID: a9d4e6f21c83
+Revises: e8a31c5b7f02
+Create Date: 2026-10-18 20:14:05.118342
+
+Migrations that change genres, categories or roles later on should bump the counter too,
+running workers only reload their snapshot when it moves:
+
+    UPDATE reference_data_version SET version = version + 1 WHERE id = 1
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9d4e6f21c83'
+down_revision: Union[str, Sequence[str], None] = 'e8a31c5b7f02'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('reference_data_version',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('version', sa.BigInteger(), server_default='0', nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.execute("INSERT INTO reference_data_version (id, version) VALUES (1, 0)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('reference_data_version')
@@ -0,0 +1,40 @@
+"""add_review_listing_indexes
+
+Revision ID: c4f7a2e91d36
+Revises: 9d41e7b0c2f8
+Create Date: 2026-10-18 18:32:10.514207
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f7a2e91d36'
+down_revision: Union[str, Sequence[str], None] = '9d41e7b0c2f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_review_book_id_create_at',
+        'review',
+        ['book_id', sa.text('create_at DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+    op.create_index(
+        'ix_review_user_id_create_at',
+        'review',
+        ['user_id', sa.text('create_at DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_review_user_id_create_at', table_name='review')
+    op.drop_index('ix_review_book_id_create_at', table_name='review')
@@ -0,0 +1,106 @@
+"""add_covering_and_partial_fk_indexes
+
+Revision ID: e8a31c5b7f02
+Revises: c4f7a2e91d36
+Create Date: 2026-10-18 18:58:41.307662
+
+Indexes are built with CREATE INDEX CONCURRENTLY, which cannot run inside a transaction,
+hence the autocommit block. A concurrent build that fails leaves an INVALID index behind;
+drop it and rerun the upgrade, `if_not_exists` would otherwise skip it.
+
+review.book_id and review.user_id are covered by the listing indexes of c4f7a2e91d36.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8a31c5b7f02'
+down_revision: Union[str, Sequence[str], None] = 'c4f7a2e91d36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_book_genre_id_create_at',
+            'book',
+            ['genre_id', 'create_at', 'id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_book_category_id',
+            'book',
+            ['category_id'],
+            postgresql_where=sa.text('category_id IS NOT NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_author_book_book_id_author_id',
+            'author_book',
+            ['book_id'],
+            postgresql_include=['author_id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Superseded by the covering index above
+        op.drop_index(
+            'ix_author_book_book_id',
+            table_name='author_book',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.create_index(
+            'ix_reading_status_user_id_status',
+            'reading_status',
+            ['user_id', 'status'],
+            postgresql_include=['book_id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_review_book_id_create_at_with_text',
+            'review',
+            ['book_id', sa.text('create_at DESC'), sa.text('id DESC')],
+            postgresql_where=sa.text("text <> ''"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_review_book_id_create_at_with_text',
+            table_name='review',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'ix_reading_status_user_id_status',
+            table_name='reading_status',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.create_index(
+            'ix_author_book_book_id',
+            'author_book',
+            ['book_id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_author_book_book_id_author_id',
+            table_name='author_book',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index('ix_book_category_id', table_name='book', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_book_genre_id_create_at', table_name='book', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,70 @@
+"""add_book_stats_table
+
+Revision ID: f06f51b15780
+Revises: f265772dd520, f2a1d8c9e3b5
+Create Date: 2026-10-18 10:12:41.512034
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f06f51b15780'
+down_revision: Union[str, Sequence[str], None] = ('f265772dd520', 'f2a1d8c9e3b5')
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COUNTER_COLUMNS = [
+    'rating_sum',
+    'rating_count',
+    'rating_1',
+    'rating_2',
+    'rating_3',
+    'rating_4',
+    'rating_5',
+    'text_reviews_count',
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('book_stats',
+    sa.Column('book_id', sa.UUID(), nullable=False),
+    *[sa.Column(name, sa.Integer(), server_default='0', nullable=False) for name in COUNTER_COLUMNS],
+    sa.Column('create_at', sa.DateTime(), nullable=False),
+    sa.Column('update_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['book_id'], ['book.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('book_id')
+    )
+
+    op.execute(
+        """
+        INSERT INTO book_stats (
+            book_id, rating_sum, rating_count,
+            rating_1, rating_2, rating_3, rating_4, rating_5,
+            text_reviews_count, create_at, update_at
+        )
+        SELECT
+            book_id,
+            sum(rating),
+            count(*),
+            count(*) FILTER (WHERE rating = 1),
+            count(*) FILTER (WHERE rating = 2),
+            count(*) FILTER (WHERE rating = 3),
+            count(*) FILTER (WHERE rating = 4),
+            count(*) FILTER (WHERE rating = 5),
+            count(*) FILTER (WHERE text IS NOT NULL AND text <> ''),
+            now(),
+            now()
+        FROM review
+        GROUP BY book_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('book_stats')
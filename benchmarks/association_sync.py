@@ -0,0 +1,109 @@
+"""Compare replacing a book's author links wholesale with the diff-based `sync_association`.
+
+Usage: python -m benchmarks.association_sync [--books 20] [--authors-per-book 100] [--iterations 1000]
+
+Creates `--books` books that share a pool of authors, each linked to `--authors-per-book`
+of them, then repeatedly swaps one author of a random book. Both modes leave the same
+links behind; they differ in how many rows they rewrite and, under concurrency, in how
+updates of the same book interfere. Concurrent wholesale replacements can collide on the
+primary key, which is counted as errors. The fixture rows are removed afterwards.
+"""
+
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from collections import Counter
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from benchmarks.utils import create_benchmark_engine, measure, report
+from src.domains.author.models import Author
+from src.domains.book.models import Book
+from src.domains.common.association.author_book import AuthorBook
+from src.domains.common.association.sync import sync_association
+from src.domains.genre.models import Genre
+
+
+async def replace_all(session: AsyncSession, book_id: uuid.UUID, author_ids: list[uuid.UUID]) -> None:
+    """The previous `update_book` behaviour: delete every link, then insert the full list."""
+
+    await session.execute(delete(AuthorBook).where(AuthorBook.book_id == book_id))
+    await session.execute(insert(AuthorBook), [{"author_id": a, "book_id": book_id} for a in author_ids])
+
+
+async def sync_diff(session: AsyncSession, book_id: uuid.UUID, author_ids: list[uuid.UUID]) -> None:
+    """The `update_book` path: lock the book row, then write only the changed links."""
+
+    await session.execute(select(Book.id).where(Book.id == book_id).with_for_update())
+    await sync_association(session, AuthorBook.book_id, book_id, AuthorBook.author_id, author_ids)
+
+
+async def main(dsn: str | None, books: int, authors_per_book: int, iterations: int, concurrency: int) -> None:
+    engine = create_benchmark_engine(dsn, pool_size=concurrency)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+
+    genre = Genre(name=f"benchmark-{uuid.uuid4().hex[:16]}")
+    author_pool = [Author(first_name="Benchmark", last_name=str(i)) for i in range(authors_per_book * 2)]
+    book_rows = [Book(title=f"Benchmark book {i}") for i in range(books)]
+    async with session_maker() as session:
+        session.add_all([genre, *author_pool])
+        await session.flush()
+        for book in book_rows:
+            book.genre_id = genre.id
+        session.add_all(book_rows)
+        await session.flush()
+        current = {book.id: random.sample([a.id for a in author_pool], authors_per_book) for book in book_rows}
+        await session.execute(
+            insert(AuthorBook),
+            [{"author_id": a, "book_id": book_id} for book_id, ids in current.items() for a in ids],
+        )
+        await session.commit()
+
+    pool_ids = [a.id for a in author_pool]
+
+    try:
+        for name, write in (("replace all links", replace_all), ("sync difference", sync_diff)):
+            errors: Counter[str] = Counter()
+
+            async def swap_one_author(session: AsyncSession, write=write, errors=errors) -> None:
+                book_id = random.choice(list(current))
+                author_ids = list(current[book_id])
+                author_ids[random.randrange(len(author_ids))] = random.choice(
+                    [a for a in pool_ids if a not in author_ids]
+                )
+                try:
+                    await write(session, book_id, author_ids)
+                    await session.commit()
+                    current[book_id] = author_ids
+                except DBAPIError as err:
+                    errors[type(err.orig).__name__] += 1
+                    await session.rollback()
+
+            start = time.perf_counter()
+            samples = await measure(session_maker, swap_one_author, iterations, concurrency)
+            report(name, samples, time.perf_counter() - start)
+            if errors:
+                print(f"{'':<24} errors: {dict(errors)}")
+    finally:
+        async with session_maker() as session:
+            await session.execute(delete(Book).where(Book.id.in_(current)))
+            await session.execute(delete(Author).where(Author.id.in_(pool_ids)))
+            await session.execute(delete(Genre).where(Genre.id == genre.id))
+            await session.commit()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dsn", default=None)
+    parser.add_argument("--books", type=int, default=20)
+    parser.add_argument("--authors-per-book", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.dsn, args.books, args.authors_per_book, args.iterations, args.concurrency))
@@ -0,0 +1,63 @@
+"""Compare latency of the single-statement `get_book_information` with the old five-statement path.
+
+Usage: python -m benchmarks.book_information <book_id> [--iterations 2000] [--concurrency 20]
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import joinedload
+
+from benchmarks.utils import create_benchmark_engine, measure, report
+from src.domains.author.models import Author
+from src.domains.book.models import Book
+from src.domains.book.repository import get_book_information
+from src.domains.review.models import Review
+
+
+async def legacy_get_book_information(session: AsyncSession, id: uuid.UUID) -> None:
+    book_stmt = select(Book).where(Book.id == id).options(joinedload(Book.authors).joinedload(Author.genres))
+    (await session.execute(book_stmt)).unique().scalar_one()
+
+    await session.execute(select(func.avg(Review.rating), func.count(Review.id)).where(Review.book_id == id))
+    await session.execute(select(func.count(Review.id)).where(Review.book_id == id, Review.rating == 5))
+    await session.execute(
+        select(func.count(Review.id)).where(Review.book_id == id, Review.text.isnot(None), Review.text != "")
+    )
+    await session.execute(
+        select(Review)
+        .options(joinedload(Review.user))
+        .where(Review.book_id == id)
+        .order_by(Review.create_at.desc())
+        .limit(10)
+    )
+
+
+async def main(book_id: uuid.UUID, iterations: int, concurrency: int) -> None:
+    engine = create_benchmark_engine(pool_size=concurrency)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+
+    for name, call in (
+        ("legacy (5 statements)", legacy_get_book_information),
+        ("single statement", get_book_information),
+    ):
+        await measure(session_maker, lambda s, call=call: call(s, book_id), concurrency, concurrency)
+        start = time.perf_counter()
+        samples = await measure(session_maker, lambda s, call=call: call(s, book_id), iterations, concurrency)
+        report(name, samples, time.perf_counter() - start)
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("book_id", type=uuid.UUID)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.book_id, args.iterations, args.concurrency))
@@ -0,0 +1,93 @@
+"""Measure `/book/search` latency against the substring filter on a synthetic catalogue.
+
+Usage: python -m benchmarks.book_search [--seed 1000000] [--iterations 500] [--concurrency 20]
+
+`--seed N` inserts N generated books (titles and descriptions drawn from a small mixed
+Cyrillic/Latin vocabulary) before measuring; the search vector trigger fills them in.
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from benchmarks.utils import create_benchmark_engine, measure, report
+from src.domains.book.models import Book
+from src.domains.book.repository import search_books
+from src.domains.book.schema import BookSearchSchema
+from src.utils.request_builder import ilike_contains
+
+WORDS = [
+    "война", "мир", "история", "любовь", "город", "море", "ночь", "дорога", "память", "сад",
+    "war", "peace", "history", "love", "city", "sea", "night", "road", "memory", "garden",
+]
+
+SEED_STATEMENTS = [
+    """
+    INSERT INTO genre (id, name, create_at, update_at)
+    VALUES (gen_random_uuid(), 'Benchmark genre', now(), now())
+    ON CONFLICT (name) DO NOTHING
+    """,
+    """
+    INSERT INTO book (id, title, description, genre_id, create_at, update_at)
+    SELECT
+        gen_random_uuid(),
+        w[1 + (random() * 19)::int] || ' ' || w[1 + (random() * 19)::int] || ' ' || n,
+        w[1 + (random() * 19)::int] || ' ' || w[1 + (random() * 19)::int] || ' ' || w[1 + (random() * 19)::int],
+        (SELECT id FROM genre WHERE name = 'Benchmark genre'),
+        now(),
+        now()
+    FROM generate_series(1, :count) AS n, (SELECT CAST(:words AS text[]) AS w) AS words
+    """,
+    "ANALYZE book",
+]
+
+
+async def seed(session_maker: async_sessionmaker[AsyncSession], count: int) -> None:
+    start = time.perf_counter()
+    async with session_maker() as session:
+        for statement in SEED_STATEMENTS:
+            await session.execute(text(statement), {"words": WORDS, "count": count})
+        await session.commit()
+    print(f"seeded {count} books in {time.perf_counter() - start:.1f}s")
+
+
+async def substring_search(session: AsyncSession, q: str) -> None:
+    query = select(Book).where(ilike_contains(Book.title, q) | ilike_contains(Book.description, q)).limit(20)
+    (await session.execute(query)).scalars().all()
+
+
+async def main(seed_count: int, iterations: int, concurrency: int) -> None:
+    engine = create_benchmark_engine(pool_size=concurrency)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+
+    if seed_count:
+        await seed(session_maker, seed_count)
+
+    def random_query() -> str:
+        return " ".join(random.sample(WORDS, 2))
+
+    for name, call in (
+        ("substring filter", lambda s: substring_search(s, random_query())),
+        ("full-text search", lambda s: search_books(s, BookSearchSchema(q=random_query()))),
+        ("full-text + rating", lambda s: search_books(s, BookSearchSchema(q=random_query(), rating_weight=0.5))),
+    ):
+        await measure(session_maker, call, concurrency, concurrency)
+        start = time.perf_counter()
+        samples = await measure(session_maker, call, iterations, concurrency)
+        report(name, samples, time.perf_counter() - start)
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.seed, args.iterations, args.concurrency))
@@ -0,0 +1,85 @@
+"""Measure login throughput and catalogue read latency while logins are running.
+
+Usage: python -m benchmarks.login_throughput [--logins 200] [--login-concurrency 20] [--reads 1000]
+
+Runs the same mixed workload twice: once verifying passwords inline on the event loop
+(the old behaviour) and once through the bounded hashing pool (`PASSWORD_HASH_WORKERS`).
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from benchmarks.utils import create_benchmark_engine, measure, report
+from src.auth.utils import password_hash, verify_password
+from src.domains.book.repository import get_books_list
+from src.domains.book.schema import BookFilters, BookListOrderSchema
+from src.setting import settings
+
+PASSWORD = "BenchmarkPass123!"
+
+
+async def verify_inline(plain_password: str, hashed_password: str) -> bool:
+    return password_hash.verify(plain_password, hashed_password)
+
+
+async def run_logins(
+    verify: Callable[[str, str], Awaitable[bool]],
+    hashed_password: str,
+    logins: int,
+    concurrency: int,
+) -> tuple[list[float], float]:
+    samples: list[float] = []
+    pending = iter(range(logins))
+
+    async def worker() -> None:
+        for _ in pending:
+            start = time.perf_counter()
+            await verify(PASSWORD, hashed_password)
+            samples.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return samples, time.perf_counter() - start
+
+
+async def read_catalogue(session: AsyncSession) -> None:
+    await get_books_list(session, BookFilters(), BookListOrderSchema())
+
+
+async def main(logins: int, login_concurrency: int, reads: int, read_concurrency: int) -> None:
+    engine = create_benchmark_engine(pool_size=read_concurrency)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    hashed_password = password_hash.hash(PASSWORD)
+
+    await measure(session_maker, read_catalogue, read_concurrency, read_concurrency)
+    start = time.perf_counter()
+    samples = await measure(session_maker, read_catalogue, reads, read_concurrency)
+    report("reads, no logins", samples, time.perf_counter() - start)
+
+    for name, verify in (
+        ("inline", verify_inline),
+        (f"pool ({settings.password_hash_workers} threads)", verify_password),
+    ):
+        (login_samples, login_elapsed), read_samples = await asyncio.gather(
+            run_logins(verify, hashed_password, logins, login_concurrency),
+            measure(session_maker, read_catalogue, reads, read_concurrency),
+        )
+        report(f"logins, {name}", login_samples, login_elapsed)
+        report(f"reads, {name}", read_samples)
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--login-concurrency", type=int, default=20)
+    parser.add_argument("--reads", type=int, default=1000)
+    parser.add_argument("--read-concurrency", type=int, default=10)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.logins, args.login_concurrency, args.reads, args.read_concurrency))
@@ -0,0 +1,80 @@
+"""Compare the default engine with PgBouncer mode (`DB_PGBOUNCER=true`).
+
+Usage: python -m benchmarks.pgbouncer [--dsn postgresql+asyncpg://...:6432/db] [--iterations 2000]
+
+Point `--dsn` at PgBouncer in transaction mode, e.g. the `pgbouncer` service of
+`docker compose --profile pgbouncer up`. Against PgBouncer the default mode is expected
+to fail with prepared statement errors once server connections are shared; against
+Postgres directly the run shows what disabling the statement cache costs.
+"""
+
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from collections import Counter
+
+from sqlalchemy import select
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from benchmarks.utils import create_benchmark_engine, measure, report
+from src.db.pgbouncer import pgbouncer_connect_args, set_local_on_begin
+from src.domains.book.models import Book
+from src.domains.book.repository import get_books_list
+from src.domains.book.schema import BookFilters, BookListOrderSchema
+
+SERVER_SETTINGS = {"application_name": "benchmark", "statement_timeout": "5000"}
+
+
+def create_engine(mode: str, dsn: str | None, pool_size: int) -> AsyncEngine:
+    if mode == "default":
+        return create_benchmark_engine(dsn, pool_size=pool_size, connect_args={"server_settings": SERVER_SETTINGS})
+
+    connect_args, local_settings = pgbouncer_connect_args(SERVER_SETTINGS)
+    engine = create_benchmark_engine(dsn, pool_size=pool_size, connect_args=connect_args)
+    set_local_on_begin(engine, local_settings)
+    return engine
+
+
+async def run(mode: str, dsn: str | None, iterations: int, concurrency: int) -> None:
+    engine = create_engine(mode, dsn, concurrency)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    errors: Counter[str] = Counter()
+
+    async with session_maker() as session:
+        book_ids = list((await session.execute(select(Book.id).limit(1000))).scalars())
+
+    async def transaction(session: AsyncSession) -> None:
+        book_id = random.choice(book_ids) if book_ids else uuid.uuid4()
+        try:
+            await session.execute(select(Book.id, Book.title).where(Book.id == book_id))
+            await get_books_list(session, BookFilters(offset=random.randint(0, 100)), BookListOrderSchema())
+            await session.commit()
+        except DBAPIError as err:
+            errors[type(err.orig).__name__] += 1
+            await session.rollback()
+
+    start = time.perf_counter()
+    samples = await measure(session_maker, transaction, iterations, concurrency)
+    report(mode, samples, time.perf_counter() - start)
+    if errors:
+        print(f"{'':<24} errors: {dict(errors)}")
+
+    await engine.dispose()
+
+
+async def main(dsn: str | None, iterations: int, concurrency: int) -> None:
+    for mode in ("default", "pgbouncer"):
+        await run(mode, dsn, iterations, concurrency)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dsn", default=None)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.dsn, args.iterations, args.concurrency))
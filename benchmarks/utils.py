@@ -0,0 +1,56 @@
+import asyncio
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+import src.main  # noqa: F401  imports every domain so all mappers are configured
+from src.setting import settings
+
+
+def create_benchmark_engine(dsn: str | None = None, **kwargs) -> AsyncEngine:
+    return create_async_engine(dsn or settings.db_dsn, echo=False, **kwargs)
+
+
+async def measure(
+    session_maker: async_sessionmaker[AsyncSession],
+    call: Callable[[AsyncSession], Awaitable[object]],
+    iterations: int,
+    concurrency: int,
+) -> list[float]:
+    """Run `call` `iterations` times with `concurrency` workers, return latencies in seconds."""
+
+    samples: list[float] = []
+    queue: asyncio.Queue[int] = asyncio.Queue()
+    for i in range(iterations):
+        queue.put_nowait(i)
+
+    async def worker() -> None:
+        while not queue.empty():
+            queue.get_nowait()
+            async with session_maker() as session:
+                start = time.perf_counter()
+                await call(session)
+                samples.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return samples
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+def report(name: str, samples: list[float], elapsed: float | None = None) -> None:
+    line = (
+        f"{name:<24} n={len(samples):<6} "
+        f"p50={percentile(samples, 50) * 1000:8.2f}ms "
+        f"p99={percentile(samples, 99) * 1000:8.2f}ms "
+        f"mean={statistics.fmean(samples) * 1000:8.2f}ms"
+    )
+    if elapsed:
+        line += f" throughput={len(samples) / elapsed:8.1f}/s"
+    print(line)
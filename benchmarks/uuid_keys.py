@@ -0,0 +1,117 @@
+"""Compare insert throughput and primary key index size for uuid4 and UUIDv7 ids.
+
+Usage: python -m benchmarks.uuid_keys [--dsn ...] [--rows 200000] [--batch-size 500] [--concurrency 4]
+
+Inserts `--rows` review-shaped rows into a scratch table per id kind, `--batch-size` rows
+per transaction, and reports batch latency, throughput and the final table and primary key
+index sizes. Random uuid4 keys split pages all over the index, which stays around 70% full;
+time-ordered keys only touch its right edge. The throughput gap widens once the index no
+longer fits in `shared_buffers`, so use enough `--rows` to get there. Postgres only; the
+scratch tables are dropped afterwards.
+"""
+
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from collections.abc import Callable
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, Table, Text, insert, text
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from benchmarks.utils import create_benchmark_engine, measure, report
+
+metadata = MetaData()
+
+
+def review_table(name: str) -> Table:
+    return Table(
+        name,
+        metadata,
+        Column("id", PG_UUID(as_uuid=True), primary_key=True),
+        Column("user_id", PG_UUID(as_uuid=True), nullable=False),
+        Column("book_id", PG_UUID(as_uuid=True), nullable=False),
+        Column("rating", Integer, nullable=False),
+        Column("text", Text),
+        Column("create_at", DateTime, nullable=False),
+    )
+
+
+async def relation_sizes(engine: AsyncEngine, table: Table) -> tuple[int, int]:
+    async with engine.connect() as connection:
+        result = await connection.execute(
+            text("SELECT pg_table_size(:table), pg_relation_size(:index)"),
+            {"table": table.name, "index": f"{table.name}_pkey"},
+        )
+        table_size, index_size = result.one()
+    return table_size, index_size
+
+
+async def run(
+    engine: AsyncEngine,
+    name: str,
+    new_id: Callable[[], uuid.UUID],
+    rows: int,
+    batch_size: int,
+    concurrency: int,
+) -> None:
+    table = review_table(f"benchmark_uuid_{name}")
+    async with engine.begin() as connection:
+        await connection.run_sync(table.create)
+
+    session_maker = async_sessionmaker(engine)
+    user_ids = [uuid.uuid4() for _ in range(100)]
+    book_ids = [uuid.uuid4() for _ in range(1000)]
+
+    async def insert_batch(session: AsyncSession) -> None:
+        batch = [
+            {
+                "id": new_id(),
+                "user_id": random.choice(user_ids),
+                "book_id": random.choice(book_ids),
+                "rating": random.randint(1, 5),
+                "text": "benchmark review",
+                "create_at": datetime.utcnow(),
+            }
+            for _ in range(batch_size)
+        ]
+        await session.execute(insert(table), batch)
+        await session.commit()
+
+    try:
+        start = time.perf_counter()
+        samples = await measure(session_maker, insert_batch, rows // batch_size, concurrency)
+        elapsed = time.perf_counter() - start
+        report(f"{name} (per batch)", samples, elapsed)
+
+        table_size, index_size = await relation_sizes(engine, table)
+        print(
+            f"{'':<24} rows/s={len(samples) * batch_size / elapsed:10.0f} "
+            f"table={table_size / 2**20:8.1f}MiB pkey={index_size / 2**20:8.1f}MiB"
+        )
+    finally:
+        async with engine.begin() as connection:
+            await connection.run_sync(table.drop)
+
+
+async def main(dsn: str | None, rows: int, batch_size: int, concurrency: int) -> None:
+    engine = create_benchmark_engine(dsn, pool_size=concurrency)
+
+    for name, new_id in (("uuid4", uuid.uuid4), ("uuid7", uuid.uuid7)):
+        await run(engine, name, new_id, rows, batch_size, concurrency)
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dsn", default=None)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.dsn, args.rows, args.batch_size, args.concurrency))
@@ -9,6 +9,8 @@ from src.domains.genre.api import router as genre_router
 from src.domains.reading_status.api import router as reading_status_router
 from src.domains.review.api import router as review_router
 from src.domains.user.api import router as user_router
+from src.export.api import router as export_router
+from src.metrics.api import router as metrics_router
 from src.setting import settings
 
 routers = {
@@ -21,6 +23,8 @@ routers = {
     "book": ["/book", book_router],
     "auth": [settings.auth_prefix, auth_router],
     "me": ["/me", reading_status_router],
+    "export": ["/export", export_router],
+    "metrics": ["/metrics", metrics_router],
 }
 
 
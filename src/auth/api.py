@@ -5,6 +5,7 @@ from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.auth.cache import user_cache
 from src.auth.guards import get_current_active_user
 from src.auth.schema import SetPasswordSchema, TokenReadSchema
 from src.auth.utils import authenticate_user, create_access_token, get_password_hash
@@ -39,7 +40,8 @@ async def current_user_set_password(
     current_user: Annotated[UserReadSchema, Depends(get_current_active_user)],
     session: Annotated[AsyncSession, Depends(get_async_session)],
 ) -> None:
-    hashed_password = get_password_hash(user_data.password.get_secret_value())
+    hashed_password = await get_password_hash(user_data.password.get_secret_value())
     stmt = update(User).where(User.id == current_user.id).values({"hashed_password": hashed_password})
     await session.execute(stmt)
     await session.commit()
+    user_cache.invalidate(current_user.id)
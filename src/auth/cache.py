@@ -0,0 +1,54 @@
+import uuid
+
+from src.domains.user.schema import UserReadSchema
+from src.metrics.registry import registry
+from src.setting import settings
+from src.utils.cache import TTLCache
+
+user_cache_hits = registry.counter("auth_user_cache_hits_total", "Authenticated user lookups served from the cache")
+user_cache_misses = registry.counter("auth_user_cache_misses_total", "Authenticated user lookups that hit the database")
+
+
+class UserCache:
+    """Authenticated users by username, with explicit invalidation by user id.
+
+    `generation` changes on every invalidation; a lookup that started before one must not
+    store what it loaded, otherwise a concurrent request could re-cache a disabled user.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._users: TTLCache[str, UserReadSchema] = TTLCache(maxsize, ttl)
+        self._usernames: TTLCache[uuid.UUID, str] = TTLCache(maxsize, ttl)
+        self.generation = 0
+
+    def get(self, username: str) -> UserReadSchema | None:
+        user = self._users.get(username)
+        if user is None:
+            user_cache_misses.inc()
+            return None
+
+        # Keep the id of a hot user as recent as its entry, so invalidate() still finds it
+        self._usernames.get(user.id)
+        user_cache_hits.inc()
+        return user
+
+    def set(self, user: UserReadSchema, generation: int) -> None:
+        if generation != self.generation:
+            return
+
+        self._users.set(user.username, user)
+        self._usernames.set(user.id, user.username)
+
+    def invalidate(self, user_id: uuid.UUID) -> None:
+        self.generation += 1
+        username = self._usernames.pop(user_id)
+        if username is not None:
+            self._users.pop(username)
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._users.clear()
+        self._usernames.clear()
+
+
+user_cache = UserCache(settings.user_cache_max_size, settings.user_cache_ttl_seconds)
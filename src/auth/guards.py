@@ -5,6 +5,7 @@ from fastapi import Depends
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.auth.cache import user_cache
 from src.auth.schema import TokenDataSchema
 from src.constants.user_role import UserRole
 from src.db.db import get_async_session
@@ -32,12 +33,20 @@ async def get_current_user(
         raise BadCredentials()
 
     token_data = TokenDataSchema(username=username)
+    cached_user = user_cache.get(token_data.username)
+    if cached_user is not None:
+        return cached_user
+
+    generation = user_cache.generation
     user = await get_user_orm_by_username(session, username=token_data.username)
 
     if user is None:
         raise BadCredentials()
 
-    return UserReadSchema.from_orm(user)
+    current_user = UserReadSchema.from_orm(user)
+    user_cache.set(current_user, generation)
+
+    return current_user
 
 
 async def get_current_active_user(
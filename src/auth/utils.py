@@ -1,4 +1,9 @@
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from typing import TypeVar
 
 import jwt
 from pwdlib import PasswordHash
@@ -8,24 +13,71 @@ from src.domains.user.repository import get_user_orm_by_username
 from src.domains.user.schema import UserReadSchema
 from src.exceptions.auth import IncorrectUsernamePassword
 from src.exceptions.entity import EntityNotFound
+from src.metrics.registry import registry
 from src.setting import settings
 
+T = TypeVar("T")
+
 password_hash = PasswordHash.recommended()
 
+# Argon2 releases the GIL, so a few threads hash in parallel while the event loop keeps serving
+password_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.password_hash_workers,
+    thread_name_prefix="password-hash",
+)
+
+password_hash_queue_depth = registry.gauge(
+    "auth_password_hash_queue_depth", "Password hash jobs waiting for a free worker thread"
+)
+password_hash_in_progress = registry.gauge("auth_password_hash_in_progress", "Password hash jobs being computed")
+password_hash_wait_seconds = registry.histogram(
+    "auth_password_hash_wait_seconds", "Time a password hash job waited for a worker thread"
+)
+password_hash_duration_seconds = registry.histogram(
+    "auth_password_hash_duration_seconds", "Time spent computing a password hash"
+)
+
+
+async def _run_password_hash_job(operation: str, func: Callable[..., T], *args: str) -> T:
+    """Run an Argon2 call on the bounded hashing pool, recording queue depth and timings."""
+
+    submitted = time.perf_counter()
+
+    def job() -> T:
+        started = time.perf_counter()
+        password_hash_queue_depth.dec()
+        password_hash_in_progress.inc()
+        password_hash_wait_seconds.observe(started - submitted, operation=operation)
+        try:
+            return func(*args)
+        finally:
+            password_hash_in_progress.dec()
+            password_hash_duration_seconds.observe(time.perf_counter() - started, operation=operation)
+
+    def on_done(future: Future[T]) -> None:
+        # A job cancelled before it started never ran `job`, so it is still counted as queued
+        if future.cancelled():
+            password_hash_queue_depth.dec()
+
+    password_hash_queue_depth.inc()
+    future = password_hash_executor.submit(job)
+    future.add_done_callback(on_done)
+    return await asyncio.wrap_future(future)
+
 
-def get_password_hash(password: str) -> str:
-    return password_hash.hash(password)
+async def get_password_hash(password: str) -> str:
+    return await _run_password_hash_job("hash", password_hash.hash, password)
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return password_hash.verify(plain_password, hashed_password)
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return await _run_password_hash_job("verify", password_hash.verify, plain_password, hashed_password)
 
 
 async def authenticate_user(session: AsyncSession, username: str, password: str) -> UserReadSchema:
     try:
         user = await get_user_orm_by_username(session, username)
 
-        if not verify_password(password, user.hashed_password):
+        if not await verify_password(password, user.hashed_password):
             raise IncorrectUsernamePassword()
 
         return UserReadSchema.from_orm(user)
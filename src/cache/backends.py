@@ -0,0 +1,142 @@
+"""Storage for the repository result cache: in-process, or shared through Redis.
+
+Entries are invalidated by tag versions rather than by deleting keys. Every tag has a
+counter that invalidation increments; an entry records the versions of its tags read
+before its value was computed and is only valid while they are unchanged. Invalidating
+a tag is O(1) however many entries carry it, and a value computed from data read before
+an invalidation can never be stored as valid after it.
+
+A tag whose counter was never incremented, or whose counter expired, has version 0.
+Counters outlive the longest entry by `TAG_VERSION_TTL_SECONDS`, so a counter that
+expires and starts again from 0 cannot revive an entry recorded against its old value.
+"""
+
+import json
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from src.utils.cache import TTLCache
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+TAG_VERSION_TTL_SECONDS = 24 * 60 * 60
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    # JSON encoded result
+    value: bytes
+    tag_versions: tuple[int, ...]
+    # Wall clock, so entries shared between workers agree on it
+    fresh_until: float
+
+
+class CacheBackend(ABC):
+    @abstractmethod
+    async def lookup(self, key: str, tags: Sequence[str]) -> tuple[CacheEntry | None, tuple[int, ...]]:
+        """Return the entry stored under `key` and the current versions of `tags` in one round trip."""
+
+    @abstractmethod
+    async def tag_versions(self, tags: Sequence[str]) -> tuple[int, ...]: ...
+
+    @abstractmethod
+    async def store(self, key: str, entry: CacheEntry, ttl: float) -> None: ...
+
+    @abstractmethod
+    async def invalidate(self, tags: Sequence[str]) -> None: ...
+
+    @abstractmethod
+    async def clear(self) -> None: ...
+
+
+class MemoryCacheBackend(CacheBackend):
+    """LRU of entries with per-entry expiry, local to the worker."""
+
+    def __init__(self, maxsize: int) -> None:
+        self._entries: TTLCache[str, CacheEntry] = TTLCache(maxsize, TAG_VERSION_TTL_SECONDS)
+        # Tag versions expire but are never evicted for size, see the module docstring
+        self._versions: dict[str, tuple[int, float]] = {}
+        self._next_prune_at = time.monotonic() + TAG_VERSION_TTL_SECONDS
+
+    def _version(self, tag: str, now: float) -> int:
+        item = self._versions.get(tag)
+        return item[0] if item is not None and item[1] > now else 0
+
+    async def lookup(self, key: str, tags: Sequence[str]) -> tuple[CacheEntry | None, tuple[int, ...]]:
+        return self._entries.get(key), await self.tag_versions(tags)
+
+    async def tag_versions(self, tags: Sequence[str]) -> tuple[int, ...]:
+        now = time.monotonic()
+        return tuple(self._version(tag, now) for tag in tags)
+
+    async def store(self, key: str, entry: CacheEntry, ttl: float) -> None:
+        self._entries.set(key, entry, ttl)
+
+    async def invalidate(self, tags: Sequence[str]) -> None:
+        now = time.monotonic()
+        for tag in tags:
+            self._versions[tag] = (self._version(tag, now) + 1, now + TAG_VERSION_TTL_SECONDS)
+
+        if now >= self._next_prune_at:
+            self._versions = {tag: item for tag, item in self._versions.items() if item[1] > now}
+            self._next_prune_at = now + TAG_VERSION_TTL_SECONDS
+
+    async def clear(self) -> None:
+        self._entries.clear()
+        self._versions.clear()
+
+
+class RedisCacheBackend(CacheBackend):
+    """Entries and tag versions in Redis, shared by every worker.
+
+    Takes any `redis.asyncio`-compatible client, so tests can pass a fakeredis one.
+    """
+
+    def __init__(self, client: "Redis", prefix: str) -> None:
+        self.client = client
+        self.prefix = prefix
+
+    def _entry_key(self, key: str) -> str:
+        return f"{self.prefix}:entry:{key}"
+
+    def _tag_keys(self, tags: Sequence[str]) -> list[str]:
+        return [f"{self.prefix}:tag:{tag}" for tag in tags]
+
+    async def lookup(self, key: str, tags: Sequence[str]) -> tuple[CacheEntry | None, tuple[int, ...]]:
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.get(self._entry_key(key))
+            pipe.mget(self._tag_keys(tags))
+            payload, versions = await pipe.execute()
+
+        entry = None
+        if payload is not None:
+            data = json.loads(payload)
+            entry = CacheEntry(data["value"].encode(), tuple(data["tag_versions"]), data["fresh_until"])
+
+        return entry, tuple(int(version or 0) for version in versions)
+
+    async def tag_versions(self, tags: Sequence[str]) -> tuple[int, ...]:
+        versions = await self.client.mget(self._tag_keys(tags))
+        return tuple(int(version or 0) for version in versions)
+
+    async def store(self, key: str, entry: CacheEntry, ttl: float) -> None:
+        payload = json.dumps(
+            {"value": entry.value.decode(), "tag_versions": entry.tag_versions, "fresh_until": entry.fresh_until}
+        )
+        await self.client.set(self._entry_key(key), payload, px=max(int(ttl * 1000), 1))
+
+    async def invalidate(self, tags: Sequence[str]) -> None:
+        async with self.client.pipeline(transaction=False) as pipe:
+            for tag_key in self._tag_keys(tags):
+                pipe.incr(tag_key)
+                pipe.expire(tag_key, TAG_VERSION_TTL_SECONDS)
+            await pipe.execute()
+
+    async def clear(self) -> None:
+        keys = [key async for key in self.client.scan_iter(match=f"{self.prefix}:*")]
+        if keys:
+            await self.client.delete(*keys)
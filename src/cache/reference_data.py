@@ -0,0 +1,177 @@
+"""Immutable in-process snapshot of genres, categories and roles.
+
+These tables change a few times a year but are read by every genre and category listing
+and every sign-up. The snapshot is loaded at startup, or by the first request that needs
+it, and served without touching the database.
+
+Writes to these tables call `await reference_data.bump(session)` before committing, which
+increments the single row of `reference_data_version` in the same transaction, and
+`reference_data.expire()` once the commit succeeded, so the next read in that worker
+reloads. Other workers read the counter at most every `check_seconds` and reload when it
+moved. Migrations that change these tables should bump the counter as well.
+
+Callers pass a primary session, which only checks out a connection when the snapshot is
+checked or reloaded. Reloads are rare enough for the primary, and a replica could hand
+back the data from before the write that expired the snapshot.
+
+Responses built from a snapshot carry its `etag`, which changes with its content, and a
+`Cache-Control` of `REFERENCE_DATA_MAX_AGE_SECONDS`.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+import uuid
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+
+from fastapi import Request, Response
+from pydantic_core import to_jsonable_python
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.constants.user_role import UserRole
+from src.db.dialect import dialect_insert
+from src.domains.category.models import Category
+from src.domains.category.schema import CategoryReadSchema
+from src.domains.common.models import ReferenceDataVersion
+from src.domains.genre.models import Genre
+from src.domains.genre.schema import GenreReadSchema
+from src.domains.role.models import Role
+from src.exceptions.http import NotModified
+from src.metrics.registry import registry
+from src.setting import settings
+
+VERSION_ROW_ID = 1
+
+# Statements of a reload: the counter, then genres, categories and roles
+LOAD_STATEMENTS = 4
+
+reference_data_reloads = registry.counter("reference_data_reloads_total", "Reloads of the reference data snapshot")
+reference_data_version = registry.gauge("reference_data_version", "Version of the loaded reference data snapshot")
+
+
+@dataclass(frozen=True)
+class ReferenceData:
+    version: int
+    genres: tuple[GenreReadSchema, ...]
+    categories: tuple[CategoryReadSchema, ...]
+    role_ids: Mapping[UserRole, uuid.UUID]
+    genres_by_id: Mapping[uuid.UUID, GenreReadSchema] = field(init=False)
+    categories_by_id: Mapping[uuid.UUID, CategoryReadSchema] = field(init=False)
+    etag: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        content = json.dumps(
+            to_jsonable_python([self.genres, self.categories, sorted(self.role_ids.items())]), sort_keys=True
+        )
+        # The content hash keeps ETags unique should the counter ever start over
+        digest = hashlib.sha256(content.encode()).hexdigest()[:16]
+
+        object.__setattr__(self, "genres_by_id", MappingProxyType({genre.id: genre for genre in self.genres}))
+        object.__setattr__(
+            self, "categories_by_id", MappingProxyType({category.id: category for category in self.categories})
+        )
+        object.__setattr__(self, "etag", f'"{self.version}-{digest}"')
+
+
+class ReferenceDataStore:
+    def __init__(self, check_seconds: float) -> None:
+        self.check_seconds = check_seconds
+        self._snapshot: ReferenceData | None = None
+        self._checked_at = 0.0
+        self._generation = 0
+        self._lock = asyncio.Lock()
+
+    def _fresh_snapshot(self) -> ReferenceData | None:
+        if time.monotonic() < self._checked_at + self.check_seconds:
+            return self._snapshot
+        return None
+
+    async def get(self, session: AsyncSession) -> ReferenceData:
+        """Return the current snapshot, checking the counter on `session` once `check_seconds` have passed."""
+
+        snapshot = self._fresh_snapshot()
+        if snapshot is not None:
+            return snapshot
+
+        # Another request is already checking the loaded snapshot: serve it meanwhile
+        if self._snapshot is not None and self._lock.locked():
+            return self._snapshot
+
+        async with self._lock:
+            snapshot = self._fresh_snapshot()
+            if snapshot is not None:
+                return snapshot
+            snapshot = self._snapshot
+
+            generation = self._generation
+            checked_at = time.monotonic()
+            snapshot = await self._load(session, snapshot)
+            # An expire() during the load means a write committed that the load may have missed
+            if generation == self._generation:
+                self._snapshot = snapshot
+                self._checked_at = checked_at
+            return snapshot
+
+    async def _load(self, session: AsyncSession, current: ReferenceData | None) -> ReferenceData:
+        # The counter is read first, so the data is at least as new as the version it is stored under
+        version = await session.scalar(
+            select(ReferenceDataVersion.version).where(ReferenceDataVersion.id == VERSION_ROW_ID)
+        )
+        version = version or 0
+        if current is not None and current.version == version:
+            return current
+
+        genres = (await session.scalars(select(Genre).order_by(Genre.create_at.asc()))).all()
+        categories = (await session.scalars(select(Category).order_by(Category.create_at.asc()))).all()
+        roles = (await session.execute(select(Role.name, Role.id))).all()
+
+        reference_data_reloads.inc()
+        reference_data_version.set(version)
+        return ReferenceData(
+            version=version,
+            genres=tuple(GenreReadSchema.model_validate(genre) for genre in genres),
+            categories=tuple(CategoryReadSchema.model_validate(category) for category in categories),
+            role_ids=MappingProxyType({UserRole(name): role_id for name, role_id in roles}),
+        )
+
+    async def bump(self, session: AsyncSession) -> None:
+        """Increment the version counter in the transaction of the write; commit, then call `expire()`."""
+
+        stmt = dialect_insert(session)(ReferenceDataVersion).values(id=VERSION_ROW_ID, version=1)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ReferenceDataVersion.id],
+            set_={"version": ReferenceDataVersion.version + 1},
+        )
+        await session.execute(stmt)
+
+    def expire(self) -> None:
+        """Make the next read of this worker reload, after a write to the tables has committed."""
+
+        self._generation += 1
+        self._snapshot = None
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def set_cache_headers(request: Request, response: Response, snapshot: ReferenceData) -> None:
+    """Add the snapshot's ETag and Cache-Control to `response`; raise NotModified if the client has it."""
+
+    headers = {
+        "ETag": snapshot.etag,
+        "Cache-Control": f"public, max-age={settings.reference_data_max_age_seconds}",
+    }
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match and _etag_matches(if_none_match, snapshot.etag):
+        raise NotModified(snapshot.etag, headers)
+
+    response.headers.update(headers)
+
+
+reference_data = ReferenceDataStore(settings.reference_data_check_seconds)
@@ -0,0 +1,229 @@
+"""Tag-invalidated cache of repository results.
+
+`@result_cache.cached(tags=...)` wraps a repository read that takes the session as its
+first argument and returns session-independent data. Results are stored as JSON and
+validated back into the function's return annotation. `tags` receives the remaining
+arguments by name and returns the entity tags the result depends on: `book:{id}` for
+one book, `book:*` for results that depend on any book.
+
+Write paths call `await result_cache.invalidate(...)` once their commit has succeeded.
+Invalidating `book:{id}` also invalidates `book:*`. With a replica, the writing client
+bypasses the cache during its read-your-writes window, and tags are invalidated once
+more after that window, since a cache miss served by a lagging replica in between may
+have stored the old data.
+
+With `stale_seconds`, an expired entry that was not invalidated is still served for that
+long while one background task recomputes it on a session of its own.
+"""
+
+import asyncio
+import contextvars
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import time
+from collections.abc import Awaitable, Callable, Coroutine, Iterable, Sequence
+from typing import Any, Concatenate, ParamSpec, TypeVar
+
+from pydantic import TypeAdapter
+from pydantic_core import to_jsonable_python
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+from src.cache.backends import TAG_VERSION_TTL_SECONDS, CacheBackend, CacheEntry, MemoryCacheBackend, RedisCacheBackend
+from src.db.routing import reading_primary
+from src.metrics.registry import registry
+from src.setting import settings
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+ANY_ID = "*"
+
+result_cache_hits = registry.counter("result_cache_hits_total", "Repository results served from the cache, by function")
+result_cache_stale_hits = registry.counter(
+    "result_cache_stale_hits_total", "Expired results served while being refreshed, by function"
+)
+result_cache_misses = registry.counter("result_cache_misses_total", "Repository results computed on a cache miss")
+result_cache_hit_ratio = registry.gauge("result_cache_hit_ratio", "Share of cache lookups that were hits, by function")
+result_cache_invalidations = registry.counter("result_cache_invalidations_total", "Invalidated tags, by entity")
+result_cache_errors = registry.counter("result_cache_errors_total", "Cache backend calls that failed, by operation")
+
+
+def entity_tag(entity: str, id: object = ANY_ID) -> str:
+    return f"{entity}:{id}"
+
+
+def _with_wildcards(tags: Iterable[str]) -> list[str]:
+    expanded: dict[str, None] = {}
+    for tag in tags:
+        expanded[tag] = None
+        expanded[entity_tag(tag.partition(":")[0])] = None
+    return list(expanded)
+
+
+class ResultCache:
+    def __init__(
+        self,
+        backend: CacheBackend,
+        enabled: bool,
+        ttl: float,
+        stale_seconds: float,
+        replica_lag_seconds: float,
+    ) -> None:
+        self.backend = backend
+        self.enabled = enabled
+        self.ttl = ttl
+        self.stale_seconds = stale_seconds
+        self.replica_lag_seconds = replica_lag_seconds
+        self._refreshing: set[str] = set()
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def _record_lookup(self, name: str, hit: bool) -> None:
+        (result_cache_hits if hit else result_cache_misses).inc(function=name)
+        hits = result_cache_hits.value(function=name)
+        result_cache_hit_ratio.set(hits / (hits + result_cache_misses.value(function=name)), function=name)
+
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> None:
+        # A fresh context, so background work is not attributed to the request that started it
+        task = asyncio.get_running_loop().create_task(coro, context=contextvars.Context())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _store(self, key: str, value: bytes, versions: tuple[int, ...], ttl: float) -> None:
+        entry = CacheEntry(value, versions, time.time() + ttl)
+        try:
+            await self.backend.store(key, entry, ttl + self.stale_seconds)
+        except Exception:
+            result_cache_errors.inc(operation="store")
+            logger.warning("Result cache store failed for %s", key, exc_info=True)
+
+    async def _refresh(
+        self,
+        key: str,
+        compute: Callable[[AsyncSession], Awaitable[bytes]],
+        bind: AsyncEngine | AsyncConnection | None,
+        tags: Sequence[str],
+        ttl: float,
+    ) -> None:
+        try:
+            versions = await self.backend.tag_versions(tags)
+            async with AsyncSession(bind, expire_on_commit=False) as session:
+                value = await compute(session)
+            await self._store(key, value, versions, ttl)
+        except Exception:
+            logger.warning("Result cache refresh failed for %s", key, exc_info=True)
+        finally:
+            self._refreshing.discard(key)
+
+    def cached(
+        self,
+        tags: Callable[..., Iterable[str]],
+        ttl: float | None = None,
+    ) -> Callable[
+        [Callable[Concatenate[AsyncSession, P], Awaitable[T]]], Callable[Concatenate[AsyncSession, P], Awaitable[T]]
+    ]:
+        """Cache results of the decorated read for `ttl` seconds, or until one of its `tags` is invalidated."""
+
+        entry_ttl = self.ttl if ttl is None else ttl
+        if entry_ttl + self.stale_seconds >= TAG_VERSION_TTL_SECONDS:
+            raise ValueError(f"Cache entries must expire within {TAG_VERSION_TTL_SECONDS} seconds")
+
+        def decorator(
+            func: Callable[Concatenate[AsyncSession, P], Awaitable[T]],
+        ) -> Callable[Concatenate[AsyncSession, P], Awaitable[T]]:
+            name = func.__qualname__
+            signature = inspect.signature(func, eval_str=True)
+            adapter: TypeAdapter[T] = TypeAdapter(signature.return_annotation)
+
+            @functools.wraps(func)
+            async def wrapper(session: AsyncSession, *args: P.args, **kwargs: P.kwargs) -> T:
+                if not self.enabled or (self.replica_lag_seconds and reading_primary.get()):
+                    return await func(session, *args, **kwargs)
+
+                bound = signature.bind(session, *args, **kwargs)
+                bound.apply_defaults()
+                arguments = dict(list(bound.arguments.items())[1:])
+                entry_tags = list(dict.fromkeys(tags(**arguments)))
+                normalised = json.dumps(to_jsonable_python(arguments), sort_keys=True)
+                key = f"{func.__module__}.{name}:{hashlib.sha256(normalised.encode()).hexdigest()}"
+
+                try:
+                    entry, versions = await self.backend.lookup(key, entry_tags)
+                except Exception:
+                    result_cache_errors.inc(operation="lookup")
+                    logger.warning("Result cache lookup failed for %s", key, exc_info=True)
+                    return await func(session, *args, **kwargs)
+
+                if entry is not None and entry.tag_versions == versions:
+                    expired = entry.fresh_until <= time.time()
+                    if not expired or self.stale_seconds:
+                        self._record_lookup(name, hit=True)
+                        if expired:
+                            result_cache_stale_hits.inc(function=name)
+                        if expired and key not in self._refreshing:
+                            self._refreshing.add(key)
+
+                            async def compute(refresh_session: AsyncSession) -> bytes:
+                                return adapter.dump_json(await func(refresh_session, *args, **kwargs))
+
+                            self._spawn(self._refresh(key, compute, session.bind, entry_tags, entry_ttl))
+                        return adapter.validate_json(entry.value)
+
+                self._record_lookup(name, hit=False)
+                result = await func(session, *args, **kwargs)
+                # Versions were read before the statements ran, so an invalidation in between discards this entry
+                await self._store(key, adapter.dump_json(result), versions, entry_ttl)
+                return result
+
+            return wrapper
+
+        return decorator
+
+    async def _invalidate(self, tags: Sequence[str]) -> None:
+        try:
+            await self.backend.invalidate(tags)
+        except Exception:
+            result_cache_errors.inc(operation="invalidate")
+            logger.error("Result cache invalidation failed for %s", tags, exc_info=True)
+
+    async def invalidate(self, *tags: str) -> None:
+        """Invalidate every entry carrying one of `tags`; call after the write has committed."""
+
+        if not self.enabled or not tags:
+            return
+
+        expanded = _with_wildcards(tags)
+        for tag in expanded:
+            result_cache_invalidations.inc(entity=tag.partition(":")[0])
+        await self._invalidate(expanded)
+
+        if self.replica_lag_seconds:
+            asyncio.get_running_loop().call_later(
+                self.replica_lag_seconds, lambda: self._spawn(self._invalidate(expanded))
+            )
+
+    async def clear(self) -> None:
+        await self.backend.clear()
+
+
+def create_backend() -> CacheBackend:
+    if settings.result_cache_redis_url:
+        # From the optional `redis` extra, only needed for a shared cache
+        from redis.asyncio import Redis
+
+        return RedisCacheBackend(Redis.from_url(settings.result_cache_redis_url), settings.result_cache_key_prefix)
+
+    return MemoryCacheBackend(settings.result_cache_max_size)
+
+
+result_cache = ResultCache(
+    create_backend(),
+    enabled=settings.result_cache_enabled,
+    ttl=settings.result_cache_ttl_seconds,
+    stale_seconds=settings.result_cache_stale_seconds,
+    replica_lag_seconds=settings.read_your_writes_seconds if settings.db_replica_dsn else 0,
+)
@@ -0,0 +1,45 @@
+"""Bulk-import a CSV or NDJSON catalogue feed from a file or stdin.
+
+Usage: python -m src.cli.import_books feed.csv [--format csv] [--batch-size 2000]
+"""
+
+import argparse
+import asyncio
+import sys
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import BinaryIO
+
+import src.main  # noqa: F401  imports every domain so all mappers are configured
+from src.db.db import async_session_maker
+from src.domains.book.constants import IMPORT_BATCH_SIZE, BookImportFormat
+from src.domains.book.importer import import_books
+
+READ_CHUNK_SIZE = 1 << 20
+
+
+async def read_chunks(file: BinaryIO) -> AsyncIterator[bytes]:
+    while chunk := await asyncio.to_thread(file.read, READ_CHUNK_SIZE):
+        yield chunk
+
+
+async def main(path: str, format: BookImportFormat, batch_size: int) -> None:
+    with sys.stdin.buffer if path == "-" else open(path, "rb") as file:
+        async with async_session_maker() as session:
+            report = await import_books(session, read_chunks(file), format, batch_size)
+
+    print(report.model_dump_json(indent=2))
+
+
+if __name__ == "__main__":
+    formats = [import_format.value for import_format in BookImportFormat]
+    parser = argparse.ArgumentParser()
+    parser.add_argument("path", help="feed file, or - for stdin")
+    parser.add_argument("--format", choices=formats, help="defaults to the file extension")
+    parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    format = args.format or Path(args.path).suffix.lstrip(".") or BookImportFormat.ndjson
+    if format not in formats:
+        parser.error(f"unsupported file extension .{format}, pass --format ({', '.join(formats)})")
+    asyncio.run(main(args.path, BookImportFormat(format), args.batch_size))
@@ -0,0 +1 @@
+MAX_BATCH_SIZE = 500
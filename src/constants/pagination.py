@@ -1,2 +1,4 @@
 DEFAULT_PAGINATION_LIMIT = 50
 DEFAULT_PAGINATION_OFFSET = 0
+MAX_PAGINATION_LIMIT = 200
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
@@ -1,13 +1,119 @@
 from collections.abc import AsyncGenerator
+from typing import Any
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
+from src.db.pgbouncer import pgbouncer_connect_args, set_local_on_begin
+from src.db.pool import InstrumentedAsyncAdaptedQueuePool, connection_route
+from src.db.query_stats import instrument_query_stats, query_stats
+from src.db.request_queries import track_request_queries
+from src.db.routing import SAFE_METHODS, reading_primary, reads_own_writes
 from src.setting import settings
 
-engine = create_async_engine(settings.db_dsn, echo=True)
+
+def create_engine(dsn: str, name: str, **server_settings: str) -> AsyncEngine:
+    server_settings = {**settings.db_server_settings, **server_settings}
+    local_settings: dict[str, str] = {}
+    connect_args: dict[str, Any] = {"server_settings": server_settings}
+    if settings.db_pgbouncer:
+        connect_args, local_settings = pgbouncer_connect_args(server_settings)
+
+    engine = create_async_engine(
+        dsn,
+        echo=settings.db_echo,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        pool_logging_name=name,
+        connect_args=connect_args,
+    )
+    set_local_on_begin(engine, local_settings)
+    instrument_query_stats(
+        engine,
+        query_stats,
+        slow_threshold_seconds=settings.slow_query_threshold_ms / 1000,
+        sample_rate=settings.query_stats_sample_rate,
+    )
+    track_request_queries(engine)
+    return engine
+
+
+engine = create_engine(settings.db_dsn, "primary")
 async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
 
+# Without a configured replica, reads share the primary engine and its pool
+read_engine = (
+    create_engine(settings.db_replica_dsn, "replica", default_transaction_read_only="on")
+    if settings.db_replica_dsn
+    else engine
+)
+
+# Read sessions run `BEGIN READ ONLY`; the options only apply to connections of these makers
+async_read_session_maker = async_sessionmaker(
+    read_engine.execution_options(postgresql_readonly=True), expire_on_commit=False
+)
+async_primary_read_session_maker = async_sessionmaker(
+    engine.execution_options(postgresql_readonly=True), expire_on_commit=False
+)
+
+# A deferrable snapshot waits until it cannot cause serialization failures, then reads without
+# predicate locking overhead, which suits long exports; replicas do not support it
+async_snapshot_session_maker = async_sessionmaker(
+    engine.execution_options(
+        isolation_level="SERIALIZABLE",
+        postgresql_readonly=True,
+        postgresql_deferrable=settings.db_export_deferrable,
+    ),
+    expire_on_commit=False,
+)
+
+
+def bind_connection_route(request: Request) -> None:
+    """Label connections checked out while handling `request` with its route in pool metrics."""
+
+    route = request.scope.get("route")
+    connection_route.set(f"{request.method} {route.path if route else request.url.path}")
+
+
+async def get_async_session(request: Request) -> AsyncGenerator[AsyncSession | None]:
+    # Sessions check out a connection on their first statement, not here
+    bind_connection_route(request)
+    # The auth guards share this dependency; on GET routes their user lookup is read-only too
+    maker = async_primary_read_session_maker if request.method in SAFE_METHODS else async_session_maker
+    async with maker() as session:
+        yield session
+
+
+def get_read_session_maker(request: Request) -> async_sessionmaker[AsyncSession]:
+    if reads_own_writes(request, settings.read_your_writes_seconds):
+        reading_primary.set(True)
+        return async_primary_read_session_maker
+    return async_read_session_maker
+
+
+async def get_read_session(request: Request) -> AsyncGenerator[AsyncSession]:
+    """Read-only session on the replica, or on the primary right after the client wrote."""
+
+    bind_connection_route(request)
+    async with get_read_session_maker(request)() as session:
+        yield session
+
+
+async def get_primary_read_session(request: Request) -> AsyncGenerator[AsyncSession]:
+    """Read-only session on the primary, for reads that must see the client's own writes."""
+
+    bind_connection_route(request)
+    async with async_primary_read_session_maker() as session:
+        yield session
+
+
+async def get_snapshot_session(request: Request) -> AsyncGenerator[AsyncSession]:
+    """Read-only serializable session on the primary for consistent long-running reads."""
 
-async def get_async_session() -> AsyncGenerator[AsyncSession | None]:
-    async with async_session_maker() as session:
+    bind_connection_route(request)
+    async with async_snapshot_session_maker() as session:
         yield session
@@ -0,0 +1,14 @@
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def dialect_insert(session: AsyncSession) -> Callable[..., Any]:
+    """Return the `insert` construct with ON CONFLICT support for the session's backend."""
+
+    if session.get_bind().dialect.name == "sqlite":
+        return sqlite_insert
+    return pg_insert
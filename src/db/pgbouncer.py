@@ -0,0 +1,64 @@
+"""Compatibility with PgBouncer in transaction pooling mode.
+
+Consecutive transactions of one client connection may run on different server
+connections, so nothing may outlive a transaction:
+
+- asyncpg's and SQLAlchemy's prepared statement caches are disabled, and statements
+  that still get prepared are named uniquely so clients never collide on a server
+  connection;
+- per-connection server settings are applied with `set_config(..., is_local => true)`
+  (the function form of `SET LOCAL`) at the start of every transaction, only
+  `application_name`, which PgBouncer tracks itself, is sent on connect.
+"""
+
+import uuid
+from typing import Any
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+STARTUP_PARAMETERS = frozenset({"application_name"})
+
+# Session defaults that have a per-transaction counterpart
+LOCAL_PARAMETERS = {"default_transaction_read_only": "transaction_read_only"}
+
+
+def _prepared_statement_name() -> str:
+    return f"__asyncpg_{uuid.uuid4()}__"
+
+
+def pgbouncer_connect_args(server_settings: dict[str, str]) -> tuple[dict[str, Any], dict[str, str]]:
+    """Split engine `connect_args` and the settings to apply per transaction."""
+
+    connect_args = {
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+        "prepared_statement_name_func": _prepared_statement_name,
+        "server_settings": {name: value for name, value in server_settings.items() if name in STARTUP_PARAMETERS},
+    }
+    local_settings = {
+        LOCAL_PARAMETERS.get(name, name): value
+        for name, value in server_settings.items()
+        if name not in STARTUP_PARAMETERS
+    }
+    return connect_args, local_settings
+
+
+def set_local_on_begin(engine: AsyncEngine, local_settings: dict[str, str]) -> None:
+    """Apply `local_settings` at the start of every transaction on `engine`, in one round trip."""
+
+    if not local_settings:
+        return
+
+    names = list(local_settings)
+    stmt = text(
+        "SELECT " + ", ".join(f"set_config(:name_{i}, :value_{i}, true)" for i in range(len(names)))
+    ).bindparams(
+        **{f"name_{i}": name for i, name in enumerate(names)},
+        **{f"value_{i}": local_settings[name] for i, name in enumerate(names)},
+    )
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def apply_local_settings(connection: Connection) -> None:
+        connection.execute(stmt)
@@ -0,0 +1,75 @@
+"""Connection pool that reports its occupancy, checkout latency and hold time to the metrics registry.
+
+All metrics are labelled with the pool's `pool_logging_name`, so several engines in one
+worker can be told apart. Hold time is also labelled with `connection_route`, which the
+session dependencies set to the route being served.
+"""
+
+import time
+from contextvars import ContextVar
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, PoolProxiedConnection
+
+from src.metrics.registry import registry
+
+CHECKOUT_WAIT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+db_pool_size = registry.gauge("db_pool_size", "Configured number of persistent connections")
+db_pool_checked_out = registry.gauge("db_pool_checked_out", "Connections currently checked out of the pool")
+db_pool_checked_in = registry.gauge("db_pool_checked_in", "Idle connections waiting in the pool")
+db_pool_overflow = registry.gauge("db_pool_overflow", "Connections open beyond the pool size")
+db_pool_checkout_wait_seconds = registry.histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time to obtain a connection from the pool, including pre-ping",
+    CHECKOUT_WAIT_BUCKETS,
+)
+db_pool_checkout_timeouts = registry.counter(
+    "db_pool_checkout_timeouts_total", "Checkouts that gave up after the pool timeout"
+)
+db_connection_hold_seconds = registry.histogram(
+    "db_connection_hold_seconds",
+    "Time a connection stayed checked out, by route",
+    CHECKOUT_WAIT_BUCKETS,
+)
+
+connection_route: ContextVar[str] = ContextVar("connection_route", default="-")
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    @property
+    def metric_name(self) -> str:
+        return self.logging_name or "default"
+
+    def connect(self) -> PoolProxiedConnection:
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+            connection.info["checked_out_at"] = time.perf_counter()
+            connection.info["route"] = connection_route.get()
+            return connection
+        except exc.TimeoutError:
+            db_pool_checkout_timeouts.inc(pool=self.metric_name)
+            raise
+        finally:
+            db_pool_checkout_wait_seconds.observe(time.perf_counter() - started, pool=self.metric_name)
+            self.report_usage()
+
+    def _do_return_conn(self, record: ConnectionPoolEntry) -> None:
+        checked_out_at = record.info.pop("checked_out_at", None)
+        if checked_out_at is not None:
+            db_connection_hold_seconds.observe(
+                time.perf_counter() - checked_out_at,
+                pool=self.metric_name,
+                route=record.info.pop("route", "-"),
+            )
+        super()._do_return_conn(record)
+        self.report_usage()
+
+    def report_usage(self) -> None:
+        labels = {"pool": self.metric_name}
+        db_pool_size.set(self.size(), **labels)
+        db_pool_checked_out.set(self.checkedout(), **labels)
+        db_pool_checked_in.set(self.checkedin(), **labels)
+        # `overflow()` counts up from `-pool_size`; only connections past the pool size matter here
+        db_pool_overflow.set(max(self.overflow(), 0), **labels)
@@ -0,0 +1,139 @@
+"""Per-statement timing, fingerprinting and the slow query log.
+
+`instrument_query_stats` hooks an engine's cursor events. Every statement is timed;
+statements slower than the threshold are logged with the route that issued them, and a
+sample of all statements is aggregated by fingerprint - the SQL with literals and bound
+parameters replaced by `?` - into `query_stats`, which admins read through
+`GET /metrics/queries`.
+"""
+
+import functools
+import logging
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.db.pool import connection_route
+from src.metrics.constants import QueryStatsOrder
+from src.setting import settings
+
+logger = logging.getLogger(__name__)
+
+# Fingerprints beyond this many are aggregated together, so ad hoc SQL cannot grow memory
+OTHER_FINGERPRINT = "<other>"
+SLOW_QUERY_LOG_MAX_LENGTH = 2000
+
+_COMMENTS = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_STRINGS = re.compile(r"'(?:[^']|'')*'")
+# asyncpg `$1`, pyformat `%(name)s`, named `:name` (but not `::type` casts) and qmark `?`
+_PARAMETERS = re.compile(r"\$\d+|%\(\w+\)s|(?<![:\w]):\w+|\?")
+_NUMBERS = re.compile(r"\b\d+(?:\.\d+)?\b")
+# `IN (?, ?, ?)` and single VALUES rows, then runs of VALUES rows
+_PARAMETER_LISTS = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_ROW_LISTS = re.compile(r"\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@functools.lru_cache(maxsize=4096)
+def fingerprint(statement: str) -> str:
+    """Normalise `statement` so executions that differ only in values share one fingerprint."""
+
+    statement = _COMMENTS.sub(" ", statement)
+    statement = _STRINGS.sub("?", statement)
+    statement = _PARAMETERS.sub("?", statement)
+    statement = _NUMBERS.sub("?", statement)
+    statement = _PARAMETER_LISTS.sub("(...)", statement)
+    statement = _ROW_LISTS.sub("(...)", statement)
+    return _WHITESPACE.sub(" ", statement).strip()
+
+
+@dataclass
+class QueryStat:
+    fingerprint: str
+    calls: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    rows: int = 0
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.calls if self.calls else 0.0
+
+
+ORDER_KEYS = {
+    QueryStatsOrder.total_time: lambda stat: stat.total_seconds,
+    QueryStatsOrder.mean_time: lambda stat: stat.mean_seconds,
+    QueryStatsOrder.max_time: lambda stat: stat.max_seconds,
+    QueryStatsOrder.calls: lambda stat: stat.calls,
+    QueryStatsOrder.rows: lambda stat: stat.rows,
+}
+
+
+class QueryStats:
+    """In-process aggregates per statement fingerprint."""
+
+    def __init__(self, max_fingerprints: int) -> None:
+        self.max_fingerprints = max_fingerprints
+        self._stats: dict[str, QueryStat] = {}
+        self._lock = threading.Lock()
+
+    def record(self, statement: str, elapsed: float, rows: int) -> None:
+        key = fingerprint(statement)
+        with self._lock:
+            stat = self._stats.get(key)
+            if stat is None:
+                if len(self._stats) >= self.max_fingerprints:
+                    key = OTHER_FINGERPRINT
+                stat = self._stats.setdefault(key, QueryStat(key))
+            stat.calls += 1
+            stat.total_seconds += elapsed
+            stat.max_seconds = max(stat.max_seconds, elapsed)
+            stat.rows += rows
+
+    def top(self, limit: int, order_by: QueryStatsOrder = QueryStatsOrder.total_time) -> list[QueryStat]:
+        with self._lock:
+            stats = list(self._stats.values())
+        return sorted(stats, key=ORDER_KEYS[order_by], reverse=True)[:limit]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+query_stats = QueryStats(settings.query_stats_max_fingerprints)
+
+
+def instrument_query_stats(
+    engine: AsyncEngine,
+    stats: QueryStats,
+    slow_threshold_seconds: float,
+    sample_rate: float,
+) -> None:
+    """Time every statement on `engine`, log the slow ones and aggregate a sample into `stats`."""
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def start_timer(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        context.query_started_at = time.perf_counter()
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def record(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        elapsed = time.perf_counter() - context.query_started_at
+        rows = max(cursor.rowcount, 0)
+
+        if elapsed >= slow_threshold_seconds:
+            logger.warning(
+                "Slow query: %.1f ms, %d rows, route %s: %s",
+                elapsed * 1000,
+                rows,
+                connection_route.get(),
+                statement[:SLOW_QUERY_LOG_MAX_LENGTH],
+            )
+
+        if sample_rate >= 1 or random.random() < sample_rate:
+            stats.record(statement, elapsed, rows)
@@ -0,0 +1,132 @@
+"""Per-request statement counting, N+1 detection and query budgets.
+
+`QueryCountMiddleware` starts a `RequestQueries` tracker for every HTTP request, and the
+engine hook installed by `track_request_queries` records each statement's fingerprint in
+it. Responses carry `X-Query-Count`; when one fingerprint repeats `N_PLUS_ONE_THRESHOLD`
+times or more, an `X-Query-Repeats` header is added and the statement is logged.
+
+Handlers declare their budget with `@query_budget(n)`. Exceeding it is logged, or, with
+`QUERY_BUDGET_ENFORCE` (set by the test suite), fails the request with
+`QueryBudgetExceeded`.
+"""
+
+import functools
+import inspect
+import logging
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from typing import Any, ParamSpec, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.db.query_stats import fingerprint
+from src.exceptions.db import QueryBudgetExceeded
+from src.setting import settings
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+QUERY_COUNT_HEADER = "X-Query-Count"
+QUERY_REPEATS_HEADER = "X-Query-Repeats"
+
+
+class RequestQueries:
+    """Fingerprints of the statements issued while serving one request."""
+
+    def __init__(self) -> None:
+        self.fingerprints: Counter[str] = Counter()
+
+    @property
+    def count(self) -> int:
+        return self.fingerprints.total()
+
+    def most_repeated(self) -> tuple[str, int] | None:
+        top = self.fingerprints.most_common(1)
+        return top[0] if top else None
+
+
+current_request_queries: ContextVar[RequestQueries | None] = ContextVar("current_request_queries", default=None)
+
+
+def track_request_queries(engine: AsyncEngine) -> None:
+    """Record statements executed on `engine` in the tracker of the request that issued them."""
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def record(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        queries = current_request_queries.get()
+        if queries is not None:
+            queries.fingerprints[fingerprint(statement)] += 1
+
+
+def query_budget(max_queries: int) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
+    """Declare how many statements a handler may issue per request, dependencies included."""
+
+    def decorator(handler: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+        @functools.wraps(handler)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            result = await handler(*args, **kwargs)
+
+            queries = current_request_queries.get()
+            if queries is not None and queries.count > max_queries:
+                if settings.query_budget_enforce:
+                    raise QueryBudgetExceeded(handler.__name__, max_queries, queries.count)
+                logger.warning(
+                    "Query budget exceeded by %s: %d statements, budget %d",
+                    handler.__name__,
+                    queries.count,
+                    max_queries,
+                )
+
+            return result
+
+        # FastAPI resolves string annotations in the wrapper's module, so hand it resolved ones
+        wrapper.__signature__ = inspect.signature(handler, eval_str=True)  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
+class QueryCountMiddleware:
+    def __init__(self, app: ASGIApp, n_plus_one_threshold: int) -> None:
+        self.app = app
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        queries = RequestQueries()
+        token = current_request_queries.set(queries)
+
+        async def send_with_counts(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append(QUERY_COUNT_HEADER, str(queries.count))
+                repeated = queries.most_repeated()
+                if repeated and repeated[1] >= self.n_plus_one_threshold:
+                    headers.append(QUERY_REPEATS_HEADER, str(repeated[1]))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_counts)
+        finally:
+            current_request_queries.reset(token)
+
+        repeated = queries.most_repeated()
+        if repeated and repeated[1] >= self.n_plus_one_threshold:
+            route = scope.get("route")
+            logger.warning(
+                "Possible N+1 in %s %s: %d of %d statements are %s",
+                scope["method"],
+                route.path if route else scope["path"],
+                repeated[1],
+                queries.count,
+                repeated[0],
+            )
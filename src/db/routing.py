@@ -0,0 +1,67 @@
+"""Read-your-writes window for replica routing.
+
+After a successful write the client gets a `read_primary_until` cookie and an
+`X-Read-Primary-Until` header holding a unix timestamp. Until then `get_read_session`
+serves that client from the primary, so it sees its own changes before the replica
+catches up. Clients that do not keep cookies can send the header back instead.
+"""
+
+import math
+import time
+from contextvars import ContextVar
+
+from fastapi import Request
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+READ_PRIMARY_COOKIE = "read_primary_until"
+READ_PRIMARY_HEADER = "X-Read-Primary-Until"
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Set while a read is routed to the primary because the client wrote recently
+reading_primary: ContextVar[bool] = ContextVar("reading_primary", default=False)
+
+
+def reads_own_writes(request: Request, window_seconds: float) -> bool:
+    """Whether the request falls inside the read-your-writes window of an earlier write."""
+
+    value = request.headers.get(READ_PRIMARY_HEADER) or request.cookies.get(READ_PRIMARY_COOKIE)
+    if not value:
+        return False
+
+    try:
+        until = float(value)
+    except ValueError:
+        return False
+
+    now = time.time()
+    # Timestamps further ahead than one window were not issued by us
+    return now < until <= now + window_seconds
+
+
+class ReadYourWritesMiddleware:
+    """Marks clients that made a successful write so their next reads go to the primary."""
+
+    def __init__(self, app: ASGIApp, window_seconds: float) -> None:
+        self.app = app
+        self.window_seconds = window_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS or self.window_seconds <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_window(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                until = f"{time.time() + self.window_seconds:.3f}"
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "set-cookie",
+                    f"{READ_PRIMARY_COOKIE}={until}; Max-Age={math.ceil(self.window_seconds)}; "
+                    "Path=/; HttpOnly; SameSite=lax",
+                )
+                headers.append(READ_PRIMARY_HEADER, until)
+            await send(message)
+
+        await self.app(scope, receive, send_with_window)
@@ -0,0 +1,92 @@
+"""Coalescing of concurrent identical reads within a worker.
+
+`@single_flight` wraps a repository read that takes the session as its first argument.
+While a call is in flight, identical calls - same function, same arguments once
+normalised, same engine - await its result instead of issuing their own statements.
+Only calls that overlap are coalesced; nothing is kept once the call returns, so results
+are never staler than the read already running when a caller arrived.
+
+Coalesced callers share one result object, so wrapped functions must return values that
+do not depend on the session (schemas or plain data, not ORM instances) and callers must
+not mutate them. Coalesced calls are counted in `single_flight_coalesced_total`.
+"""
+
+import asyncio
+import functools
+import inspect
+import json
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, Concatenate, ParamSpec, TypeVar
+
+from pydantic_core import to_jsonable_python
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.metrics.registry import registry
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+single_flight_calls = registry.counter(
+    "single_flight_calls_total", "Coalescable reads that ran their statements, by function"
+)
+single_flight_coalesced = registry.counter(
+    "single_flight_coalesced_total", "Reads that awaited an identical call already in flight, by function"
+)
+
+
+def _mark_retrieved(future: asyncio.Future[Any]) -> None:
+    # Without followers nobody reads the exception, which asyncio would log as never retrieved
+    if not future.cancelled():
+        future.exception()
+
+
+def single_flight(
+    func: Callable[Concatenate[AsyncSession, P], Awaitable[T]],
+) -> Callable[Concatenate[AsyncSession, P], Awaitable[T]]:
+    """Let concurrent identical calls of `func` share one execution."""
+
+    name = func.__qualname__
+    signature = inspect.signature(func)
+    in_flight: dict[Hashable, asyncio.Future[T]] = {}
+
+    def make_key(session: AsyncSession, *args: Any, **kwargs: Any) -> Hashable:
+        bound = signature.bind(session, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = dict(list(bound.arguments.items())[1:])
+        # Keyed by engine as well, so replica reads never answer reads routed to the primary
+        return session.bind, json.dumps(to_jsonable_python(arguments), sort_keys=True)
+
+    @functools.wraps(func)
+    async def wrapper(session: AsyncSession, *args: P.args, **kwargs: P.kwargs) -> T:
+        key = make_key(session, *args, **kwargs)
+
+        leader = in_flight.get(key)
+        if leader is not None:
+            single_flight_coalesced.inc(function=name)
+            try:
+                return await asyncio.shield(leader)
+            except asyncio.CancelledError:
+                # The leader's request was cancelled, not this one: run the read here instead
+                if not leader.cancelled():
+                    raise
+
+        single_flight_calls.inc(function=name)
+        future: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+        future.add_done_callback(_mark_retrieved)
+        in_flight[key] = future
+        try:
+            result = await func(session, *args, **kwargs)
+        except Exception as err:
+            future.set_exception(err)
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if in_flight.get(key) is future:
+                del in_flight[key]
+
+    return wrapper
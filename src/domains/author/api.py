@@ -2,14 +2,14 @@ import uuid
 from typing import Annotated, cast
 
 from fastapi import APIRouter, Depends, Path, Query, status
-from sqlalchemy import CursorResult, delete, select, update
+from sqlalchemy import CursorResult, delete, insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from src.db.db import get_async_session
-from src.domains.author.constants import ORDER_COLUMN_MAP
+from src.cache.result_cache import entity_tag, result_cache
+from src.db.db import get_async_session, get_read_session
+from src.db.request_queries import query_budget
 from src.domains.author.models import Author
-from src.domains.author.repository import get_author_orm_by_id
+from src.domains.author.repository import get_author_by_id, get_author_orm_by_id, get_authors_list
 from src.domains.author.schema import (
     AuthorCreateSchema,
     AuthorFiltersSchema,
@@ -18,9 +18,8 @@ from src.domains.author.schema import (
     AuthorReadSchema,
 )
 from src.domains.common.association.author_genre import AuthorGenre
-from src.domains.genre.models import Genre
+from src.domains.common.association.sync import sync_association
 from src.exceptions.entity import EntityNotFound
-from src.utils.request_builder import apply_ordering
 
 router = APIRouter()
 
@@ -29,31 +28,14 @@ router = APIRouter()
     "/",
     summary="Получить список авторов",
 )
+@query_budget(2)
 async def get_all(
-    session: Annotated[AsyncSession, Depends(get_async_session)],
+    session: Annotated[AsyncSession, Depends(get_read_session)],
     filters: Annotated[AuthorFiltersSchema, Depends()],
     order: Annotated[AuthorOrderSchema, Depends()],
     with_genre: Annotated[bool, Query(..., description="Загружать ли жанры")] = False,
 ) -> list[AuthorReadSchema]:
-    stmt = select(Author).limit(filters.limit).offset(filters.offset)
-    stmt = apply_ordering(stmt, order, ORDER_COLUMN_MAP)
-
-    if filters.first_name:
-        stmt = stmt.where(Author.first_name.ilike(f"%{filters.first_name}%"))
-
-    if filters.last_name:
-        stmt = stmt.where(Author.last_name.ilike(f"%{filters.last_name}%"))
-
-    if filters.genre_id:
-        stmt = stmt.join(Author.genres).where(Genre.id == filters.genre_id)
-
-    if with_genre:
-        stmt = stmt.options(selectinload(Author.genres))
-
-    result = await session.execute(stmt)
-    authors = result.scalars().unique().all()
-
-    return [AuthorReadSchema.from_orm_with_genres(author, with_genre) for author in authors]
+    return await get_authors_list(session, filters, order, with_genre)
 
 
 @router.get(
@@ -62,11 +44,10 @@ async def get_all(
 )
 async def get_by_id(
     author_id: Annotated[uuid.UUID, Path(..., description="ID автора")],
-    session: Annotated[AsyncSession, Depends(get_async_session)],
+    session: Annotated[AsyncSession, Depends(get_read_session)],
     with_genre: Annotated[bool, Query(..., description="Загружать ли жанры")] = False,
 ) -> AuthorReadSchema:
-    author = await get_author_orm_by_id(session, author_id, with_genre)
-    return AuthorReadSchema.from_orm_with_genres(author, with_genre)
+    return await get_author_by_id(session, author_id, with_genre)
 
 
 @router.post(
@@ -78,18 +59,21 @@ async def create_author(
     author_data: AuthorCreateSchema,
     session: Annotated[AsyncSession, Depends(get_async_session)],
 ) -> AuthorReadSchema:
-    author = Author(**author_data.model_dump(exclude={"genres"}))
-    session.add(author)
-    await session.flush()
+    stmt = insert(Author).values(**author_data.model_dump(exclude={"genres"})).returning(Author.id)
+    author_id = (await session.execute(stmt)).scalar_one()
 
-    for genre_id in author_data.genres:
-        author_genre = AuthorGenre(author_id=author.id, genre_id=genre_id)
-        session.add(author_genre)
+    genre_ids = list(dict.fromkeys(author_data.genres))
+    if genre_ids:
+        await session.execute(
+            insert(AuthorGenre),
+            [{"author_id": author_id, "genre_id": genre_id} for genre_id in genre_ids],
+        )
 
     await session.commit()
+    await result_cache.invalidate(entity_tag("author", author_id))
 
-    created_author = await get_author_orm_by_id(session, author.id, with_genre=True)
-    return AuthorReadSchema.from_orm_with_genres(created_author, with_genre=True)
+    # Everything the response holds was just written, so it is built without reading the author back
+    return AuthorReadSchema(id=author_id, **author_data.model_dump(exclude={"genres"}), genres=genre_ids)
 
 
 @router.patch(
@@ -113,14 +97,12 @@ async def patch_author(
 
     await session.flush()
 
+    # The author UPDATE above holds the row lock that serializes concurrent genre syncs
     if genres_ids is not None:
-        await session.execute(delete(AuthorGenre).where(AuthorGenre.author_id == author_id))
-
-        for genre_id in genres_ids:
-            author_genre = AuthorGenre(author_id=author_id, genre_id=genre_id)
-            session.add(author_genre)
+        await sync_association(session, AuthorGenre, AuthorGenre.author_id, author_id, AuthorGenre.genre_id, genres_ids)
 
     await session.commit()
+    await result_cache.invalidate(entity_tag("author", author_id))
 
     updated_author = await get_author_orm_by_id(session, author_id, with_genre=True)
     return AuthorReadSchema.from_orm_with_genres(updated_author, with_genre=True)
@@ -143,3 +125,4 @@ async def delete_author(
         raise EntityNotFound({"id": author_id}, entity_name="author")
 
     await session.commit()
+    await result_cache.invalidate(entity_tag("author", author_id))
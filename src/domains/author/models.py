@@ -6,7 +6,7 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.domains.common.association.author_book import AuthorBook
 from src.domains.common.association.author_genre import AuthorGenre
-from src.domains.common.models import Base, BaseModelMixin
+from src.domains.common.models import Base, BaseModelMixin, trigram_index
 
 if TYPE_CHECKING:
     from src.domains.book.models import Book
@@ -15,33 +15,38 @@ if TYPE_CHECKING:
 
 class Author(Base, BaseModelMixin):
     __tablename__ = "author"
+    __table_args__ = (
+        trigram_index("author", "first_name"),
+        trigram_index("author", "last_name"),
+    )
 
     first_name: Mapped[str] = mapped_column(String(64), nullable=False)
     last_name: Mapped[str] = mapped_column(String(64), nullable=False)
     birth_date: Mapped[date | None] = mapped_column(DateTime, nullable=True, default=None)
     author_genres: Mapped[list[AuthorGenre]] = relationship(
-        "AuthorGenre", back_populates="author", cascade="all, delete-orphan"
+        "AuthorGenre", back_populates="author", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql"
     )
     genres: Mapped[list[Genre]] = relationship(
         "Genre",
         secondary="author_genre",
         back_populates="authors",
         viewonly=True,
-        lazy="select",
+        lazy="raise_on_sql",
     )
 
     author_books: Mapped[list[AuthorBook]] = relationship(
         "AuthorBook",
         back_populates="author",
         cascade="all, delete-orphan",
+        passive_deletes=True,
         overlaps="authors,books",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
     books: Mapped[list[Book]] = relationship(
         "Book",
         secondary="author_book",
         back_populates="authors",
-        lazy="selectin",
+        lazy="raise_on_sql",
         overlaps="author,author_books,book",
     )
@@ -4,8 +4,14 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from src.cache.result_cache import entity_tag, result_cache
+from src.db.single_flight import single_flight
+from src.domains.author.constants import ORDER_COLUMN_MAP
 from src.domains.author.models import Author
+from src.domains.author.schema import AuthorFiltersSchema, AuthorOrderSchema, AuthorReadSchema
+from src.domains.genre.models import Genre
 from src.exceptions.entity import EntityNotFound
+from src.utils.request_builder import apply_ordering, ilike_contains
 
 
 async def get_author_orm_by_id(session: AsyncSession, author_id: uuid.UUID, with_genre: bool) -> Author:
@@ -19,3 +25,46 @@ async def get_author_orm_by_id(session: AsyncSession, author_id: uuid.UUID, with
         raise EntityNotFound({"id": author_id}, entity_name="author")
 
     return author
+
+
+@result_cache.cached(
+    tags=lambda author_id, with_genre: [entity_tag("author", author_id), *([entity_tag("genre")] if with_genre else [])]
+)
+@single_flight
+async def get_author_by_id(session: AsyncSession, author_id: uuid.UUID, with_genre: bool) -> AuthorReadSchema:
+    author = await get_author_orm_by_id(session, author_id, with_genre)
+    return AuthorReadSchema.from_orm_with_genres(author, with_genre)
+
+
+@result_cache.cached(
+    tags=lambda filters, order, with_genre: [
+        entity_tag("author"),
+        *([entity_tag("genre")] if with_genre or filters.genre_id else []),
+    ]
+)
+@single_flight
+async def get_authors_list(
+    session: AsyncSession,
+    filters: AuthorFiltersSchema,
+    order: AuthorOrderSchema,
+    with_genre: bool,
+) -> list[AuthorReadSchema]:
+    stmt = select(Author).limit(filters.limit).offset(filters.offset)
+    stmt = apply_ordering(stmt, order, ORDER_COLUMN_MAP)
+
+    if filters.first_name:
+        stmt = stmt.where(ilike_contains(Author.first_name, filters.first_name))
+
+    if filters.last_name:
+        stmt = stmt.where(ilike_contains(Author.last_name, filters.last_name))
+
+    if filters.genre_id:
+        stmt = stmt.join(Author.genres).where(Genre.id == filters.genre_id)
+
+    if with_genre:
+        stmt = stmt.options(selectinload(Author.genres))
+
+    result = await session.execute(stmt)
+    authors = result.scalars().unique().all()
+
+    return [AuthorReadSchema.from_orm_with_genres(author, with_genre) for author in authors]
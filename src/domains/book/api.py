@@ -1,25 +1,36 @@
 import uuid
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.db.db import get_async_session
+from src.auth.guards import get_current_active_admin
+from src.constants.pagination import NEXT_CURSOR_HEADER
+from src.db.db import get_async_session, get_read_session
+from src.db.request_queries import query_budget
+from src.domains.book.constants import IMPORT_BATCH_SIZE, BookImportFormat
+from src.domains.book.importer import import_books
 from src.domains.book.repository import (
     create_book,
     delete_book,
     get_book_by_id,
     get_book_information,
     get_books_list,
+    search_books,
     update_book,
 )
 from src.domains.book.schema import (
     BookCreateSchema,
     BookFilters,
+    BookImportReportSchema,
     BookInformationSchema,
+    BookListOrderSchema,
     BookReadSchema,
+    BookSearchResultSchema,
+    BookSearchSchema,
     BookUpdateSchema,
 )
+from src.domains.user.schema import UserReadSchema
 
 router = APIRouter()
 
@@ -35,20 +46,57 @@ async def create_book_handler(
     return await create_book(session, book)
 
 
+@router.post(
+    "/import",
+    summary="Массовый импорт книг из потока CSV или NDJSON",
+)
+async def import_books_handler(
+    request: Request,
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+    _: Annotated[UserReadSchema, Depends(get_current_active_admin)],
+    format: Annotated[BookImportFormat, Query(description="Формат тела запроса")] = BookImportFormat.ndjson,
+    batch_size: Annotated[int, Query(ge=1, le=10_000, description="Количество записей в пакете")] = IMPORT_BATCH_SIZE,
+) -> BookImportReportSchema:
+    return await import_books(session, request.stream(), format, batch_size)
+
+
+@router.get("/search")
+@query_budget(1)
+async def search_books_handler(
+    session: Annotated[AsyncSession, Depends(get_read_session)],
+    params: Annotated[BookSearchSchema, Depends()],
+    response: Response,
+) -> list[BookSearchResultSchema]:
+    books, next_cursor = await search_books(session, params)
+
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
+    return books
+
+
 @router.get("/{id}")
 async def get_book_handler(
-    session: Annotated[AsyncSession, Depends(get_async_session)],
+    session: Annotated[AsyncSession, Depends(get_read_session)],
     id: uuid.UUID,
 ) -> BookReadSchema:
     return await get_book_by_id(session, id)
 
 
 @router.get("/")
+@query_budget(1)
 async def books_list_handler(
-    session: Annotated[AsyncSession, Depends(get_async_session)],
+    session: Annotated[AsyncSession, Depends(get_read_session)],
     filters: Annotated[BookFilters, Depends()],
+    order: Annotated[BookListOrderSchema, Depends()],
+    response: Response,
 ) -> list[BookReadSchema]:
-    return await get_books_list(session, filters)
+    books, next_cursor = await get_books_list(session, filters, order)
+
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
+    return books
 
 
 @router.delete(
@@ -72,8 +120,9 @@ async def patch_book_handler(
 
 
 @router.get("/{id}/information")
+@query_budget(1)
 async def get_book_information_handler(
-    session: Annotated[AsyncSession, Depends(get_async_session)],
+    session: Annotated[AsyncSession, Depends(get_read_session)],
     id: uuid.UUID,
 ) -> BookInformationSchema:
     result = await get_book_information(session, id)
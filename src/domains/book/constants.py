@@ -18,3 +18,26 @@ ORDER_COLUMN_MAP: dict[BookOrderBy, InstrumentedAttribute] = {
     BookOrderBy.author_id: Book.author_books,
     BookOrderBy.create_at: Book.create_at,
 }
+
+
+class BookListOrderBy(StrEnum):
+    title_ = "title"
+    create_at = "create_at"
+
+
+LIST_ORDER_COLUMN_MAP: dict[BookListOrderBy, InstrumentedAttribute] = {
+    BookListOrderBy.title_: Book.title,
+    BookListOrderBy.create_at: Book.create_at,
+}
+
+LATEST_REVIEWS_LIMIT = 10
+
+
+class BookImportFormat(StrEnum):
+    csv = "csv"
+    ndjson = "ndjson"
+
+
+IMPORT_BATCH_SIZE = 2000
+IMPORT_MAX_REPORTED_ERRORS = 1000
+IMPORT_AUTHORS_SEPARATOR = ";"
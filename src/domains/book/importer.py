@@ -0,0 +1,354 @@
+"""Bulk catalogue import from streamed CSV or NDJSON feeds.
+
+Records are validated one by one and loaded in batches: genres, categories and authors
+are resolved with one query each (missing authors are created under a per-name advisory
+lock on Postgres, so concurrent imports do not duplicate them), books and author links
+are loaded into transaction-scoped staging tables - through `COPY` on Postgres - and merged with
+set-based `INSERT ... SELECT ... ON CONFLICT` statements. Every batch is committed on
+its own, so a bad batch does not discard the ones before it.
+"""
+
+import codecs
+import csv
+import hashlib
+import json
+import time
+import uuid
+from collections.abc import AsyncIterable, AsyncIterator, Collection, Sequence
+from typing import Any, cast
+
+from pydantic import ValidationError
+from sqlalchemy import Column, MetaData, String, Table, delete, func, insert, select, text, true, tuple_
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.cache.result_cache import entity_tag, result_cache
+from src.db.dialect import dialect_insert
+from src.domains.author.models import Author
+from src.domains.book.constants import IMPORT_BATCH_SIZE, IMPORT_MAX_REPORTED_ERRORS, BookImportFormat
+from src.domains.book.models import Book
+from src.domains.book.schema import BookImportErrorSchema, BookImportReportSchema, BookImportRowSchema
+from src.domains.category.models import Category
+from src.domains.common.association.author_book import AuthorBook
+from src.domains.genre.models import Genre
+
+ParsedRecord = tuple[int, dict[str, Any] | None, str | None]
+
+_staging_metadata = MetaData()
+
+book_import_stage = Table(
+    "book_import_stage",
+    _staging_metadata,
+    Column("id", PG_UUID(as_uuid=True), primary_key=True),
+    Column("title", String(255), nullable=False),
+    Column("description", String),
+    Column("genre_id", PG_UUID(as_uuid=True), nullable=False),
+    Column("category_id", PG_UUID(as_uuid=True)),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
+author_book_import_stage = Table(
+    "author_book_import_stage",
+    _staging_metadata,
+    Column("author_id", PG_UUID(as_uuid=True), primary_key=True),
+    Column("book_id", PG_UUID(as_uuid=True), primary_key=True),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
+
+async def iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[tuple[int, str]]:
+    """Split a byte stream into numbered UTF-8 lines, keeping line endings."""
+
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    line_no = 0
+
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            line_no += 1
+            yield line_no, line + "\n"
+
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield line_no + 1, buffer
+
+
+async def iter_csv_records(lines: AsyncIterable[tuple[int, str]]) -> AsyncIterator[ParsedRecord]:
+    """Yield `(line, record, error)` for CSV with a header row; quoted fields may span lines."""
+
+    header: list[str] | None = None
+    pending, start = "", 0
+
+    async for line_no, line in lines:
+        if not pending:
+            start = line_no
+        pending += line
+        # An odd number of quotes means a quoted field continues on the next line
+        if pending.count('"') % 2:
+            continue
+
+        record, pending = pending, ""
+        if not record.strip():
+            continue
+
+        values = next(csv.reader([record]))
+        if header is None:
+            header = [name.strip() for name in values]
+        elif len(values) != len(header):
+            yield start, None, f"Expected {len(header)} columns, got {len(values)}"
+        else:
+            yield start, dict(zip(header, values, strict=True)), None
+
+    if pending.strip():
+        yield start, None, "Unterminated quoted field"
+
+
+async def iter_ndjson_records(lines: AsyncIterable[tuple[int, str]]) -> AsyncIterator[ParsedRecord]:
+    """Yield `(line, record, error)` for newline-delimited JSON objects."""
+
+    async for line_no, line in lines:
+        if not line.strip():
+            continue
+
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as err:
+            yield line_no, None, f"Invalid JSON: {err.msg}"
+            continue
+
+        if isinstance(record, dict):
+            yield line_no, record, None
+        else:
+            yield line_no, None, "Expected a JSON object"
+
+
+def _validation_message(err: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(str(part) for part in e['loc'])}: {e['msg']}" for e in err.errors())
+
+
+async def _resolve_names(session: AsyncSession, model: type[Genre | Category], names: set[str]) -> dict[str, uuid.UUID]:
+    if not names:
+        return {}
+
+    result = await session.execute(select(model.name, model.id).where(model.name.in_(names)))
+    return {name: id for name, id in result.all()}
+
+
+def _author_lock_key(first_name: str, last_name: str) -> int:
+    digest = hashlib.blake2b(f"{first_name}\x1f{last_name}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, signed=True)
+
+
+async def _select_author_ids(
+    session: AsyncSession, keys: Collection[tuple[str, str]]
+) -> dict[tuple[str, str], uuid.UUID]:
+    result = await session.execute(
+        select(Author.first_name, Author.last_name, Author.id).where(
+            tuple_(Author.first_name, Author.last_name).in_(keys)
+        )
+    )
+    return {(first_name, last_name): id for first_name, last_name, id in result.all()}
+
+
+async def _resolve_authors(session: AsyncSession, keys: set[tuple[str, str]]) -> dict[tuple[str, str], uuid.UUID]:
+    """Map `(first_name, last_name)` to author ids, creating the authors that do not exist yet."""
+
+    if not keys:
+        return {}
+
+    author_ids = await _select_author_ids(session, keys)
+    missing_keys = keys - author_ids.keys()
+
+    if missing_keys and session.get_bind().dialect.name == "postgresql":
+        # Names are not unique, so concurrent imports serialize on a lock per missing name
+        # until their batch commits, and re-read the names another import created meanwhile.
+        # The keys are locked in sorted order, so two batches cannot deadlock on each other.
+        lock_keys = sorted({_author_lock_key(first_name, last_name) for first_name, last_name in missing_keys})
+        await session.execute(
+            text("SELECT pg_advisory_xact_lock(key) FROM unnest(CAST(:keys AS bigint[])) AS key"),
+            {"keys": lock_keys},
+        )
+        author_ids.update(await _select_author_ids(session, missing_keys))
+        missing_keys -= author_ids.keys()
+
+    missing = [
+        {"id": uuid.uuid7(), "first_name": first_name, "last_name": last_name} for first_name, last_name in missing_keys
+    ]
+    if missing:
+        await session.execute(insert(Author).values(create_at=func.now(), update_at=func.now()), missing)
+        author_ids.update({(row["first_name"], row["last_name"]): row["id"] for row in missing})
+
+    return author_ids
+
+
+async def _copy_rows(session: AsyncSession, table: Table, rows: Sequence[tuple[Any, ...]]) -> None:
+    if not rows:
+        return
+
+    if session.get_bind().dialect.name == "postgresql":
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        # Only None for a connection that was invalidated, which a checked-out one is not
+        assert driver_connection is not None
+        await driver_connection.copy_records_to_table(
+            table.name,
+            records=rows,
+            columns=list(table.columns.keys()),
+        )
+    else:
+        await session.execute(insert(table), [dict(zip(table.columns.keys(), row, strict=True)) for row in rows])
+
+
+async def _merge_staged(session: AsyncSession) -> None:
+    """Upsert staged books by id and replace their author links with the staged ones.
+
+    Rows are stamped with the transaction's `now()`, so a whole batch shares one timestamp.
+    """
+
+    books = cast(Table, Book.__table__)
+    author_books = cast(Table, AuthorBook.__table__)
+    insert_ = dialect_insert(session)
+
+    # `WHERE true` keeps SQLite from parsing ON CONFLICT as a join constraint
+    stmt = insert_(books).from_select(
+        [*book_import_stage.columns.keys(), "create_at", "update_at"],
+        select(book_import_stage, func.now(), func.now()).where(true()),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[books.c.id],
+        set_={
+            "title": stmt.excluded.title,
+            "description": stmt.excluded.description,
+            "genre_id": stmt.excluded.genre_id,
+            "category_id": stmt.excluded.category_id,
+            "update_at": stmt.excluded.update_at,
+        },
+    )
+    await session.execute(stmt)
+
+    await session.execute(
+        delete(author_books).where(
+            author_books.c.book_id.in_(select(book_import_stage.c.id)),
+            tuple_(author_books.c.author_id, author_books.c.book_id).not_in(
+                select(author_book_import_stage.c.author_id, author_book_import_stage.c.book_id)
+            ),
+        )
+    )
+
+    stmt = insert_(author_books).from_select(
+        [*author_book_import_stage.columns.keys(), "create_at", "update_at"],
+        select(author_book_import_stage, func.now(), func.now()).where(true()),
+    )
+    await session.execute(stmt.on_conflict_do_nothing())
+
+    await session.execute(delete(book_import_stage))
+    await session.execute(delete(author_book_import_stage))
+
+
+async def _import_batch(
+    session: AsyncSession,
+    rows: list[tuple[int, BookImportRowSchema]],
+) -> tuple[int, list[BookImportErrorSchema]]:
+    errors: list[BookImportErrorSchema] = []
+
+    connection = await session.connection()
+    await connection.run_sync(_staging_metadata.create_all, checkfirst=True)
+
+    genre_ids = await _resolve_names(session, Genre, {row.genre for _, row in rows})
+    category_ids = await _resolve_names(session, Category, {row.category for _, row in rows if row.category})
+    author_ids = await _resolve_authors(session, {author.key for _, row in rows for author in row.authors})
+
+    books: dict[uuid.UUID, tuple[Any, ...]] = {}
+    links: list[tuple[Any, ...]] = []
+
+    for line, row in rows:
+        genre_id = genre_ids.get(row.genre)
+        category_id = category_ids.get(row.category) if row.category else None
+        book_id = row.id or uuid.uuid7()
+
+        if genre_id is None:
+            errors.append(BookImportErrorSchema(line=line, message=f"Genre {row.genre!r} not found"))
+        elif row.category and category_id is None:
+            errors.append(BookImportErrorSchema(line=line, message=f"Category {row.category!r} not found"))
+        elif book_id in books:
+            errors.append(BookImportErrorSchema(line=line, message=f"Duplicate book id {book_id} in batch"))
+        else:
+            books[book_id] = (book_id, row.title, row.description, genre_id, category_id)
+            book_author_ids = dict.fromkeys(author_ids[author.key] for author in row.authors)
+            links.extend((author_id, book_id) for author_id in book_author_ids)
+
+    try:
+        await _copy_rows(session, book_import_stage, list(books.values()))
+        await _copy_rows(session, author_book_import_stage, links)
+        await _merge_staged(session)
+        await session.commit()
+        # Missing authors were created along with the books
+        await result_cache.invalidate(*(entity_tag("book", book_id) for book_id in books), entity_tag("author"))
+    except DBAPIError as err:
+        await session.rollback()
+        message = f"Batch rejected: {err.orig}"
+        accepted = {line for line, _ in rows} - {error.line for error in errors}
+        errors.extend(BookImportErrorSchema(line=line, message=message) for line in sorted(accepted))
+        return 0, errors
+
+    return len(books), errors
+
+
+async def import_books(
+    session: AsyncSession,
+    chunks: AsyncIterable[bytes],
+    format: BookImportFormat,
+    batch_size: int = IMPORT_BATCH_SIZE,
+) -> BookImportReportSchema:
+    started = time.perf_counter()
+    parse = iter_csv_records if format == BookImportFormat.csv else iter_ndjson_records
+
+    total = imported = failed = 0
+    errors: list[BookImportErrorSchema] = []
+    batch: list[tuple[int, BookImportRowSchema]] = []
+
+    def record_errors(batch_errors: list[BookImportErrorSchema]) -> None:
+        nonlocal failed
+        failed += len(batch_errors)
+        errors.extend(batch_errors[: IMPORT_MAX_REPORTED_ERRORS - len(errors)])
+
+    async def flush() -> None:
+        nonlocal imported
+        batch_imported, batch_errors = await _import_batch(session, batch)
+        imported += batch_imported
+        record_errors(batch_errors)
+        batch.clear()
+
+    async for line, record, error in parse(iter_lines(chunks)):
+        total += 1
+        if error is not None:
+            record_errors([BookImportErrorSchema(line=line, message=error)])
+            continue
+
+        try:
+            batch.append((line, BookImportRowSchema.model_validate(record)))
+        except ValidationError as err:
+            record_errors([BookImportErrorSchema(line=line, message=_validation_message(err))])
+            continue
+
+        if len(batch) >= batch_size:
+            await flush()
+
+    if batch:
+        await flush()
+
+    elapsed = time.perf_counter() - started
+    return BookImportReportSchema(
+        total_rows=total,
+        imported=imported,
+        failed=failed,
+        errors=errors,
+        elapsed_seconds=round(elapsed, 3),
+        rows_per_second=round(imported / elapsed, 1) if elapsed else 0.0,
+    )
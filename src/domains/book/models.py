@@ -1,12 +1,13 @@
 import uuid
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, Integer, String, Text, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.domains.category.models import Category
-from src.domains.common.models import Base, BaseModelMixin
+from src.domains.common.models import Base, BaseModelMixin, CreatedUpdatedColumnsMixin, trigram_index
 from src.domains.reading_status.models import ReadingStatus
 
 if TYPE_CHECKING:
@@ -20,38 +21,79 @@ if TYPE_CHECKING:
 
 class Book(Base, BaseModelMixin):
     __tablename__ = "book"
+    __table_args__ = (
+        trigram_index("book", "title"),
+        Index("ix_book_search_vector", "search_vector", postgresql_using="gin").ddl_if(dialect="postgresql"),
+        # Genre-filtered list in its default (create_at, id) keyset order
+        Index("ix_book_genre_id_create_at", "genre_id", "create_at", "id"),
+        # Most books have no category; the partial index still serves `category_id = ...`
+        # lookups, including the FK check when a category is deleted
+        Index(
+            "ix_book_category_id",
+            "category_id",
+            postgresql_where=text("category_id IS NOT NULL"),
+            sqlite_where=text("category_id IS NOT NULL"),
+        ),
+    )
 
     title: Mapped[str] = mapped_column(String(255), nullable=False)
-    description: Mapped[str | None] = mapped_column(String, nullable=True)
+    description: Mapped[str | None] = mapped_column(String, nullable=True, deferred=True, deferred_raiseload=True)
     genre_id: Mapped[uuid.UUID] = mapped_column(
         PG_UUID(as_uuid=True), ForeignKey("genre.id"), nullable=False, unique=False
     )
     category_id: Mapped[uuid.UUID | None] = mapped_column(
         PG_UUID(as_uuid=True), ForeignKey("category.id"), nullable=True, unique=False
     )
+    # Maintained by database triggers, see src/domains/book/search.py
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR().with_variant(Text(), "sqlite"), nullable=True, deferred=True, deferred_raiseload=True
+    )
 
-    genre: Mapped[Genre] = relationship("Genre", back_populates="books")
-    category: Mapped["Category | None"] = relationship("Category", back_populates="books")
+    genre: Mapped[Genre] = relationship("Genre", back_populates="books", lazy="raise_on_sql")
+    category: Mapped["Category | None"] = relationship("Category", back_populates="books", lazy="raise_on_sql")
 
     author_books: Mapped[list[AuthorBook]] = relationship(
         "AuthorBook",
         back_populates="book",
         cascade="all, delete-orphan",
+        passive_deletes=True,
         overlaps="authors",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
     authors: Mapped[list[Author]] = relationship(
         "Author",
         secondary="author_book",
         back_populates="books",
-        lazy="selectin",
+        lazy="raise_on_sql",
         overlaps="author_books",
     )
-    favorites: Mapped[list[Favorites]] = relationship("Favorites", back_populates="book", cascade="all, delete-orphan")
+    favorites: Mapped[list[Favorites]] = relationship(
+        "Favorites", back_populates="book", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql"
+    )
 
-    reviews: Mapped[list["Review"]] = relationship("Review", back_populates="book", cascade="all, delete-orphan")
+    reviews: Mapped[list["Review"]] = relationship(
+        "Review", back_populates="book", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql"
+    )
 
     reading_users: Mapped[list["ReadingStatus"]] = relationship(
-        "ReadingStatus", back_populates="books", cascade="all, delete-orphan"
+        "ReadingStatus", back_populates="books", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql"
+    )
+
+
+class BookStats(Base, CreatedUpdatedColumnsMixin):
+    """Review aggregates per book, maintained by the review write handlers."""
+
+    __tablename__ = "book_stats"
+
+    book_id: Mapped[uuid.UUID] = mapped_column(
+        PG_UUID(as_uuid=True), ForeignKey("book.id", ondelete="CASCADE"), primary_key=True
     )
+    rating_sum: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    rating_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    rating_1: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    rating_2: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    rating_3: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    rating_4: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    rating_5: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    text_reviews_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
@@ -1,23 +1,53 @@
 import uuid
-
-from sqlalchemy import delete, func, insert, select
+from collections.abc import Collection, Mapping, Sequence
+from typing import Any
+
+from sqlalchemy import (
+    ColumnElement,
+    Float,
+    Text,
+    case,
+    cast,
+    delete,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    true,
+    type_coerce,
+    update,
+)
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import InstrumentedAttribute, joinedload, raiseload, undefer
 
+from src.cache.result_cache import entity_tag, result_cache
+from src.constants.order_direction import OrderDirection
+from src.db.dialect import dialect_insert
+from src.db.single_flight import single_flight
 from src.domains.author.models import Author
 from src.domains.author.schema import AuthorReadSchema
-from src.domains.book.models import Book
+from src.domains.book.constants import LATEST_REVIEWS_LIMIT, LIST_ORDER_COLUMN_MAP
+from src.domains.book.models import Book, BookStats
 from src.domains.book.schema import (
     BookCreateSchema,
     BookFilters,
+    BookListOrderSchema,
     BookReadSchema,
+    BookSearchResultSchema,
+    BookSearchSchema,
     BookUpdateSchema,
 )
+from src.domains.book.search import build_ts_query
 from src.domains.common.association.author_book import AuthorBook
+from src.domains.common.association.sync import sync_association
 from src.domains.review.models import Review
 from src.domains.review.schema import ReviewWithUserSchema
+from src.domains.user.models import User
 from src.exceptions.entity import EntityIntegrityException, EntityNotFound
+from src.utils.cursor import decode_cursor, encode_cursor
+from src.utils.request_builder import apply_keyset_pagination, ilike_contains
 
 
 async def create_book(session: AsyncSession, book: BookCreateSchema) -> BookReadSchema:
@@ -42,6 +72,7 @@ async def create_book(session: AsyncSession, book: BookCreateSchema) -> BookRead
             await session.execute(insert(AuthorBook), rows)
 
             await session.commit()
+            await result_cache.invalidate(entity_tag("book", new_book.id))
     except IntegrityError as err:
         await session.rollback()
         raise EntityIntegrityException(str(err._message())) from None
@@ -62,14 +93,30 @@ async def get_book_by_id(
     return BookReadSchema.model_validate(book)
 
 
+async def get_existing_book_ids(session: AsyncSession, ids: Collection[uuid.UUID]) -> set[uuid.UUID]:
+    if not ids:
+        return set()
+
+    result = await session.execute(select(Book.id).where(Book.id.in_(ids)))
+    return set(result.scalars())
+
+
+@result_cache.cached(
+    tags=lambda filters, order: [
+        entity_tag("book"),
+        *([entity_tag("author", filters.author_id)] if filters.author_id else []),
+    ]
+)
+@single_flight
 async def get_books_list(
     session: AsyncSession,
     filters: BookFilters,
-) -> list[BookReadSchema]:
+    order: BookListOrderSchema,
+) -> tuple[list[BookReadSchema], str | None]:
     query = select(Book)
 
     if filters.title:
-        query = query.where(Book.title.ilike(f"%{filters.title}%"))
+        query = query.where(ilike_contains(Book.title, filters.title))
 
     if filters.genre_id:
         query = query.where(Book.genre_id == filters.genre_id)
@@ -77,12 +124,59 @@ async def get_books_list(
     if filters.author_id:
         query = query.join(Book.authors).where(Author.id == filters.author_id)
 
-    query = query.limit(filters.limit).offset(filters.offset)
+    key_columns = [LIST_ORDER_COLUMN_MAP[order.order_by], Book.id]
+    # A cursor only continues the ordering it was issued for
+    cursor_order = f"{order.order_by}:{order.order_direction}"
+    after = decode_cursor(filters.cursor, key_columns, cursor_order) if filters.cursor else None
+    query = apply_keyset_pagination(query, key_columns, order.order_direction, after)
 
-    result = await session.execute(query)
+    if after is None:
+        query = query.offset(filters.offset)
+
+    result = await session.execute(query.limit(filters.limit))
     books = result.scalars().all()
 
-    return [BookReadSchema.model_validate(b) for b in books]
+    next_cursor = None
+    if len(books) == filters.limit:
+        next_cursor = encode_cursor([getattr(books[-1], column.key) for column in key_columns], cursor_order)
+
+    return [BookReadSchema.model_validate(b) for b in books], next_cursor
+
+
+async def search_books(
+    session: AsyncSession,
+    params: BookSearchSchema,
+) -> tuple[list[BookSearchResultSchema], str | None]:
+    if session.get_bind().dialect.name == "postgresql":
+        ts_query = build_ts_query(params.q)
+        match = Book.search_vector.op("@@")(ts_query)
+        rank = func.ts_rank_cd(Book.search_vector, ts_query, type_=Float)
+    else:
+        # Test backend without full-text search: plain substring match, title hits first
+        title_match = ilike_contains(Book.title, params.q)
+        match = or_(title_match, ilike_contains(Book.description, params.q))
+        rank = type_coerce(case((title_match, 1.0), else_=0.5), Float)
+
+    query = select(Book).where(match)
+
+    if params.rating_weight:
+        average_rating = cast(BookStats.rating_sum, Float) / func.nullif(BookStats.rating_count, 0)
+        rank = rank * (1 + params.rating_weight * func.coalesce(average_rating, 0) / 5)
+        query = query.outerjoin(BookStats, BookStats.book_id == Book.id)
+
+    rank = rank.label("rank")
+    key_columns = [rank, Book.id]
+    after = decode_cursor(params.cursor, key_columns) if params.cursor else None
+    query = apply_keyset_pagination(query.add_columns(rank), key_columns, OrderDirection.desc, after)
+
+    result = await session.execute(query.limit(params.limit))
+    rows = result.all()
+
+    next_cursor = None
+    if len(rows) == params.limit:
+        next_cursor = encode_cursor([rows[-1].rank, rows[-1].Book.id])
+
+    return [BookSearchResultSchema.from_orm_with_rank(row.Book, row.rank) for row in rows], next_cursor
 
 
 async def update_book(
@@ -90,7 +184,8 @@ async def update_book(
     id: uuid.UUID,
     data: BookUpdateSchema,
 ) -> BookReadSchema:
-    result = await session.execute(select(Book).where(Book.id == id))
+    # Row lock serializes concurrent updates of the book's author links
+    result = await session.execute(select(Book).where(Book.id == id).with_for_update())
     book = result.scalar_one_or_none()
 
     if not book:
@@ -103,19 +198,13 @@ async def update_book(
         book.genre_id = data.genre_id
 
     if data.authors is not None:
-        authors_result = await session.execute(
-            select(Author).where(Author.id.in_(data.authors))
-        )
-        authors = authors_result.scalars().all()
+        author_ids = set(data.authors)
+        authors_count = await session.scalar(select(func.count()).where(Author.id.in_(author_ids)))
 
-        if len(authors) != len(data.authors):
+        if authors_count != len(author_ids):
             raise EntityIntegrityException("Some authors do not exist")
 
-        await session.execute(delete(AuthorBook).where(AuthorBook.book_id == book.id))
-        await session.execute(
-            insert(AuthorBook),
-            [{"author_id": a.id, "book_id": book.id} for a in authors],
-        )
+        await sync_association(session, AuthorBook, AuthorBook.book_id, book.id, AuthorBook.author_id, author_ids)
 
     try:
         await session.commit()
@@ -123,6 +212,7 @@ async def update_book(
         await session.rollback()
         raise EntityIntegrityException("Integrity error") from None
 
+    await result_cache.invalidate(entity_tag("book", id))
     return BookReadSchema.model_validate(book)
 
 
@@ -139,57 +229,79 @@ async def delete_book(
     if result.fetchone() is None:
         raise EntityNotFound({"id": id}, "book")
     await session.commit()
+    await result_cache.invalidate(entity_tag("book", id))
 
 
-async def get_book_information(session: AsyncSession, id: uuid.UUID):
-    book_stmt = select(Book).where(Book.id == id).options(
-        joinedload(Book.authors).joinedload(Author.genres)
+# Authors, their genres and reviewers' usernames are part of the result
+@result_cache.cached(
+    tags=lambda id: [entity_tag("book", id), entity_tag("author"), entity_tag("genre"), entity_tag("user")]
+)
+@single_flight
+async def get_book_information(session: AsyncSession, id: uuid.UUID) -> dict[str, Any]:
+    latest = (
+        select(
+            Review.id,
+            Review.user_id,
+            Review.rating,
+            Review.text,
+            Review.create_at,
+            User.username,
+        )
+        .join(User, User.id == Review.user_id)
+        .where(Review.book_id == id)
+        .order_by(Review.create_at.desc(), Review.id.desc())
+        .limit(LATEST_REVIEWS_LIMIT)
+        .subquery("latest")
     )
-    book_result = await session.execute(book_stmt)
-    book = book_result.unique().scalar_one_or_none()
-
-    if not book:
-        raise EntityNotFound({"id": id}, "book")
 
-    rating_stmt = select(func.avg(Review.rating), func.count(Review.id)).where(
-        Review.book_id == id
+    stmt = (
+        select(
+            Book,
+            BookStats.rating_sum,
+            BookStats.rating_count,
+            BookStats.rating_5,
+            BookStats.text_reviews_count,
+            latest.c.id.label("review_id"),
+            latest.c.user_id.label("review_user_id"),
+            latest.c.username.label("review_username"),
+            latest.c.rating.label("review_rating"),
+            latest.c.text.label("review_text"),
+            latest.c.create_at.label("review_create_at"),
+        )
+        .select_from(Book)
+        .outerjoin(BookStats, BookStats.book_id == Book.id)
+        .outerjoin(latest, true())
+        .where(Book.id == id)
+        .options(
+            undefer(Book.description),
+            joinedload(Book.authors).options(joinedload(Author.genres), raiseload("*")),
+            raiseload("*"),
+        )
+        .order_by(latest.c.create_at.desc(), latest.c.id.desc())
     )
-    rating_result = await session.execute(rating_stmt)
-    avg_rating, total_ratings = rating_result.one()
 
-    max_rating_stmt = select(func.count(Review.id)).where(
-        Review.book_id == id, Review.rating == 5
-    )
-    max_rating_result = await session.execute(max_rating_stmt)
-    max_rating_count = max_rating_result.scalar()
+    result = await session.execute(stmt)
+    rows = result.unique().all()
 
-    text_reviews_stmt = select(func.count(Review.id)).where(
-        Review.book_id == id, Review.text.isnot(None), Review.text != ""
-    )
-    text_reviews_result = await session.execute(text_reviews_stmt)
-    text_reviews_count = text_reviews_result.scalar()
+    if not rows:
+        raise EntityNotFound({"id": id}, "book")
 
-    reviews_stmt = (
-        select(Review)
-        .options(joinedload(Review.user))
-        .where(Review.book_id == id)
-        .order_by(Review.create_at.desc())
-        .limit(10)
-    )
-    reviews_result = await session.execute(reviews_stmt)
-    reviews = reviews_result.scalars().all()
+    book = rows[0].Book
+    rating_sum = rows[0].rating_sum or 0
+    rating_count = rows[0].rating_count or 0
 
     latest_reviews = [
         ReviewWithUserSchema(
-            id=r.id,
-            user_id=r.user_id,
-            username=r.user.username,
-            book_id=r.book_id,
-            rating=r.rating,
-            text=r.text,
-            created_at=r.create_at.strftime("%Y-%m-%d %H:%M"),
+            id=row.review_id,
+            user_id=row.review_user_id,
+            username=row.review_username,
+            book_id=book.id,
+            rating=row.review_rating,
+            text=row.review_text,
+            created_at=row.review_create_at.strftime("%Y-%m-%d %H:%M"),
         )
-        for r in reviews
+        for row in rows
+        if row.review_id is not None
     ]
 
     authors_data = [
@@ -210,9 +322,95 @@ async def get_book_information(session: AsyncSession, id: uuid.UUID):
         "description": book.description,
         "genre_id": book.genre_id,
         "category_id": book.category_id,
-        "average_rating": float(avg_rating) if avg_rating else None,
-        "total_ratings": total_ratings,
-        "max_rating_count": max_rating_count,
-        "text_reviews_count": text_reviews_count,
+        "average_rating": rating_sum / rating_count if rating_count else None,
+        "total_ratings": rating_count,
+        "max_rating_count": rows[0].rating_5 or 0,
+        "text_reviews_count": rows[0].text_reviews_count or 0,
         "latest_reviews": latest_reviews,
     }
+
+
+def _review_stats_delta(rating: int, text: str | None, sign: int) -> dict[str, int]:
+    return {
+        "rating_sum": sign * rating,
+        "rating_count": sign,
+        f"rating_{rating}": sign,
+        "text_reviews_count": sign if text else 0,
+    }
+
+
+async def update_book_stats(
+    session: AsyncSession,
+    book_id: uuid.UUID,
+    added: Sequence[tuple[int, str | None]] = (),
+    removed: Sequence[tuple[int, str | None]] = (),
+) -> None:
+    """Apply added and removed reviews, given as (rating, text) pairs, to the book's stats row in one statement.
+
+    Must run in the same transaction as the review writes it reflects.
+    """
+
+    delta: dict[str, int] = {}
+    for reviews, sign in ((added, 1), (removed, -1)):
+        for review in reviews:
+            for column, value in _review_stats_delta(*review, sign).items():
+                delta[column] = delta.get(column, 0) + value
+
+    changes = {column: getattr(BookStats, column) + value for column, value in delta.items() if value}
+    if not changes:
+        return
+
+    if removed:
+        await session.execute(update(BookStats).where(BookStats.book_id == book_id).values(changes))
+        return
+
+    stmt = dialect_insert(session)(BookStats).values(book_id=book_id, **delta)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[BookStats.book_id],
+        set_={**changes, "update_at": func.now()},
+    )
+    await session.execute(stmt)
+
+
+def _counts_as(condition: ColumnElement[bool]) -> ColumnElement[int]:
+    return case((condition, 1), else_=0)
+
+
+def _has_text(text: ColumnElement[Any] | InstrumentedAttribute[Any]) -> ColumnElement[int]:
+    return _counts_as(func.coalesce(text, "") != "")
+
+
+async def update_book_stats_for_review_patch(
+    session: AsyncSession,
+    review_id: uuid.UUID,
+    user_id: uuid.UUID,
+    changes: Mapping[str, Any],
+) -> None:
+    """Move a review's contribution to its book's stats from its stored rating and text to `changes`.
+
+    The old values are read by the statement itself (`UPDATE book_stats ... FROM review`), restricted
+    to `user_id`'s review, so it must run before the review UPDATE in the same transaction.
+    """
+
+    if not changes.keys() & {"rating", "text"}:
+        return
+
+    old_rating, old_text = Review.rating, Review.text
+    new_rating = literal(changes["rating"]) if "rating" in changes else old_rating
+    new_text = literal(changes["text"], Text) if "text" in changes else old_text
+
+    values = {
+        "rating_sum": BookStats.rating_sum + new_rating - old_rating,
+        "text_reviews_count": BookStats.text_reviews_count + _has_text(new_text) - _has_text(old_text),
+        **{
+            f"rating_{rating}": getattr(BookStats, f"rating_{rating}")
+            + _counts_as(new_rating == rating)
+            - _counts_as(old_rating == rating)
+            for rating in range(1, 6)
+        },
+    }
+    await session.execute(
+        update(BookStats)
+        .where(BookStats.book_id == Review.book_id, Review.id == review_id, Review.user_id == user_id)
+        .values(values)
+    )
@@ -1,11 +1,13 @@
 import uuid
-from typing import Self
+from typing import Any, Self
 
-from pydantic import ConfigDict
+from pydantic import ConfigDict, Field, field_validator
 
+from src.constants.pagination import DEFAULT_PAGINATION_LIMIT, DEFAULT_PAGINATION_OFFSET, MAX_PAGINATION_LIMIT
 from src.constants.reading_status import BookReadingStatus
+from src.domains.book.constants import IMPORT_AUTHORS_SEPARATOR, BookListOrderBy
 from src.domains.book.models import Book
-from src.domains.common.schema import BaseSchema
+from src.domains.common.schema import BaseSchema, OrderBaseSchema
 
 
 class BookBaseSchema(BaseSchema):
@@ -44,12 +46,33 @@ class BookWithReadingStatusReadSchema(BookReadSchema):
         return cls.model_validate(data)
 
 
+class BookSearchResultSchema(BookReadSchema):
+    rank: float
+
+    @classmethod
+    def from_orm_with_rank(cls, book: Book, rank: float) -> Self:
+        base = BookReadSchema.model_validate(book).model_dump()
+        return cls.model_validate({**base, "rank": rank})
+
+
 class BookFilters(BaseSchema):
     title: str | None = None
     genre_id: uuid.UUID | None = None
     author_id: uuid.UUID | None = None
-    limit: int = 50
-    offset: int = 0
+    limit: int = Field(DEFAULT_PAGINATION_LIMIT, ge=1, le=MAX_PAGINATION_LIMIT)
+    offset: int = Field(DEFAULT_PAGINATION_OFFSET, ge=0)
+    cursor: str | None = Field(None, description="Значение X-Next-Cursor предыдущей страницы, заменяет offset")
+
+
+class BookSearchSchema(BaseSchema):
+    q: str = Field(..., min_length=1, max_length=255, description="Поисковый запрос")
+    rating_weight: float = Field(0.0, ge=0.0, le=1.0, description="Вес средней оценки книги в ранжировании")
+    limit: int = Field(DEFAULT_PAGINATION_LIMIT, ge=1, le=MAX_PAGINATION_LIMIT)
+    cursor: str | None = Field(None, description="Значение X-Next-Cursor предыдущей страницы")
+
+
+class BookListOrderSchema(OrderBaseSchema):
+    order_by: BookListOrderBy = BookListOrderBy.create_at
 
 
 class BookInformationSchema(BaseSchema):
@@ -66,3 +89,58 @@ class BookInformationSchema(BaseSchema):
     latest_reviews: list
 
     model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True)
+
+
+class BookImportAuthorSchema(BaseSchema):
+    first_name: str = Field(..., min_length=1, max_length=64)
+    last_name: str = Field(..., min_length=1, max_length=64)
+
+    @property
+    def key(self) -> tuple[str, str]:
+        return self.first_name, self.last_name
+
+
+class BookImportRowSchema(BaseSchema):
+    """A feed record; CSV rows list authors as `First Last; First Last`."""
+
+    id: uuid.UUID | None = None
+    title: str = Field(..., min_length=1, max_length=255)
+    description: str | None = None
+    genre: str = Field(..., min_length=1)
+    category: str | None = None
+    authors: list[BookImportAuthorSchema] = []
+
+    @field_validator("id", "description", "category", mode="before")
+    @classmethod
+    def empty_as_none(cls, value: Any) -> Any:
+        return value or None
+
+    @field_validator("authors", mode="before")
+    @classmethod
+    def split_author_names(cls, value: Any) -> Any:
+        if isinstance(value, str):
+            value = [name for name in value.split(IMPORT_AUTHORS_SEPARATOR) if name.strip()]
+        if not isinstance(value, list):
+            return value
+
+        authors = []
+        for author in value:
+            if isinstance(author, str):
+                first_name, _, last_name = author.strip().rpartition(" ")
+                author = {"first_name": first_name.strip(), "last_name": last_name}
+            authors.append(author)
+        return authors
+
+
+class BookImportErrorSchema(BaseSchema):
+    line: int = Field(..., description="Номер строки начала записи во входных данных")
+    message: str
+
+
+class BookImportReportSchema(BaseSchema):
+    total_rows: int
+    imported: int
+    failed: int
+    errors: list[BookImportErrorSchema] = Field(..., description="Первые ошибки по строкам")
+    elapsed_seconds: float
+    rows_per_second: float
@@ -0,0 +1,99 @@
+"""Full-text search over books.
+
+`book.search_vector` is maintained by Postgres triggers: on book title/description
+changes, on author_book inserts/deletes and on author renames. Title, description and
+author names are indexed with both the `russian` and `simple` configurations because
+the catalogue mixes Cyrillic and Latin titles.
+"""
+
+from functools import reduce
+from typing import Any
+
+from sqlalchemy import DDL, ColumnElement, event, func, literal_column
+
+from src.domains.common.models import Base
+
+SEARCH_CONFIGS = ("russian", "simple")
+
+SEARCH_VECTOR_DDL = [
+    """
+    CREATE OR REPLACE FUNCTION book_search_vector(p_book_id uuid, p_title text, p_description text)
+    RETURNS tsvector AS $$
+        SELECT
+            setweight(to_tsvector('russian', coalesce(p_title, '')), 'A')
+            || setweight(to_tsvector('simple', coalesce(p_title, '')), 'A')
+            || setweight(to_tsvector('russian', coalesce(names.value, '')), 'B')
+            || setweight(to_tsvector('simple', coalesce(names.value, '')), 'B')
+            || setweight(to_tsvector('russian', coalesce(p_description, '')), 'C')
+            || setweight(to_tsvector('simple', coalesce(p_description, '')), 'C')
+        FROM (
+            SELECT string_agg(a.first_name || ' ' || a.last_name, ' ') AS value
+            FROM author_book ab
+            JOIN author a ON a.id = ab.author_id
+            WHERE ab.book_id = p_book_id
+        ) AS names
+    $$ LANGUAGE sql STABLE
+    """,
+    """
+    CREATE OR REPLACE FUNCTION book_search_vector_refresh() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector := book_search_vector(NEW.id, NEW.title, NEW.description);
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE TRIGGER book_search_vector_refresh
+    BEFORE INSERT OR UPDATE OF title, description ON book
+    FOR EACH ROW EXECUTE FUNCTION book_search_vector_refresh()
+    """,
+    """
+    CREATE OR REPLACE FUNCTION author_book_search_vector_refresh() RETURNS trigger AS $$
+    BEGIN
+        UPDATE book SET search_vector = book_search_vector(id, title, description)
+        WHERE id IN (SELECT book_id FROM changed_rows);
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE TRIGGER author_book_insert_search_vector
+    AFTER INSERT ON author_book REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION author_book_search_vector_refresh()
+    """,
+    """
+    CREATE OR REPLACE TRIGGER author_book_delete_search_vector
+    AFTER DELETE ON author_book REFERENCING OLD TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION author_book_search_vector_refresh()
+    """,
+    """
+    CREATE OR REPLACE FUNCTION author_search_vector_refresh() RETURNS trigger AS $$
+    BEGIN
+        UPDATE book SET search_vector = book_search_vector(id, title, description)
+        WHERE id IN (
+            SELECT ab.book_id
+            FROM author_book ab
+            JOIN new_rows n ON n.id = ab.author_id
+            JOIN old_rows o ON o.id = n.id
+            WHERE (n.first_name, n.last_name) IS DISTINCT FROM (o.first_name, o.last_name)
+        );
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE TRIGGER author_update_search_vector
+    AFTER UPDATE ON author REFERENCING NEW TABLE AS new_rows OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION author_search_vector_refresh()
+    """,
+]
+
+for statement in SEARCH_VECTOR_DDL:
+    event.listen(Base.metadata, "after_create", DDL(statement).execute_if(dialect="postgresql"))
+
+
+def build_ts_query(q: str) -> ColumnElement[Any]:
+    """OR together the web-search style query parsed with every search configuration."""
+
+    queries = [func.websearch_to_tsquery(literal_column(f"'{config}'::regconfig"), q) for config in SEARCH_CONFIGS]
+    return reduce(lambda left, right: left.op("||")(right), queries)
@@ -1,13 +1,15 @@
 import uuid
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Path, status
-from sqlalchemy import delete, select, update
+from fastapi import APIRouter, Depends, Path, Request, Response, status
+from sqlalchemy import delete, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.guards import get_current_active_admin
-from src.db.db import get_async_session
+from src.cache.reference_data import LOAD_STATEMENTS, reference_data, set_cache_headers
+from src.db.db import get_async_session, get_primary_read_session
+from src.db.request_queries import query_budget
 from src.domains.category.models import Category
 from src.domains.category.schema import (
     CategoryCreateSchema,
@@ -24,14 +26,16 @@ router = APIRouter()
     "/",
     summary="Получить список категорий",
 )
+@query_budget(LOAD_STATEMENTS)
 async def get_all(
-    session: Annotated[AsyncSession, Depends(get_async_session)],
+    request: Request,
+    response: Response,
+    session: Annotated[AsyncSession, Depends(get_primary_read_session)],
 ) -> list[CategoryReadSchema]:
-    stmt = select(Category).order_by(Category.create_at.asc())
-    result = await session.execute(stmt)
-    categories = result.scalars().all()
+    snapshot = await reference_data.get(session)
+    set_cache_headers(request, response, snapshot)
 
-    return [CategoryReadSchema.model_validate(category) for category in categories]
+    return list(snapshot.categories)
 
 
 @router.get(
@@ -40,14 +44,18 @@ async def get_all(
 )
 async def get_by_id(
     category_id: Annotated[uuid.UUID, Path(..., description="ID категории")],
-    session: Annotated[AsyncSession, Depends(get_async_session)],
+    request: Request,
+    response: Response,
+    session: Annotated[AsyncSession, Depends(get_primary_read_session)],
 ) -> CategoryReadSchema:
-    category = await session.get(Category, category_id)
+    snapshot = await reference_data.get(session)
+    category = snapshot.categories_by_id.get(category_id)
 
     if category is None:
         raise EntityNotFound({"id": category_id}, entity_name="category")
 
-    return CategoryReadSchema.model_validate(category)
+    set_cache_headers(request, response, snapshot)
+    return category
 
 
 @router.post(
@@ -65,6 +73,7 @@ async def create(
     session.add(category)
 
     try:
+        await reference_data.bump(session)
         await session.commit()
     except IntegrityError:
         await session.rollback()
@@ -72,6 +81,7 @@ async def create(
             {"name": category_in.name}, entity_name="category"
         ) from None
 
+    reference_data.expire()
     return CategoryReadSchema.model_validate(category)
 
 
@@ -85,27 +95,27 @@ async def patch(
     session: Annotated[AsyncSession, Depends(get_async_session)],
     current_admin: Annotated[UserReadSchema, Depends(get_current_active_admin)],
 ) -> CategoryReadSchema:
-    category = await session.get(Category, category_id)
-
-    if category is None:
-        raise EntityNotFound({"id": category_id}, entity_name="category")
-
     stmt = (
         update(Category)
         .where(Category.id == category_id)
         .values(**category_in.model_dump(exclude_unset=True))
+        .returning(Category)
     )
 
     try:
-        await session.execute(stmt)
-        await session.commit()
+        category = (await session.execute(stmt)).scalar_one_or_none()
     except IntegrityError:
         await session.rollback()
         raise EntityAlreadyExists(
             category_in.model_dump(exclude_unset=True), entity_name="category"
         ) from None
 
-    await session.refresh(category)
+    if category is None:
+        raise EntityNotFound({"id": category_id}, entity_name="category")
+
+    await reference_data.bump(session)
+    await session.commit()
+    reference_data.expire()
 
     return CategoryReadSchema.model_validate(category)
 
@@ -120,11 +130,12 @@ async def delete_by_id(
     session: Annotated[AsyncSession, Depends(get_async_session)],
     current_admin: Annotated[UserReadSchema, Depends(get_current_active_admin)],
 ) -> None:
-    category = await session.get(Category, category_id)
+    stmt = delete(Category).where(Category.id == category_id).returning(Category.id)
+    result = await session.execute(stmt)
 
-    if category is None:
+    if result.scalar_one_or_none() is None:
         raise EntityNotFound({"id": category_id}, entity_name="category")
 
-    stmt = delete(Category).where(Category.id == category_id)
-    await session.execute(stmt)
+    await reference_data.bump(session)
     await session.commit()
+    reference_data.expire()
@@ -14,4 +14,4 @@ class Category(Base, BaseModelMixin):
 
     name: Mapped[str] = mapped_column(String(100), nullable=False, unique=True)
 
-    books: Mapped[list["Book"]] = relationship("Book", back_populates="category")
+    books: Mapped[list["Book"]] = relationship("Book", back_populates="category", lazy="raise_on_sql")
@@ -1,7 +1,7 @@
 import uuid
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -14,6 +14,10 @@ if TYPE_CHECKING:
 
 class AuthorBook(Base, CreatedUpdatedColumnsMixin):
     __tablename__ = "author_book"
+    __table_args__ = (
+        # The primary key leads with author_id; lookups by book read author ids from this index alone
+        Index("ix_author_book_book_id_author_id", "book_id", postgresql_include=["author_id"]),
+    )
 
     author_id: Mapped[uuid.UUID] = mapped_column(
         PG_UUID(as_uuid=True),
@@ -33,8 +37,8 @@ class AuthorBook(Base, CreatedUpdatedColumnsMixin):
     )
 
     author: Mapped["Author"] = relationship(
-        "Author", back_populates="author_books", overlaps="authors,books"
+        "Author", back_populates="author_books", overlaps="authors,books", lazy="raise_on_sql"
     )
     book: Mapped["Book"] = relationship(
-        "Book", back_populates="author_books", overlaps="authors,books"
+        "Book", back_populates="author_books", overlaps="authors,books", lazy="raise_on_sql"
     )
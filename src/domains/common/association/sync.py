@@ -0,0 +1,38 @@
+import uuid
+from collections.abc import Collection
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from src.db.dialect import dialect_insert
+from src.domains.common.models import Base
+
+
+async def sync_association(
+    session: AsyncSession,
+    model: type[Base],
+    owner: InstrumentedAttribute[uuid.UUID],
+    owner_id: uuid.UUID,
+    target: InstrumentedAttribute[uuid.UUID],
+    target_ids: Collection[uuid.UUID],
+) -> None:
+    """Make the links of `owner_id` in the association table of `model` exactly `target_ids`.
+
+    Only the difference is written: one DELETE for links that are no longer wanted and one
+    `INSERT ... ON CONFLICT DO NOTHING` for the wanted ones, so unchanged rows keep their
+    `create_at` and are neither rewritten nor locked.
+
+    Callers must hold a lock on the owner row (an UPDATE of it, or `SELECT ... FOR UPDATE`):
+    two concurrent syncs of one owner would otherwise each delete a link the other keeps and
+    deadlock.
+    """
+
+    wanted = set(target_ids)
+
+    await session.execute(delete(model).where(owner == owner_id, target.not_in(wanted)))
+
+    if wanted:
+        rows = [{owner.key: owner_id, target.key: target_id} for target_id in wanted]
+        stmt = dialect_insert(session)(model).values(rows).on_conflict_do_nothing(index_elements=[owner, target])
+        await session.execute(stmt)
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import BigInteger, DateTime, Index, Integer, func
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, declarative_mixin, mapped_column
 
@@ -23,8 +23,30 @@ class CreatedUpdatedColumnsMixin:
 
 @declarative_mixin
 class BaseModelMixin(CreatedUpdatedColumnsMixin):
+    # Time-ordered UUIDv7, so new rows append to the right edge of the primary key index
+    # instead of landing on random pages; rows created with uuid4 ids stay valid as they are
     id: Mapped[uuid.UUID] = mapped_column(
         PG_UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid.uuid7,
     )
+
+
+class ReferenceDataVersion(Base):
+    """Single-row counter bumped by every write to genres, categories or roles, see `src.cache.reference_data`."""
+
+    __tablename__ = "reference_data_version"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
+
+
+def trigram_index(table_name: str, column_name: str) -> Index:
+    """GIN pg_trgm index serving `ILIKE '%...%'` filters on the column; skipped on other backends."""
+
+    return Index(
+        f"ix_{table_name}_{column_name}_trgm",
+        column_name,
+        postgresql_using="gin",
+        postgresql_ops={column_name: "gin_trgm_ops"},
+    ).ddl_if(dialect="postgresql")
@@ -1,19 +1,26 @@
 import uuid
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.exc import IntegrityError
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.guards import get_current_active_user
-from src.db.db import get_async_session
+from src.db.db import get_async_session, get_primary_read_session
+from src.db.request_queries import query_budget
+from src.domains.book.repository import get_existing_book_ids
 from src.domains.favorites.repository import (
-    create_favorite,
-    delete_favorite,
+    add_favorites,
     list_favorites_by_user,
+    remove_favorites,
+)
+from src.domains.favorites.schema import (
+    FavoriteBatchResultSchema,
+    FavoriteBatchSchema,
+    FavoriteCreateSchema,
+    FavoriteReadSchema,
 )
-from src.domains.favorites.schema import FavoriteCreateSchema, FavoriteReadSchema
 from src.domains.user.schema import UserReadSchema
+from src.exceptions.entity import EntityNotFound
 
 router = APIRouter()
 
@@ -23,11 +30,13 @@ router = APIRouter()
     response_model=FavoriteCreateSchema,
     status_code=status.HTTP_201_CREATED,
     summary="Добавить книгу в избранное",
+    description="Повторное добавление не является ошибкой и возвращает 200",
 )
 async def add_to_favorites(
     schema: FavoriteCreateSchema,
     current_user: Annotated[UserReadSchema, Depends(get_current_active_user)],
     session: Annotated[AsyncSession, Depends(get_async_session)],
+    response: Response,
 ) -> FavoriteReadSchema:
     if schema.user_id != current_user.id:
         raise HTTPException(
@@ -35,20 +44,49 @@ async def add_to_favorites(
             detail="Нельзя добавлять в избранное для другого пользователя",
         )
 
-    try:
-        favorite = await create_favorite(session, schema.user_id, schema.book_id)
-        return FavoriteReadSchema.model_validate(favorite)
-    except IntegrityError as e:
-        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Книга уже в избранном") from e
+    added = await add_favorites(session, current_user.id, [schema.book_id])
+    if not added:
+        # Nothing inserted: either already a favorite or there is no such book
+        if not await get_existing_book_ids(session, [schema.book_id]):
+            raise EntityNotFound({"id": schema.book_id}, entity_name="book")
+        response.status_code = status.HTTP_200_OK
+
+    await session.commit()
+    return FavoriteReadSchema(user_id=current_user.id, book_id=schema.book_id)
+
+
+@router.post(
+    "/batch",
+    summary="Добавить и удалить книги из избранного одним запросом",
+)
+async def sync_favorites(
+    batch: FavoriteBatchSchema,
+    current_user: Annotated[UserReadSchema, Depends(get_current_active_user)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+) -> FavoriteBatchResultSchema:
+    removed = await remove_favorites(session, current_user.id, set(batch.remove))
+    present = await add_favorites(session, current_user.id, set(batch.add))
+    if missing := set(batch.add) - present:
+        # Those that exist were favorites already
+        present |= await get_existing_book_ids(session, missing)
+
+    await session.commit()
+
+    return FavoriteBatchResultSchema(
+        added=[book_id for book_id in dict.fromkeys(batch.add) if book_id in present],
+        removed=[book_id for book_id in dict.fromkeys(batch.remove) if book_id in removed],
+        not_found=[book_id for book_id in dict.fromkeys(batch.add) if book_id not in present],
+    )
 
 
 @router.get(
     "/",
     summary="Получить список избранного для текущего пользователя",
 )
+@query_budget(3)
 async def get_my_favorites(
     current_user: Annotated[UserReadSchema, Depends(get_current_active_user)],
-    session: Annotated[AsyncSession, Depends(get_async_session)],
+    session: Annotated[AsyncSession, Depends(get_primary_read_session)],
 ) -> list[FavoriteReadSchema]:
     favorites = await list_favorites_by_user(session, current_user.id)
     return [FavoriteReadSchema.model_validate(f) for f in favorites]
@@ -64,10 +102,11 @@ async def remove_from_favorites(
     current_user: Annotated[UserReadSchema, Depends(get_current_active_user)],
     session: Annotated[AsyncSession, Depends(get_async_session)],
 ):
-    success = await delete_favorite(session, current_user.id, book_id)
-    if not success:
+    removed = await remove_favorites(session, current_user.id, [book_id])
+    if not removed:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Запись не найдена в избранном",
         )
+    await session.commit()
     return
@@ -31,6 +31,6 @@ class Favorites(Base, CreatedUpdatedColumnsMixin):
         primary_key=True,
     )
 
-    user: Mapped["User"] = relationship("User", back_populates="favorites")
-    book: Mapped["Book"] = relationship("Book", back_populates="favorites")
+    user: Mapped["User"] = relationship("User", back_populates="favorites", lazy="raise_on_sql")
+    book: Mapped["Book"] = relationship("Book", back_populates="favorites", lazy="raise_on_sql")
 
@@ -1,31 +1,47 @@
 import uuid
-from collections.abc import Sequence
+from collections.abc import Collection, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import delete, func, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.db.dialect import dialect_insert
+from src.domains.book.models import Book
 from src.domains.favorites.models import Favorites
 
 
-async def create_favorite(session: AsyncSession, user_id: uuid.UUID, book_id: uuid.UUID) -> Favorites:
-    favorite = Favorites(user_id=user_id, book_id=book_id)
-    session.add(favorite)
-    await session.commit()
-    return favorite
+async def add_favorites(session: AsyncSession, user_id: uuid.UUID, book_ids: Collection[uuid.UUID]) -> set[uuid.UUID]:
+    """Add the existing books among `book_ids` to favorites in one statement; return the newly added ids.
 
+    Books that are already favorites are skipped by `ON CONFLICT DO NOTHING`, and ids without a
+    book are filtered by the `SELECT`, so retries never abort the transaction.
+    """
 
-async def get_favorite(session: AsyncSession, user_id: uuid.UUID, book_id: uuid.UUID) -> Favorites | None:
-    result = await session.execute(select(Favorites).where(Favorites.user_id == user_id, Favorites.book_id == book_id))
-    return result.scalars().first()
+    if not book_ids:
+        return set()
 
+    stmt = dialect_insert(session)(Favorites).from_select(
+        ["user_id", "book_id", "create_at", "update_at"],
+        select(literal(user_id, Favorites.user_id.type), Book.id, func.now(), func.now()).where(Book.id.in_(book_ids)),
+    )
+    stmt = stmt.on_conflict_do_nothing(index_elements=[Favorites.user_id, Favorites.book_id])
+    result = await session.execute(stmt.returning(Favorites.book_id))
+    return set(result.scalars())
 
-async def delete_favorite(session: AsyncSession, user_id: uuid.UUID, book_id: uuid.UUID) -> bool:
-    favorite = await get_favorite(session, user_id, book_id)
-    if not favorite:
-        return False
-    await session.delete(favorite)
-    await session.commit()
-    return True
+
+async def remove_favorites(
+    session: AsyncSession, user_id: uuid.UUID, book_ids: Collection[uuid.UUID]
+) -> set[uuid.UUID]:
+    """Remove `book_ids` from favorites in one statement; return the ids that were there."""
+
+    if not book_ids:
+        return set()
+
+    result = await session.execute(
+        delete(Favorites)
+        .where(Favorites.user_id == user_id, Favorites.book_id.in_(book_ids))
+        .returning(Favorites.book_id)
+    )
+    return set(result.scalars())
 
 
 async def list_favorites_by_user(session: AsyncSession, user_id: uuid.UUID) -> Sequence[Favorites]:
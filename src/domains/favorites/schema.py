@@ -1,7 +1,8 @@
 import uuid
 
-from pydantic import ConfigDict
+from pydantic import ConfigDict, Field
 
+from src.constants.batch import MAX_BATCH_SIZE
 from src.domains.common.schema import BaseSchema
 
 
@@ -18,3 +19,18 @@ class FavoriteCreateSchema(FavoriteBaseSchema):
 
 class FavoriteReadSchema(FavoriteBaseSchema):
     model_config = ConfigDict(from_attributes=True)
+
+
+class FavoriteBatchSchema(BaseSchema):
+    add: list[uuid.UUID] = Field(default_factory=list, max_length=MAX_BATCH_SIZE, description="ID книг для добавления")
+    remove: list[uuid.UUID] = Field(
+        default_factory=list,
+        max_length=MAX_BATCH_SIZE,
+        description="ID книг для удаления, применяется до добавления",
+    )
+
+
+class FavoriteBatchResultSchema(BaseSchema):
+    added: list[uuid.UUID] = Field(description="Книги, которые теперь в избранном")
+    removed: list[uuid.UUID] = Field(description="Книги, удаленные из избранного")
+    not_found: list[uuid.UUID] = Field(description="Несуществующие книги")
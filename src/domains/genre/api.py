@@ -1,13 +1,16 @@
 import uuid
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Path, status
-from sqlalchemy import delete, select, update
+from fastapi import APIRouter, Depends, Path, Request, Response, status
+from sqlalchemy import delete, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.guards import get_current_active_admin
-from src.db.db import get_async_session
+from src.cache.reference_data import LOAD_STATEMENTS, reference_data, set_cache_headers
+from src.cache.result_cache import entity_tag, result_cache
+from src.db.db import get_async_session, get_primary_read_session
+from src.db.request_queries import query_budget
 from src.domains.genre.models import Genre
 from src.domains.genre.schema import GenreCreateSchema, GenrePatchSchema, GenreReadSchema
 from src.domains.user.schema import UserReadSchema
@@ -20,14 +23,16 @@ router = APIRouter()
     "/",
     summary="Получить список жанров",
 )
+@query_budget(LOAD_STATEMENTS)
 async def get_all(
-    session: Annotated[AsyncSession, Depends(get_async_session)],
+    request: Request,
+    response: Response,
+    session: Annotated[AsyncSession, Depends(get_primary_read_session)],
 ) -> list[GenreReadSchema]:
-    stmt = select(Genre).order_by(Genre.create_at.asc())
-    result = await session.execute(stmt)
-    genres = result.scalars().all()
+    snapshot = await reference_data.get(session)
+    set_cache_headers(request, response, snapshot)
 
-    return [GenreReadSchema.model_validate(genre) for genre in genres]
+    return list(snapshot.genres)
 
 
 @router.get(
@@ -36,14 +41,18 @@ async def get_all(
 )
 async def get_by_id(
     genre_id: Annotated[uuid.UUID, Path(..., description="ID жанра")],
-    session: Annotated[AsyncSession, Depends(get_async_session)],
+    request: Request,
+    response: Response,
+    session: Annotated[AsyncSession, Depends(get_primary_read_session)],
 ) -> GenreReadSchema:
-    genre = await session.get(Genre, genre_id)
+    snapshot = await reference_data.get(session)
+    genre = snapshot.genres_by_id.get(genre_id)
 
     if genre is None:
         raise EntityNotFound({"id": genre_id}, entity_name="genre")
 
-    return GenreReadSchema.model_validate(genre)
+    set_cache_headers(request, response, snapshot)
+    return genre
 
 
 @router.post(
@@ -60,12 +69,15 @@ async def create_genre(
     session.add(genre)
 
     try:
+        await reference_data.bump(session)
         await session.commit()
-        return GenreReadSchema.model_validate(genre)
-
     except IntegrityError:
         raise EntityAlreadyExists({"name": genre_data.name}, entity_name="genre") from None
 
+    reference_data.expire()
+    await result_cache.invalidate(entity_tag("genre", genre.id))
+    return GenreReadSchema.model_validate(genre)
+
 
 @router.patch(
     "/{genre_id}",
@@ -86,7 +98,10 @@ async def patch_genre(
     if updated_genre is None:
         raise EntityNotFound({"id": genre_id}, entity_name="genre")
 
+    await reference_data.bump(session)
     await session.commit()
+    reference_data.expire()
+    await result_cache.invalidate(entity_tag("genre", genre_id))
 
     return GenreReadSchema.model_validate(updated_genre)
 
@@ -108,4 +123,7 @@ async def delete_genre(
     if not deleted_ids:
         raise EntityNotFound({"id": genre_id}, entity_name="genre")
 
+    await reference_data.bump(session)
     await session.commit()
+    reference_data.expire()
+    await result_cache.invalidate(entity_tag("genre", genre_id))
@@ -16,13 +16,13 @@ class Genre(Base, BaseModelMixin):
 
     name: Mapped[str] = mapped_column(String(30), nullable=False, unique=True)
     author_genres: Mapped[list[AuthorGenre]] = relationship(
-        "AuthorGenre", back_populates="genre", cascade="all, delete-orphan"
+        "AuthorGenre", back_populates="genre", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql"
     )
     authors: Mapped[list[Author]] = relationship(
         "Author",
         secondary="author_genre",
         back_populates="genres",
         viewonly=True,
-        lazy="select",
+        lazy="raise_on_sql",
     )
-    books: Mapped[list[Book]] = relationship("Book", back_populates="genre")
+    books: Mapped[list[Book]] = relationship("Book", back_populates="genre", lazy="raise_on_sql")
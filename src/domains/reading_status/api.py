@@ -3,16 +3,20 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, Path, status
 from sqlalchemy import and_, select, update
-from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.guards import get_current_active_user
-from src.db.db import get_async_session
-from src.domains.book.constants import ORDER_COLUMN_MAP
-from src.domains.book.models import Book
+from src.db.db import get_async_session, get_primary_read_session
 from src.domains.book.schema import BookWithReadingStatusReadSchema
 from src.domains.reading_status.models import ReadingStatus
+from src.domains.reading_status.repository import (
+    list_books_with_status,
+    remove_reading_statuses,
+    set_reading_statuses,
+)
 from src.domains.reading_status.schema import (
+    ReadingStatusBatchResultSchema,
+    ReadingStatusBatchSchema,
     ReadingStatusCreateSchema,
     ReadingStatusFiltersSchema,
     ReadingStatusOrderSchema,
@@ -20,8 +24,7 @@ from src.domains.reading_status.schema import (
     ReadingStatusReadSchema,
 )
 from src.domains.user.schema import UserReadSchema
-from src.exceptions.entity import EntityAlreadyExists, EntityNotFound
-from src.utils.request_builder import apply_ordering
+from src.exceptions.entity import EntityNotFound
 
 router = APIRouter(prefix="/book")
 
@@ -31,21 +34,12 @@ router = APIRouter(prefix="/book")
     summary="Получить список книг текущего пользователя со статусом чтения",
 )
 async def get_all(
-    session: Annotated[AsyncSession, Depends(get_async_session)],
+    session: Annotated[AsyncSession, Depends(get_primary_read_session)],
     current_user: Annotated[UserReadSchema, Depends(get_current_active_user)],
     filters: Annotated[ReadingStatusFiltersSchema, Depends()],
     order: Annotated[ReadingStatusOrderSchema, Depends()],
 ) -> list[BookWithReadingStatusReadSchema]:
-    stmt = select(Book, ReadingStatus.status).join(ReadingStatus).where(ReadingStatus.user_id == current_user.id)
-    stmt = apply_ordering(stmt, order, ORDER_COLUMN_MAP)
-
-    if filters.status:
-        stmt = stmt.where(ReadingStatus.status == filters.status)
-
-    result = await session.execute(stmt)
-    books = result.all()
-
-    return [BookWithReadingStatusReadSchema.from_orm_with_status(book, status) for book, status in books]
+    return await list_books_with_status(session, current_user.id, filters, order)
 
 
 @router.get(
@@ -53,7 +47,7 @@ async def get_all(
     summary="Получить статус чтения книги текущего пользователя",
 )
 async def get_reading_status(
-    session: Annotated[AsyncSession, Depends(get_async_session)],
+    session: Annotated[AsyncSession, Depends(get_primary_read_session)],
     current_user: Annotated[UserReadSchema, Depends(get_current_active_user)],
     book_id: Annotated[uuid.UUID, Path(..., description="ID книги")],
 ) -> ReadingStatusReadSchema:
@@ -77,36 +71,45 @@ async def get_reading_status(
     "/reading-status",
     status_code=status.HTTP_201_CREATED,
     summary="Установить статус чтения книги для текущего пользователя",
+    description="Если статус уже установлен, он будет заменен",
 )
 async def set_reading_status(
     session: Annotated[AsyncSession, Depends(get_async_session)],
     current_user: Annotated[UserReadSchema, Depends(get_current_active_user)],
     reading_status_data: ReadingStatusCreateSchema,
 ) -> None:
-    status = ReadingStatus(
-        user_id=current_user.id,
-        **reading_status_data.model_dump(),
+    updated = await set_reading_statuses(
+        session,
+        current_user.id,
+        {reading_status_data.book_id: reading_status_data.status},
     )
+    if not updated:
+        raise EntityNotFound({"id": reading_status_data.book_id}, entity_name="book")
+
+    await session.commit()
+
 
-    session.add(status)
-
-    try:
-        await session.commit()
-    except IntegrityError as err:
-        await session.rollback()
-        msg = str(getattr(err, "orig", err))
-
-        if "uc_user_book" in msg:
-            raise EntityAlreadyExists(
-                {"user_id": current_user.id, "book_id": reading_status_data.book_id},
-                entity_name="reading_status",
-            ) from None
-
-        if "reading_status_book_id_fkey" in msg:
-            raise EntityNotFound(
-                {"id": reading_status_data.book_id},
-                entity_name="book",
-            ) from None
+@router.post(
+    "/reading-status/batch",
+    summary="Установить и удалить статусы чтения для нескольких книг одним запросом",
+)
+async def set_reading_statuses_batch(
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+    current_user: Annotated[UserReadSchema, Depends(get_current_active_user)],
+    batch: ReadingStatusBatchSchema,
+) -> ReadingStatusBatchResultSchema:
+    statuses = {item.book_id: item.status for item in batch.statuses}
+
+    removed = await remove_reading_statuses(session, current_user.id, set(batch.remove))
+    updated = await set_reading_statuses(session, current_user.id, statuses)
+
+    await session.commit()
+
+    return ReadingStatusBatchResultSchema(
+        updated=[book_id for book_id in statuses if book_id in updated],
+        removed=[book_id for book_id in dict.fromkeys(batch.remove) if book_id in removed],
+        not_found=[book_id for book_id in statuses if book_id not in updated],
+    )
 
 
 @router.patch(
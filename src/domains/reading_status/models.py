@@ -1,7 +1,7 @@
 import uuid
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, Integer, UniqueConstraint
+from sqlalchemy import ForeignKey, Index, Integer, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -16,7 +16,11 @@ if TYPE_CHECKING:
 class ReadingStatus(Base, BaseModelMixin):
     __tablename__ = "reading_status"
 
-    __table_args__ = (UniqueConstraint("user_id", "book_id", name="uc_user_book"),)
+    __table_args__ = (
+        UniqueConstraint("user_id", "book_id", name="uc_user_book"),
+        # A user's books with a given status, without visiting the table for the book ids
+        Index("ix_reading_status_user_id_status", "user_id", "status", postgresql_include=["book_id"]),
+    )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
         PG_UUID(as_uuid=True),
@@ -32,6 +36,6 @@ class ReadingStatus(Base, BaseModelMixin):
 
     status: Mapped[BookReadingStatus | None] = mapped_column(Integer, nullable=True)
 
-    users: Mapped["User"] = relationship("User", back_populates="reading_books")
+    users: Mapped["User"] = relationship("User", back_populates="reading_books", lazy="raise_on_sql")
 
-    books: Mapped["Book"] = relationship("Book", back_populates="reading_users")
+    books: Mapped["Book"] = relationship("Book", back_populates="reading_users", lazy="raise_on_sql")
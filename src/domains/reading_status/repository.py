@@ -0,0 +1,84 @@
+import uuid
+from collections.abc import Collection, Mapping
+
+from sqlalchemy import case, delete, func, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.constants.reading_status import BookReadingStatus
+from src.db.dialect import dialect_insert
+from src.domains.book.constants import ORDER_COLUMN_MAP
+from src.domains.book.models import Book
+from src.domains.book.schema import BookWithReadingStatusReadSchema
+from src.domains.reading_status.models import ReadingStatus
+from src.domains.reading_status.schema import ReadingStatusFiltersSchema, ReadingStatusOrderSchema
+from src.utils.request_builder import apply_ordering
+
+
+async def list_books_with_status(
+    session: AsyncSession,
+    user_id: uuid.UUID,
+    filters: ReadingStatusFiltersSchema,
+    order: ReadingStatusOrderSchema,
+) -> list[BookWithReadingStatusReadSchema]:
+    stmt = select(Book, ReadingStatus.status).join(ReadingStatus).where(ReadingStatus.user_id == user_id)
+    stmt = apply_ordering(stmt, order, ORDER_COLUMN_MAP)
+
+    if filters.status:
+        stmt = stmt.where(ReadingStatus.status == filters.status)
+
+    result = await session.execute(stmt)
+
+    return [BookWithReadingStatusReadSchema.from_orm_with_status(book, status) for book, status in result.all()]
+
+
+async def set_reading_statuses(
+    session: AsyncSession,
+    user_id: uuid.UUID,
+    statuses: Mapping[uuid.UUID, BookReadingStatus],
+) -> set[uuid.UUID]:
+    """Upsert statuses by book id in one statement; return the ids of existing books.
+
+    The rows come from an `INSERT ... SELECT` over `book`, so ids without a book are filtered by the
+    `SELECT` and `ON CONFLICT DO UPDATE` replaces existing statuses: retries never abort the transaction.
+    """
+
+    if not statuses:
+        return set()
+
+    new_ids = {book_id: literal(uuid.uuid7(), ReadingStatus.id.type) for book_id in statuses}
+    new_statuses = {book_id: literal(status, ReadingStatus.status.type) for book_id, status in statuses.items()}
+    stmt = dialect_insert(session)(ReadingStatus).from_select(
+        ["id", "user_id", "book_id", "status", "create_at", "update_at"],
+        select(
+            case(new_ids, value=Book.id),
+            literal(user_id, ReadingStatus.user_id.type),
+            Book.id,
+            case(new_statuses, value=Book.id),
+            func.now(),
+            func.now(),
+        ).where(Book.id.in_(statuses.keys())),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ReadingStatus.user_id, ReadingStatus.book_id],
+        set_={"status": stmt.excluded.status, "update_at": stmt.excluded.update_at},
+    )
+    result = await session.execute(stmt.returning(ReadingStatus.book_id))
+    return set(result.scalars())
+
+
+async def remove_reading_statuses(
+    session: AsyncSession,
+    user_id: uuid.UUID,
+    book_ids: Collection[uuid.UUID],
+) -> set[uuid.UUID]:
+    """Delete statuses for `book_ids` in one statement; return the ids that had one."""
+
+    if not book_ids:
+        return set()
+
+    result = await session.execute(
+        delete(ReadingStatus)
+        .where(ReadingStatus.user_id == user_id, ReadingStatus.book_id.in_(book_ids))
+        .returning(ReadingStatus.book_id)
+    )
+    return set(result.scalars())
@@ -2,6 +2,7 @@ import uuid
 
 from pydantic import ConfigDict, Field
 
+from src.constants.batch import MAX_BATCH_SIZE
 from src.constants.reading_status import BookReadingStatus
 from src.domains.book.constants import BookOrderBy
 from src.domains.common.schema import BaseSchema, OrderBaseSchema
@@ -30,6 +31,25 @@ class ReadingStatusPathSchema(ReadingStatusCreateSchema):
     pass
 
 
+class ReadingStatusBatchSchema(BaseSchema):
+    statuses: list[ReadingStatusCreateSchema] = Field(
+        default_factory=list,
+        max_length=MAX_BATCH_SIZE,
+        description="Статусы для установки; для повторяющейся книги действует последний",
+    )
+    remove: list[uuid.UUID] = Field(
+        default_factory=list,
+        max_length=MAX_BATCH_SIZE,
+        description="ID книг, статус которых нужно удалить, применяется до установки",
+    )
+
+
+class ReadingStatusBatchResultSchema(BaseSchema):
+    updated: list[uuid.UUID] = Field(description="Книги, для которых установлен статус")
+    removed: list[uuid.UUID] = Field(description="Книги, статус которых удален")
+    not_found: list[uuid.UUID] = Field(description="Несуществующие книги")
+
+
 class ReadingStatusFiltersSchema(BaseSchema):
     status: BookReadingStatus
 
@@ -1,42 +1,79 @@
 import uuid
-from typing import Annotated
+from typing import Annotated, NoReturn
 
-from fastapi import APIRouter, Depends, HTTPException, Path, status
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy import delete, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.auth.guards import get_current_user
-from src.db.db import get_async_session
+from src.auth.guards import get_current_active_admin, get_current_user
+from src.cache.result_cache import entity_tag, result_cache
+from src.constants.pagination import NEXT_CURSOR_HEADER
+from src.db.db import get_async_session, get_read_session
+from src.db.request_queries import query_budget
+from src.domains.book.repository import update_book_stats, update_book_stats_for_review_patch
 from src.domains.review.models import Review
+from src.domains.review.repository import get_reviews_page, reviews_stream_statement
 from src.domains.review.schema import (
     ReviewCreateSchema,
+    ReviewFiltersSchema,
+    ReviewPageSchema,
     ReviewPatchSchema,
     ReviewReadSchema,
 )
 from src.domains.user.models import User
+from src.domains.user.schema import UserReadSchema
 from src.exceptions.entity import EntityNotFound
+from src.export.constants import EXPORT_MEDIA_TYPES, ExportFormat
+from src.export.utils import stream_rows
 
 router = APIRouter()
 
 
+async def _raise_for_missing_review(session: AsyncSession, review_id: uuid.UUID, action: str) -> NoReturn:
+    """Tell a missing review from someone else's once an ownership-checked write matched no row."""
+
+    if await session.scalar(select(Review.id).where(Review.id == review_id)) is None:
+        raise EntityNotFound({"id": review_id}, entity_name="review")
+
+    raise HTTPException(status_code=403, detail=f"You can only {action} your own reviews")
+
+
 @router.get(
     "/",
-    summary="Получить список всех отзывов",
+    summary="Получить страницу отзывов, новые первыми",
+    description="Следующая страница запрашивается с курсором из заголовка X-Next-Cursor",
 )
+@query_budget(1)
 async def get_all(
-    session: Annotated[AsyncSession, Depends(get_async_session)],
-    book_id: uuid.UUID | None = None,
+    session: Annotated[AsyncSession, Depends(get_read_session)],
+    page: Annotated[ReviewPageSchema, Depends()],
+    response: Response,
 ) -> list[ReviewReadSchema]:
-    stmt = select(Review).order_by(Review.create_at.desc())
+    reviews, next_cursor = await get_reviews_page(session, page)
 
-    if book_id:
-        stmt = stmt.where(Review.book_id == book_id)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
 
-    result = await session.execute(stmt)
-    reviews = result.scalars().all()
+    return reviews
 
-    return [ReviewReadSchema.model_validate(review) for review in reviews]
+
+@router.get(
+    "/stream",
+    summary="Выгрузить все подходящие отзывы потоком NDJSON или CSV, новые первыми",
+    response_class=StreamingResponse,
+)
+async def stream(
+    _: Annotated[UserReadSchema, Depends(get_current_active_admin)],
+    session: Annotated[AsyncSession, Depends(get_read_session)],
+    filters: Annotated[ReviewFiltersSchema, Depends()],
+    format: Annotated[ExportFormat, Query(description="Формат выгрузки")] = ExportFormat.ndjson,
+) -> StreamingResponse:
+    return StreamingResponse(
+        stream_rows(session, reviews_stream_statement(filters), format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+    )
 
 
 @router.get(
@@ -45,7 +82,7 @@ async def get_all(
 )
 async def get_by_id(
     review_id: Annotated[uuid.UUID, Path(..., description="ID отзыва")],
-    session: Annotated[AsyncSession, Depends(get_async_session)],
+    session: Annotated[AsyncSession, Depends(get_read_session)],
 ) -> ReviewReadSchema:
     review = await session.get(Review, review_id)
 
@@ -73,13 +110,16 @@ async def create(
     session.add(review)
 
     try:
-        await session.commit()
+        await session.flush()
     except IntegrityError:
         await session.rollback()
         raise EntityNotFound(
             {"book_id": review_in.book_id}, entity_name="book"
         ) from None
 
+    await update_book_stats(session, review.book_id, added=[(review.rating, review.text)])
+    await session.commit()
+    await result_cache.invalidate(entity_tag("book", review.book_id))
     await session.refresh(review)
 
     return ReviewReadSchema.model_validate(review)
@@ -95,25 +135,22 @@ async def patch(
     current_user: Annotated[User, Depends(get_current_user)],
     session: Annotated[AsyncSession, Depends(get_async_session)],
 ) -> ReviewReadSchema:
-    review = await session.get(Review, review_id)
+    update_data = review_in.model_dump(exclude_unset=True)
 
-    if review is None:
-        raise EntityNotFound({"id": review_id}, entity_name="review")
-
-    if review.user_id != current_user.id:
-        raise HTTPException(
-            status_code=403, detail="You can only update your own reviews"
-        )
-
-    stmt = (
+    await update_book_stats_for_review_patch(session, review_id, current_user.id, update_data)
+    result = await session.execute(
         update(Review)
-        .where(Review.id == review_id)
-        .values(**review_in.model_dump(exclude_unset=True))
+        .where(Review.id == review_id, Review.user_id == current_user.id)
+        .values(**update_data)
+        .returning(Review)
     )
+    review = result.scalar_one_or_none()
+
+    if review is None:
+        await _raise_for_missing_review(session, review_id, "update")
 
-    await session.execute(stmt)
     await session.commit()
-    await session.refresh(review)
+    await result_cache.invalidate(entity_tag("book", review.book_id))
 
     return ReviewReadSchema.model_validate(review)
 
@@ -128,16 +165,16 @@ async def delete_by_id(
     current_user: Annotated[User, Depends(get_current_user)],
     session: Annotated[AsyncSession, Depends(get_async_session)],
 ) -> None:
-    review = await session.get(Review, review_id)
+    stmt = (
+        delete(Review)
+        .where(Review.id == review_id, Review.user_id == current_user.id)
+        .returning(Review.book_id, Review.rating, Review.text)
+    )
+    review = (await session.execute(stmt)).one_or_none()
 
     if review is None:
-        raise EntityNotFound({"id": review_id}, entity_name="review")
-
-    if review.user_id != current_user.id:
-        raise HTTPException(
-            status_code=403, detail="You can only delete your own reviews"
-        )
+        await _raise_for_missing_review(session, review_id, "delete")
 
-    stmt = delete(Review).where(Review.id == review_id)
-    await session.execute(stmt)
+    await update_book_stats(session, review.book_id, removed=[(review.rating, review.text)])
     await session.commit()
+    await result_cache.invalidate(entity_tag("book", review.book_id))
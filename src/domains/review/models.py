@@ -1,7 +1,7 @@
 import uuid
 from typing import TYPE_CHECKING
 
-from sqlalchemy import CheckConstraint, ForeignKey, Integer, Text
+from sqlalchemy import CheckConstraint, ForeignKey, Index, Integer, Text
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -30,5 +30,19 @@ class Review(Base, BaseModelMixin):
 
     __table_args__ = (CheckConstraint("rating >= 1 AND rating <= 5", name="check_rating_range"),)
 
-    user: Mapped["User"] = relationship("User", back_populates="reviews")
-    book: Mapped["Book"] = relationship("Book", back_populates="reviews")
+    user: Mapped["User"] = relationship("User", back_populates="reviews", lazy="raise_on_sql")
+    book: Mapped["Book"] = relationship("Book", back_populates="reviews", lazy="raise_on_sql")
+
+
+# Newest-first listings per book and per user, in the (create_at, id) keyset order
+Index("ix_review_book_id_create_at", Review.book_id, Review.create_at.desc(), Review.id.desc())
+Index("ix_review_user_id_create_at", Review.user_id, Review.create_at.desc(), Review.id.desc())
+# Written reviews only, for listings that skip bare ratings
+Index(
+    "ix_review_book_id_create_at_with_text",
+    Review.book_id,
+    Review.create_at.desc(),
+    Review.id.desc(),
+    postgresql_where=Review.text != "",
+    sqlite_where=Review.text != "",
+)
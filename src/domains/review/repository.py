@@ -0,0 +1,53 @@
+from typing import Any
+
+from sqlalchemy import Select, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.constants.order_direction import OrderDirection
+from src.domains.review.models import Review
+from src.domains.review.schema import ReviewFiltersSchema, ReviewPageSchema, ReviewReadSchema
+from src.export.constants import EXPORT_COLUMNS, ExportEntity
+from src.utils.cursor import decode_cursor, encode_cursor
+from src.utils.request_builder import apply_keyset_pagination
+
+# Newest first; served by the (book_id | user_id, create_at DESC, id DESC) indexes
+KEY_COLUMNS = [Review.create_at, Review.id]
+
+
+def _filter_reviews(stmt: Select[Any], filters: ReviewFiltersSchema) -> Select[Any]:
+    if filters.book_id:
+        stmt = stmt.where(Review.book_id == filters.book_id)
+
+    if filters.user_id:
+        stmt = stmt.where(Review.user_id == filters.user_id)
+
+    if filters.with_text:
+        # Same predicate as the partial ix_review_book_id_create_at_with_text; NULL fails it too.
+        # A literal rather than a bound '', which a generic plan could not match to the index
+        stmt = stmt.where(Review.text != literal_column("''"))
+
+    return stmt
+
+
+async def get_reviews_page(
+    session: AsyncSession,
+    page: ReviewPageSchema,
+) -> tuple[list[ReviewReadSchema], str | None]:
+    after = decode_cursor(page.cursor, KEY_COLUMNS) if page.cursor else None
+    stmt = apply_keyset_pagination(_filter_reviews(select(Review), page), KEY_COLUMNS, OrderDirection.desc, after)
+
+    result = await session.execute(stmt.limit(page.limit))
+    reviews = result.scalars().all()
+
+    next_cursor = None
+    if len(reviews) == page.limit:
+        next_cursor = encode_cursor([reviews[-1].create_at, reviews[-1].id])
+
+    return [ReviewReadSchema.model_validate(review) for review in reviews], next_cursor
+
+
+def reviews_stream_statement(filters: ReviewFiltersSchema) -> Select[Any]:
+    """All matching reviews as export rows, in page order."""
+
+    stmt = _filter_reviews(select(*EXPORT_COLUMNS[ExportEntity.reviews]), filters)
+    return apply_keyset_pagination(stmt, KEY_COLUMNS, OrderDirection.desc, None)
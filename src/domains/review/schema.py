@@ -1,8 +1,9 @@
 import uuid
 from datetime import datetime
 
-from pydantic import ConfigDict, Field
+from pydantic import ConfigDict, Field, field_validator
 
+from src.constants.pagination import DEFAULT_PAGINATION_LIMIT, MAX_PAGINATION_LIMIT
 from src.domains.common.schema import BaseSchema
 
 
@@ -22,6 +23,14 @@ class ReviewPatchSchema(BaseSchema):
     rating: int | None = Field(None, ge=1, le=5, description="Оценка книги от 1 до 5")
     text: str | None = Field(None, description="Текстовый отзыв на книгу")
 
+    @field_validator("rating")
+    @classmethod
+    def rating_not_null(cls, value: int | None) -> int:
+        # Only an explicit null gets here: an omitted rating keeps the default without validation
+        if value is None:
+            raise ValueError("rating cannot be null")
+        return value
+
 
 class ReviewReadSchema(ReviewBaseSchema):
 
@@ -43,3 +52,16 @@ class ReviewWithUserSchema(ReviewBaseSchema):
     created_at: str
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class ReviewFiltersSchema(BaseSchema):
+
+    book_id: uuid.UUID | None = Field(None, description="ID книги")
+    user_id: uuid.UUID | None = Field(None, description="ID автора отзыва")
+    with_text: bool = Field(False, description="Только отзывы с текстом")
+
+
+class ReviewPageSchema(ReviewFiltersSchema):
+
+    limit: int = Field(DEFAULT_PAGINATION_LIMIT, ge=1, le=MAX_PAGINATION_LIMIT)
+    cursor: str | None = Field(None, description="Значение X-Next-Cursor предыдущей страницы")
@@ -16,4 +16,4 @@ class Role(Base, BaseModelMixin):
     __tablename__ = "role"
 
     name: Mapped[UserRole] = mapped_column(String(30), nullable=False, unique=True)
-    users: Mapped[list[User]] = relationship("User", back_populates="role")
+    users: Mapped[list[User]] = relationship("User", back_populates="role", lazy="raise_on_sql")
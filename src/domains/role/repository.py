@@ -1,17 +1,18 @@
-from sqlalchemy import select
+import uuid
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.cache.reference_data import reference_data
 from src.constants.user_role import UserRole
-from src.domains.role.models import Role
 from src.exceptions.entity import EntityNotFound
 
 
-async def get_role_orm_by_name(session: AsyncSession, role_name: UserRole) -> Role:
-    stmt = select(Role).where(Role.name == role_name.value)
-    result = await session.execute(stmt)
-    role = result.scalar_one_or_none()
+async def get_role_id_by_name(session: AsyncSession, role_name: UserRole) -> uuid.UUID:
+    """Look the role up in the reference data snapshot; `session` is only used to refresh it."""
+
+    role_id = (await reference_data.get(session)).role_ids.get(role_name)
 
-    if role is None:
+    if role_id is None:
         raise EntityNotFound({"name": role_name}, "role")
 
-    return role
+    return role_id
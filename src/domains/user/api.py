@@ -1,4 +1,5 @@
 import uuid
+from collections import defaultdict
 from typing import Annotated, cast
 
 from fastapi import APIRouter, Depends, Path, status
@@ -8,10 +9,15 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from src.auth.cache import user_cache
 from src.auth.guards import get_current_active_user
 from src.auth.utils import get_password_hash
-from src.db.db import get_async_session
-from src.domains.role.repository import get_role_orm_by_name
+from src.cache.result_cache import entity_tag, result_cache
+from src.db.db import get_async_session, get_primary_read_session
+from src.db.request_queries import query_budget
+from src.domains.book.repository import update_book_stats
+from src.domains.review.models import Review
+from src.domains.role.repository import get_role_id_by_name
 from src.domains.user.constants import ORDER_COLUMN_MAP
 from src.domains.user.models import User
 from src.domains.user.repository import get_user_orm_by_id
@@ -25,7 +31,7 @@ from src.domains.user.schema import (
     UserUpdateSchema,
 )
 from src.exceptions.entity import EntityAlreadyExists, EntityNotFound
-from src.utils.request_builder import apply_ordering
+from src.utils.request_builder import apply_ordering, ilike_contains
 
 router = APIRouter()
 
@@ -34,8 +40,9 @@ router = APIRouter()
     "/",
     summary="Получить список пользователей",
 )
+@query_budget(2)
 async def get_all(
-    session: Annotated[AsyncSession, Depends(get_async_session)],
+    session: Annotated[AsyncSession, Depends(get_primary_read_session)],
     filters: Annotated[UserFiltersSchema, Depends()],
     order: Annotated[UserOrderSchema, Depends()],
 ) -> list[UserReadSchema]:
@@ -44,16 +51,16 @@ async def get_all(
     stmt = apply_ordering(stmt, order, ORDER_COLUMN_MAP)
 
     if filters.username:
-        stmt = stmt.where(User.username.ilike(f"%{filters.username}%"))
+        stmt = stmt.where(ilike_contains(User.username, filters.username))
 
     if filters.first_name:
-        stmt = stmt.where(User.first_name.ilike(f"%{filters.first_name}%"))
+        stmt = stmt.where(ilike_contains(User.first_name, filters.first_name))
 
     if filters.last_name:
-        stmt = stmt.where(User.last_name.ilike(f"%{filters.last_name}%"))
+        stmt = stmt.where(ilike_contains(User.last_name, filters.last_name))
 
     if filters.email:
-        stmt = stmt.where(User.email.ilike(f"%{filters.email}%"))
+        stmt = stmt.where(ilike_contains(User.email, filters.email))
 
     result = await session.execute(stmt)
     users = result.scalars().all()
@@ -77,7 +84,7 @@ async def get_me(
 )
 async def get_by_id(
     user_id: Annotated[uuid.UUID, Path(..., description="ID пользователя")],
-    session: Annotated[AsyncSession, Depends(get_async_session)],
+    session: Annotated[AsyncSession, Depends(get_primary_read_session)],
 ) -> UserReadSchema:
     user = await get_user_orm_by_id(session, user_id)
     return UserReadSchema.from_orm(user)
@@ -93,18 +100,18 @@ async def create_user(
     session: Annotated[AsyncSession, Depends(get_async_session)],
 ) -> UserReadSchema:
     try:
-        role = await get_role_orm_by_name(session, user_data.role)
-        hashed_password = get_password_hash(user_data.password.get_secret_value())
+        role_id = await get_role_id_by_name(session, user_data.role)
+        hashed_password = await get_password_hash(user_data.password.get_secret_value())
         user = User(
             **user_data.to_orm_dict(),
-            role=role,
+            role_id=role_id,
             hashed_password=hashed_password,
         )
 
         session.add(user)
         await session.commit()
 
-        return UserReadSchema.from_orm(user)
+        return UserReadSchema.model_validate({**user.__dict__, "role": user_data.role})
 
     except IntegrityError:
         raise EntityAlreadyExists(
@@ -131,6 +138,8 @@ async def patch_user(
         raise EntityNotFound({"id": user_id}, entity_name="user")
 
     await session.commit()
+    user_cache.invalidate(user_id)
+    await result_cache.invalidate(entity_tag("user", user_id))
     user = await get_user_orm_by_id(session, user_id)
 
     return UserReadSchema.from_orm(user)
@@ -158,6 +167,17 @@ async def delete_user(
     user_id: Annotated[uuid.UUID, Path(..., description="ID пользователя")],
     session: Annotated[AsyncSession, Depends(get_async_session)],
 ) -> None:
+    # Deleted here rather than by the ON DELETE CASCADE, so their books' stats can be updated
+    reviews = await session.execute(
+        delete(Review).where(Review.user_id == user_id).returning(Review.book_id, Review.rating, Review.text)
+    )
+    removed_by_book: defaultdict[uuid.UUID, list[tuple[int, str | None]]] = defaultdict(list)
+    for book_id, rating, text in reviews:
+        removed_by_book[book_id].append((rating, text))
+
+    for book_id, removed in removed_by_book.items():
+        await update_book_stats(session, book_id, removed=removed)
+
     stmt = delete(User).where(User.id == user_id).returning(User.id)
     result = await session.execute(stmt)
     deleted_ids = [row[0] for row in result]
@@ -166,6 +186,10 @@ async def delete_user(
         raise EntityNotFound({"id": user_id}, entity_name="user")
 
     await session.commit()
+    user_cache.invalidate(user_id)
+    await result_cache.invalidate(
+        entity_tag("user", user_id), *(entity_tag("book", book_id) for book_id in removed_by_book)
+    )
 
 
 @router.post(
@@ -178,9 +202,10 @@ async def assign_role_to_user(
     user_data: AssignUserRoleSchema,
     session: Annotated[AsyncSession, Depends(get_async_session)],
 ) -> None:
-    role_id = (await get_role_orm_by_name(session, user_data.role)).id
+    role_id = await get_role_id_by_name(session, user_data.role)
     user = await get_user_orm_by_id(session, user_id)
 
     user.role_id = role_id
     session.add(user)
     await session.commit()
+    user_cache.invalidate(user_id)
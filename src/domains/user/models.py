@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING
 from sqlalchemy import UUID, Boolean, DateTime, ForeignKey, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.domains.common.models import Base, BaseModelMixin
+from src.domains.common.models import Base, BaseModelMixin, trigram_index
 from src.domains.reading_status.models import ReadingStatus
 
 if TYPE_CHECKING:
@@ -16,6 +16,12 @@ if TYPE_CHECKING:
 
 class User(Base, BaseModelMixin):
     __tablename__ = "user"
+    __table_args__ = (
+        trigram_index("user", "username"),
+        trigram_index("user", "first_name"),
+        trigram_index("user", "last_name"),
+        trigram_index("user", "email"),
+    )
 
     username: Mapped[str] = mapped_column(String(64), nullable=False, unique=True)
     hashed_password: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -26,11 +32,15 @@ class User(Base, BaseModelMixin):
     password_changed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True, default=None)
     failed_login_attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     role_id: Mapped[uuid.UUID] = mapped_column(UUID, ForeignKey("role.id", ondelete="RESTRICT"), nullable=False)
-    role: Mapped[Role] = relationship("Role", back_populates="users")
+    role: Mapped[Role] = relationship("Role", back_populates="users", lazy="raise_on_sql")
 
-    favorites: Mapped[list[Favorites]] = relationship("Favorites", back_populates="user", cascade="all, delete-orphan")
-    reviews: Mapped[list["Review"]] = relationship("Review", back_populates="user", cascade="all, delete-orphan")
+    favorites: Mapped[list[Favorites]] = relationship(
+        "Favorites", back_populates="user", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql"
+    )
+    reviews: Mapped[list["Review"]] = relationship(
+        "Review", back_populates="user", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql"
+    )
 
     reading_books: Mapped[list["ReadingStatus"]] = relationship(
-        "ReadingStatus", back_populates="users", cascade="all, delete-orphan"
+        "ReadingStatus", back_populates="users", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql"
     )
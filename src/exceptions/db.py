@@ -0,0 +1,4 @@
+class QueryBudgetExceeded(Exception):
+    def __init__(self, handler: str, budget: int, count: int):
+        self.message = f"Handler {handler} issued {count} SQL statements, budget is {budget}"
+        super().__init__(self.message)
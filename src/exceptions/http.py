@@ -0,0 +1,8 @@
+from collections.abc import Mapping
+
+
+class NotModified(Exception):
+    def __init__(self, etag: str, headers: Mapping[str, str]):
+        self.message = f"Resource has not changed since {etag}"
+        self.headers = dict(headers)
+        super().__init__(self.message)
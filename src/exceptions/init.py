@@ -1,5 +1,5 @@
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
 from src.exceptions.auth import (
     AdminRoleRequired,
@@ -7,12 +7,15 @@ from src.exceptions.auth import (
     InactiveUser,
     IncorrectUsernamePassword,
 )
+from src.exceptions.db import QueryBudgetExceeded
 from src.exceptions.entity import (
     EntityAlreadyExists,
     EntityIntegrityException,
     EntityNotFound,
     NoDataToPatchEntity,
 )
+from src.exceptions.http import NotModified
+from src.exceptions.pagination import InvalidCursor
 
 
 def init_exception_handlers(app: FastAPI):
@@ -37,6 +40,24 @@ def init_exception_handlers(app: FastAPI):
             content={"message": exc.message},
         )
 
+    @app.exception_handler(QueryBudgetExceeded)
+    def query_budget_exceeded_handler(request, exc) -> JSONResponse:
+        return JSONResponse(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            content={"message": exc.message},
+        )
+
+    @app.exception_handler(InvalidCursor)
+    def invalid_cursor_handler(request, exc) -> JSONResponse:
+        return JSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content={"message": exc.message},
+        )
+
+    @app.exception_handler(NotModified)
+    def not_modified_handler(request, exc) -> Response:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=exc.headers)
+
     @app.exception_handler(InactiveUser)
     def inactive_user_handler(request, exc) -> JSONResponse:
         return JSONResponse(
@@ -0,0 +1,4 @@
+class InvalidCursor(Exception):
+    def __init__(self, cursor: str):
+        self.message = f"Invalid pagination cursor {cursor!r}"
+        super().__init__(self.message)
@@ -0,0 +1,32 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Path, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth.guards import get_current_active_admin
+from src.db.db import get_snapshot_session
+from src.domains.user.schema import UserReadSchema
+from src.export.constants import EXPORT_COLUMNS, EXPORT_MEDIA_TYPES, ExportEntity, ExportFormat
+from src.export.utils import stream_rows
+
+router = APIRouter()
+
+
+@router.get(
+    "/{entity}",
+    summary="Выгрузить все записи сущности потоком NDJSON или CSV",
+    response_class=StreamingResponse,
+)
+async def export_entity(
+    entity: Annotated[ExportEntity, Path(..., description="Выгружаемая сущность")],
+    _: Annotated[UserReadSchema, Depends(get_current_active_admin)],
+    session: Annotated[AsyncSession, Depends(get_snapshot_session)],
+    format: Annotated[ExportFormat, Query(description="Формат выгрузки")] = ExportFormat.ndjson,
+) -> StreamingResponse:
+    return StreamingResponse(
+        stream_rows(session, select(*EXPORT_COLUMNS[entity]), format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{entity}.{format}"'},
+    )
@@ -0,0 +1,74 @@
+from enum import StrEnum
+
+from sqlalchemy.orm import InstrumentedAttribute
+
+from src.domains.author.models import Author
+from src.domains.book.models import Book
+from src.domains.favorites.models import Favorites
+from src.domains.reading_status.models import ReadingStatus
+from src.domains.review.models import Review
+
+EXPORT_YIELD_PER = 1000
+
+
+class ExportFormat(StrEnum):
+    ndjson = "ndjson"
+    csv = "csv"
+
+
+EXPORT_MEDIA_TYPES: dict[ExportFormat, str] = {
+    ExportFormat.ndjson: "application/x-ndjson",
+    ExportFormat.csv: "text/csv",
+}
+
+
+class ExportEntity(StrEnum):
+    books = "books"
+    authors = "authors"
+    reviews = "reviews"
+    reading_statuses = "reading-statuses"
+    favorites = "favorites"
+
+
+EXPORT_COLUMNS: dict[ExportEntity, list[InstrumentedAttribute]] = {
+    ExportEntity.books: [
+        Book.id,
+        Book.title,
+        Book.description,
+        Book.genre_id,
+        Book.category_id,
+        Book.create_at,
+        Book.update_at,
+    ],
+    ExportEntity.authors: [
+        Author.id,
+        Author.first_name,
+        Author.last_name,
+        Author.birth_date,
+        Author.create_at,
+        Author.update_at,
+    ],
+    ExportEntity.reviews: [
+        Review.id,
+        Review.user_id,
+        Review.book_id,
+        Review.rating,
+        Review.text,
+        Review.create_at,
+        Review.update_at,
+    ],
+    ExportEntity.reading_statuses: [
+        ReadingStatus.id,
+        ReadingStatus.user_id,
+        ReadingStatus.book_id,
+        ReadingStatus.status,
+        ReadingStatus.create_at,
+        ReadingStatus.update_at,
+    ],
+    ExportEntity.favorites: [
+        Favorites.user_id,
+        Favorites.book_id,
+        Favorites.create_at,
+        Favorites.update_at,
+    ],
+}
@@ -0,0 +1,44 @@
+import csv
+import io
+import json
+from collections.abc import AsyncIterator, Sequence
+from typing import Any
+
+from pydantic_core import to_jsonable_python
+from sqlalchemy import Row, Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.export.constants import EXPORT_YIELD_PER, ExportFormat
+
+
+def encode_ndjson(rows: Sequence[Row[Any]]) -> bytes:
+    lines = (json.dumps(to_jsonable_python(row._asdict()), ensure_ascii=False) + "\n" for row in rows)
+    return "".join(lines).encode()
+
+
+def encode_csv(rows: Sequence[Sequence[Any]]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue().encode()
+
+
+async def stream_rows(
+    session: AsyncSession,
+    stmt: Select[Any],
+    format: ExportFormat,
+    yield_per: int = EXPORT_YIELD_PER,
+) -> AsyncIterator[bytes]:
+    """Encode the rows of `stmt` chunk by chunk from a server-side cursor.
+
+    Only one `yield_per` partition is held at a time and the next one is fetched when the
+    response has sent the previous chunk, so a slow client pauses the cursor.
+    """
+
+    if format == ExportFormat.csv:
+        yield encode_csv([[column.key for column in stmt.selected_columns]])
+
+    encode = encode_csv if format == ExportFormat.csv else encode_ndjson
+    result = await session.stream(stmt.execution_options(yield_per=yield_per))
+
+    async for partition in result.partitions():
+        yield encode(partition)
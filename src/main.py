@@ -1,13 +1,40 @@
+import logging
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from sqlalchemy.exc import SQLAlchemyError
 
 from src.api.v1.init import init_routers
+from src.cache.reference_data import reference_data
+from src.db.db import async_session_maker
+from src.db.request_queries import QueryCountMiddleware
+from src.db.routing import ReadYourWritesMiddleware
 from src.exceptions.init import init_exception_handlers
+from src.setting import settings
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
+    try:
+        async with async_session_maker() as session:
+            await reference_data.get(session)
+    except (OSError, SQLAlchemyError):
+        # Not fatal: the first request that needs the snapshot loads it
+        logger.warning("Could not load reference data at startup", exc_info=True)
+    yield
+
 
 app = FastAPI(
     docs_url="/api/docs",
     openapi_url="/api/openapi.json",
+    lifespan=lifespan,
 )
 
+app.add_middleware(ReadYourWritesMiddleware, window_seconds=settings.read_your_writes_seconds)
+app.add_middleware(QueryCountMiddleware, n_plus_one_threshold=settings.n_plus_one_threshold)
+
 init_routers(app)
 init_exception_handlers(app)
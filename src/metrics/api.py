@@ -0,0 +1,44 @@
+from typing import Annotated, Any
+
+from fastapi import APIRouter, Depends, Query
+
+from src.auth.guards import get_current_active_admin
+from src.db.query_stats import query_stats
+from src.domains.user.schema import UserReadSchema
+from src.metrics.constants import DEFAULT_QUERY_STATS_LIMIT, MAX_QUERY_STATS_LIMIT, QueryStatsOrder
+from src.metrics.registry import registry
+from src.metrics.schema import QueryStatSchema
+
+router = APIRouter()
+
+
+@router.get(
+    "/",
+    summary="Получить метрики текущего процесса",
+)
+async def get_metrics(
+    _: Annotated[UserReadSchema, Depends(get_current_active_admin)],
+) -> dict[str, Any]:
+    return registry.snapshot()
+
+
+@router.get(
+    "/queries",
+    summary="Получить самые тяжелые запросы к БД",
+)
+async def get_query_stats(
+    _: Annotated[UserReadSchema, Depends(get_current_active_admin)],
+    limit: Annotated[int, Query(ge=1, le=MAX_QUERY_STATS_LIMIT)] = DEFAULT_QUERY_STATS_LIMIT,
+    order_by: Annotated[QueryStatsOrder, Query(description="Поле сортировки")] = QueryStatsOrder.total_time,
+) -> list[QueryStatSchema]:
+    return [
+        QueryStatSchema(
+            fingerprint=stat.fingerprint,
+            calls=stat.calls,
+            total_ms=round(stat.total_seconds * 1000, 3),
+            mean_ms=round(stat.mean_seconds * 1000, 3),
+            max_ms=round(stat.max_seconds * 1000, 3),
+            rows=stat.rows,
+        )
+        for stat in query_stats.top(limit, order_by)
+    ]
@@ -0,0 +1,12 @@
+from enum import StrEnum
+
+DEFAULT_QUERY_STATS_LIMIT = 20
+MAX_QUERY_STATS_LIMIT = 200
+
+
+class QueryStatsOrder(StrEnum):
+    total_time = "total_time"
+    mean_time = "mean_time"
+    max_time = "max_time"
+    calls = "calls"
+    rows = "rows"
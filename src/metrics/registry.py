@@ -0,0 +1,147 @@
+"""In-process metrics: counters, gauges and histograms with optional labels.
+
+Values live in the worker process; `registry.snapshot()` is exposed to admins by
+`src/metrics/api.py`.
+"""
+
+import bisect
+import threading
+from typing import Any, TypeVar
+
+Labels = tuple[tuple[str, str], ...]
+
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _labels_key(labels: dict[str, Any]) -> Labels:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+class Metric:
+    type = "untyped"
+
+    def __init__(self, name: str, description: str) -> None:
+        self.name = name
+        self.description = description
+        self._lock = threading.Lock()
+        self._values: dict[Labels, Any] = {}
+
+    def _value_snapshot(self, value: Any) -> Any:
+        return value
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            values = [
+                {"labels": dict(labels), "value": self._value_snapshot(value)} for labels, value in self._values.items()
+            ]
+        return {"type": self.type, "description": self.description, "values": values}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        key = _labels_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: Any) -> float:
+        return self._values.get(_labels_key(labels), 0)
+
+
+class Gauge(Metric):
+    type = "gauge"
+
+    def set(self, value: float, **labels: Any) -> None:
+        with self._lock:
+            self._values[_labels_key(labels)] = value
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        key = _labels_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+    def value(self, **labels: Any) -> float:
+        return self._values.get(_labels_key(labels), 0)
+
+
+class _HistogramValue:
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(self, name: str, description: str, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        super().__init__(name, description)
+        self.buckets = buckets
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = _labels_key(labels)
+        with self._lock:
+            histogram = self._values.get(key)
+            if histogram is None:
+                histogram = self._values[key] = _HistogramValue(self.buckets)
+            histogram.counts[bisect.bisect_left(self.buckets, value)] += 1
+            histogram.sum += value
+            histogram.count += 1
+
+    def count(self, **labels: Any) -> int:
+        histogram = self._values.get(_labels_key(labels))
+        return histogram.count if histogram else 0
+
+    def _value_snapshot(self, value: _HistogramValue) -> dict[str, Any]:
+        cumulative, buckets = 0, {}
+        for bound, count in zip([*self.buckets, float("inf")], value.counts, strict=True):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+        return {"buckets": buckets, "sum": value.sum, "count": value.count}
+
+
+TMetric = TypeVar("TMetric", bound=Metric)
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, metric_class: type[TMetric], name: str, *args: Any) -> TMetric:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = metric_class(name, *args)
+        if not isinstance(metric, metric_class):
+            raise ValueError(f"Metric {name!r} is already registered as a {metric.type}")
+        return metric
+
+    def counter(self, name: str, description: str) -> Counter:
+        return self._get_or_create(Counter, name, description)
+
+    def gauge(self, name: str, description: str) -> Gauge:
+        return self._get_or_create(Gauge, name, description)
+
+    def histogram(self, name: str, description: str, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, description, buckets)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {name: metric.snapshot() for name, metric in sorted(self._metrics.items())}
+
+    def clear(self) -> None:
+        """Reset every value, keeping the registered metrics."""
+
+        for metric in self._metrics.values():
+            metric.clear()
+
+
+registry = MetricsRegistry()
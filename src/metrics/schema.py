@@ -0,0 +1,12 @@
+from pydantic import Field
+
+from src.domains.common.schema import BaseSchema
+
+
+class QueryStatSchema(BaseSchema):
+    fingerprint: str = Field(description="Текст запроса с параметрами и литералами, замененными на ?")
+    calls: int = Field(description="Число выполнений")
+    total_ms: float = Field(description="Суммарное время выполнения, мс")
+    mean_ms: float = Field(description="Среднее время выполнения, мс")
+    max_ms: float = Field(description="Максимальное время выполнения, мс")
+    rows: int = Field(description="Суммарное число возвращенных или измененных строк")
@@ -11,6 +11,25 @@ class Settings(BaseSettings):
     postgres_db: str = Field("fastapi_db", alias="POSTGRES_DB")
     postgres_host: str = Field("db", alias="POSTGRES_HOST")
     postgres_port: int = Field(5432, alias="POSTGRES_PORT")
+    postgres_replica_host: str | None = Field(None, alias="POSTGRES_REPLICA_HOST")
+    postgres_replica_port: int = Field(5432, alias="POSTGRES_REPLICA_PORT")
+    read_your_writes_seconds: float = Field(5, ge=0, alias="READ_YOUR_WRITES_SECONDS")
+    db_pgbouncer: bool = Field(False, alias="DB_PGBOUNCER")
+    db_export_deferrable: bool = Field(True, alias="DB_EXPORT_DEFERRABLE")
+    db_echo: bool = Field(False, alias="DB_ECHO")
+    slow_query_threshold_ms: float = Field(200, ge=0, alias="SLOW_QUERY_THRESHOLD_MS")
+    query_stats_sample_rate: float = Field(1.0, ge=0, le=1, alias="QUERY_STATS_SAMPLE_RATE")
+    query_stats_max_fingerprints: int = Field(1000, ge=1, alias="QUERY_STATS_MAX_FINGERPRINTS")
+    n_plus_one_threshold: int = Field(5, ge=2, alias="N_PLUS_ONE_THRESHOLD")
+    query_budget_enforce: bool = Field(False, alias="QUERY_BUDGET_ENFORCE")
+    db_pool_size: int = Field(10, ge=1, alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(5, ge=0, alias="DB_MAX_OVERFLOW")
+    db_pool_timeout: float = Field(10, gt=0, alias="DB_POOL_TIMEOUT")
+    db_pool_recycle: int = Field(1800, alias="DB_POOL_RECYCLE")
+    db_pool_pre_ping: bool = Field(True, alias="DB_POOL_PRE_PING")
+    db_application_name: str = Field("digital_library", alias="DB_APPLICATION_NAME")
+    db_statement_timeout_ms: int = Field(0, ge=0, alias="DB_STATEMENT_TIMEOUT_MS")
+    db_idle_in_transaction_timeout_ms: int = Field(0, ge=0, alias="DB_IDLE_IN_TRANSACTION_TIMEOUT_MS")
 
     # App
     port: int = Field(8000, alias="PORT")
@@ -23,6 +42,21 @@ class Settings(BaseSettings):
     jwt_algorithm: str = Field("HS256", alias="JWT_ALGORITHM")
     access_token_type: str = "bearer"
     access_token_expire_minutes: int = Field(30, alias="ACCESS_TOKEN_EXPIRE_MINUTES")
+    user_cache_ttl_seconds: float = Field(60, alias="USER_CACHE_TTL_SECONDS")
+    user_cache_max_size: int = Field(10_000, alias="USER_CACHE_MAX_SIZE")
+    password_hash_workers: int = Field(4, ge=1, alias="PASSWORD_HASH_WORKERS")
+
+    # Repository result cache
+    result_cache_enabled: bool = Field(True, alias="RESULT_CACHE_ENABLED")
+    result_cache_redis_url: str | None = Field(None, alias="RESULT_CACHE_REDIS_URL")
+    result_cache_key_prefix: str = Field("digital_library", alias="RESULT_CACHE_KEY_PREFIX")
+    result_cache_max_size: int = Field(10_000, ge=1, alias="RESULT_CACHE_MAX_SIZE")
+    result_cache_ttl_seconds: float = Field(60, gt=0, alias="RESULT_CACHE_TTL_SECONDS")
+    result_cache_stale_seconds: float = Field(0, ge=0, alias="RESULT_CACHE_STALE_SECONDS")
+
+    # Genres, categories and roles snapshot
+    reference_data_check_seconds: float = Field(5, ge=0, alias="REFERENCE_DATA_CHECK_SECONDS")
+    reference_data_max_age_seconds: int = Field(3600, ge=0, alias="REFERENCE_DATA_MAX_AGE_SECONDS")
 
     # URLs
     api_base_prefix: str = Field("/api/v1")
@@ -44,5 +78,28 @@ class Settings(BaseSettings):
             f"@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
         )
 
+    @property
+    def db_replica_dsn(self) -> str | None:
+        """DSN of the read replica, or None to serve reads from the primary."""
+
+        if not self.postgres_replica_host:
+            return None
+
+        return (
+            f"postgresql+asyncpg://{self.postgres_user}:{self.postgres_password}"
+            f"@{self.postgres_replica_host}:{self.postgres_replica_port}/{self.postgres_db}"
+        )
+
+    @property
+    def db_server_settings(self) -> dict[str, str]:
+        """Session parameters sent by asyncpg when it opens a connection; 0 keeps the server default."""
+
+        server_settings = {"application_name": self.db_application_name}
+        if self.db_statement_timeout_ms:
+            server_settings["statement_timeout"] = str(self.db_statement_timeout_ms)
+        if self.db_idle_in_transaction_timeout_ms:
+            server_settings["idle_in_transaction_session_timeout"] = str(self.db_idle_in_transaction_timeout_ms)
+        return server_settings
+
 
 settings = Settings.model_validate({})
@@ -0,0 +1,65 @@
+import base64
+import json
+import uuid
+from collections.abc import Sequence
+from datetime import date, datetime
+from typing import Any
+
+from sqlalchemy import ColumnElement
+from sqlalchemy.orm import InstrumentedAttribute
+
+from src.exceptions.pagination import InvalidCursor
+
+
+def _dump_value(value: Any) -> Any:
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def _load_value(value: Any, column: ColumnElement[Any] | InstrumentedAttribute) -> Any:
+    python_type = column.type.python_type
+    if python_type is uuid.UUID:
+        return uuid.UUID(value)
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    if python_type is float and isinstance(value, int):
+        return float(value)
+    if not isinstance(value, python_type):
+        raise TypeError(value)
+    return value
+
+
+def encode_cursor(values: Sequence[Any], order: str | None = None) -> str:
+    """Pack the sort-key values of the last row of a page into an opaque url-safe token.
+
+    `order` names the ordering that produced the page; `decode_cursor` rejects the token for any other.
+    """
+
+    payload = json.dumps({"order": order, "keys": [_dump_value(value) for value in values]}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(
+    cursor: str,
+    columns: Sequence[ColumnElement[Any] | InstrumentedAttribute],
+    order: str | None = None,
+) -> list[Any]:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+
+        if not isinstance(payload, dict) or payload.get("order") != order:
+            raise ValueError(cursor)
+
+        values = payload.get("keys")
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError(cursor)
+
+        return [_load_value(value, column) for value, column in zip(values, columns, strict=True)]
+
+    except (ValueError, TypeError, AttributeError):
+        raise InvalidCursor(cursor) from None
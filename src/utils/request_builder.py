@@ -1,6 +1,7 @@
+from collections.abc import Sequence
 from typing import Any, TypeVar
 
-from sqlalchemy import Select
+from sqlalchemy import ColumnElement, Select, literal, tuple_
 from sqlalchemy.orm import InstrumentedAttribute
 
 from src.constants.order_direction import OrderDirection
@@ -8,6 +9,8 @@ from src.domains.common.schema import OrderBaseSchema
 
 TRow = TypeVar("TRow", bound=tuple)
 
+LIKE_ESCAPE_CHAR = "\\"
+
 
 def apply_ordering(
     stmt: Select[TRow],
@@ -17,3 +20,42 @@ def apply_ordering(
     column = order_by_dict[order.order_by]
     column = column.desc() if order.order_direction == OrderDirection.desc else column.asc()
     return stmt.order_by(column)
+
+
+def apply_keyset_pagination(
+    stmt: Select[TRow],
+    columns: Sequence[ColumnElement[Any] | InstrumentedAttribute],
+    direction: OrderDirection,
+    after: list[Any] | None,
+) -> Select[TRow]:
+    """Order by `columns` and, if `after` is given, keep only rows past that key.
+
+    The last column must be unique (usually the primary key) so the ordering is total.
+    """
+
+    if direction == OrderDirection.desc:
+        stmt = stmt.order_by(*(column.desc() for column in columns))
+    else:
+        stmt = stmt.order_by(*(column.asc() for column in columns))
+
+    if after is not None:
+        key = tuple_(*columns)
+        bound = tuple_(*(literal(value, column.type) for value, column in zip(after, columns, strict=True)))
+        stmt = stmt.where(key < bound if direction == OrderDirection.desc else key > bound)
+
+    return stmt
+
+
+def ilike_contains(column: InstrumentedAttribute, value: str) -> ColumnElement[bool]:
+    """Case-insensitive substring filter.
+
+    On Postgres `column ILIKE '%...%'` is answered by the column's pg_trgm GIN index, so the
+    column must stay bare (no lower()/casts around it). Wildcards in `value` are escaped.
+    """
+
+    escaped = (
+        value.replace(LIKE_ESCAPE_CHAR, LIKE_ESCAPE_CHAR * 2)
+        .replace("%", f"{LIKE_ESCAPE_CHAR}%")
+        .replace("_", f"{LIKE_ESCAPE_CHAR}_")
+    )
+    return column.ilike(f"%{escaped}%", escape=LIKE_ESCAPE_CHAR)
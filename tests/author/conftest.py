@@ -0,0 +1 @@
+from tests.book.conftest import test_author, test_book, test_genre  # noqa: F401
@@ -0,0 +1,71 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.constants.pagination import MAX_PAGINATION_LIMIT
+from src.domains.author.models import Author
+from src.domains.book.models import Book
+from src.domains.genre.models import Genre
+from tests.config import AUTHOR_API_BASE_URL
+from tests.utils import QueryCounter
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("with_genre", "expected_queries"), [(False, 1), (True, 2)])
+async def test_get_all_authors_query_count(
+    client: AsyncClient,
+    query_counter: QueryCounter,
+    test_author: Author,
+    test_book: Book,
+    with_genre: bool,
+    expected_queries: int,
+) -> None:
+    with query_counter:
+        params = {"with_genre": with_genre, "limit": MAX_PAGINATION_LIMIT}
+        response = await client.get(AUTHOR_API_BASE_URL, params=params)
+
+    assert response.status_code == 200
+    assert str(test_author.id) in {author["id"] for author in response.json()}
+    assert query_counter.count == expected_queries, query_counter.statements
+
+
+@pytest.mark.asyncio
+async def test_create_author_query_count(
+    client: AsyncClient,
+    query_counter: QueryCounter,
+    test_genre: Genre,
+) -> None:
+    payload = {"first_name": "Counted", "last_name": "Author", "genres": [str(test_genre.id)]}
+
+    with query_counter:
+        response = await client.post(AUTHOR_API_BASE_URL, json=payload)
+
+    assert response.status_code == 201
+    assert response.json()["genres"] == [str(test_genre.id)]
+    # INSERT author RETURNING id and one INSERT for the genre links; no read-back
+    assert query_counter.count == 2, query_counter.statements
+
+    response = await client.get(f"{AUTHOR_API_BASE_URL}{response.json()['id']}", params={"with_genre": True})
+    assert response.json()["genres"] == [str(test_genre.id)]
+
+
+@pytest.mark.asyncio
+async def test_patch_author_genres(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_genre: Genre,
+) -> None:
+    other_genre = Genre(name="Second Genre for Author Patch")
+    db_session.add(other_genre)
+    await db_session.commit()
+
+    response = await client.post(
+        AUTHOR_API_BASE_URL,
+        json={"first_name": "Patched", "last_name": "Author", "genres": [str(test_genre.id)]},
+    )
+    author_id = response.json()["id"]
+
+    for genres in ([test_genre.id, other_genre.id], [other_genre.id]):
+        response = await client.patch(f"{AUTHOR_API_BASE_URL}{author_id}", json={"genres": [str(g) for g in genres]})
+        assert response.status_code == 200, response.text
+        assert set(response.json()["genres"]) == {str(g) for g in genres}
@@ -0,0 +1,103 @@
+from typing import Any
+
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domains.author.models import Author
+from src.domains.book.models import Book
+from src.domains.common.association.author_book import AuthorBook
+from src.domains.common.association.author_genre import AuthorGenre
+from src.domains.genre.models import Genre
+from src.domains.review.models import Review
+from tests.config import REVIEW_API_BASE_URL
+
+TEST_GENRE_NAME = "Test Genre for Book"
+TEST_BOOK_TITLE = "Test Book for Book"
+PAGED_BOOK_TITLE = "Paged Book"
+PAGED_BOOKS_COUNT = 5
+TEST_AUTHOR = {"first_name": "Test", "last_name": "Author for Book"}
+TEST_REVIEWS = [
+    {"rating": 5, "text": "Excellent"},
+    {"rating": 5, "text": None},
+    {"rating": 3, "text": ""},
+    {"rating": 1, "text": "Boring"},
+]
+
+
+@pytest_asyncio.fixture(scope="function")
+async def test_genre(db_session: AsyncSession) -> Genre:
+    result = await db_session.execute(select(Genre).where(Genre.name == TEST_GENRE_NAME))
+    genre = result.scalars().first()
+
+    if genre is None:
+        genre = Genre(name=TEST_GENRE_NAME)
+        db_session.add(genre)
+        await db_session.commit()
+
+    return genre
+
+
+@pytest_asyncio.fixture(scope="function")
+async def test_author(db_session: AsyncSession, test_genre: Genre) -> Author:
+    result = await db_session.execute(select(Author).where(Author.last_name == TEST_AUTHOR["last_name"]))
+    author = result.scalars().first()
+
+    if author is None:
+        author = Author(**TEST_AUTHOR)
+        db_session.add(author)
+        await db_session.flush()
+        db_session.add(AuthorGenre(author_id=author.id, genre_id=test_genre.id))
+        await db_session.commit()
+
+    return author
+
+
+@pytest_asyncio.fixture(scope="function")
+async def test_book(db_session: AsyncSession, test_genre: Genre, test_author: Author) -> Book:
+    result = await db_session.execute(select(Book).where(Book.title == TEST_BOOK_TITLE))
+    book = result.scalars().first()
+
+    if book is None:
+        book = Book(title=TEST_BOOK_TITLE, genre_id=test_genre.id)
+        db_session.add(book)
+        await db_session.flush()
+        db_session.add(AuthorBook(author_id=test_author.id, book_id=book.id))
+        await db_session.commit()
+
+    return book
+
+
+@pytest_asyncio.fixture(scope="function")
+async def test_paged_books(db_session: AsyncSession, test_genre: Genre) -> list[Book]:
+    result = await db_session.execute(select(Book).where(Book.title.startswith(PAGED_BOOK_TITLE)))
+    books = list(result.scalars().all())
+
+    if not books:
+        books = [Book(title=f"{PAGED_BOOK_TITLE} {i}", genre_id=test_genre.id) for i in range(PAGED_BOOKS_COUNT)]
+        db_session.add_all(books)
+        await db_session.commit()
+
+    return books
+
+
+@pytest_asyncio.fixture(scope="function")
+async def test_book_reviews(
+    client: AsyncClient, db_session: AsyncSession, test_book: Book, user_token: dict[str, Any]
+) -> list[Review]:
+    result = await db_session.execute(select(Review).where(Review.book_id == test_book.id))
+    reviews = list(result.scalars().all())
+
+    if not reviews:
+        headers = {"Authorization": f"Bearer {user_token['token']['access_token']}"}
+        for data in TEST_REVIEWS:
+            response = await client.post(
+                REVIEW_API_BASE_URL, headers=headers, json={"book_id": str(test_book.id), **data}
+            )
+            assert response.status_code == 201
+
+        result = await db_session.execute(select(Review).where(Review.book_id == test_book.id))
+        reviews = list(result.scalars().all())
+
+    return reviews
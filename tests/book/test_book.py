@@ -0,0 +1,455 @@
+import asyncio
+import json
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload, undefer
+
+from src.constants.pagination import MAX_PAGINATION_LIMIT, NEXT_CURSOR_HEADER
+from src.domains.author.models import Author
+from src.domains.book.models import Book, BookStats
+from src.domains.common.association.author_book import AuthorBook
+from src.domains.genre.models import Genre
+from src.domains.review.models import Review
+from tests.book.conftest import PAGED_BOOK_TITLE
+from tests.config import AUTH_API_BASE_URL, BOOK_API_BASE_URL, REVIEW_API_BASE_URL, USER_API_BASE_URL
+from tests.user.conftest import TEST_USER
+from tests.utils import QueryCounter
+
+DELETED_REVIEWER = {**TEST_USER, "username": "deletedreviewer", "email": "deletedreviewer@example.com"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("order_by", ["title", "create_at"])
+async def test_get_books_list_cursor_pagination(
+    client: AsyncClient,
+    test_paged_books: list[Book],
+    order_by: str,
+) -> None:
+    params = {"title": PAGED_BOOK_TITLE, "order_by": order_by, "order_direction": "desc", "limit": 2}
+    response = await client.get(BOOK_API_BASE_URL, params=params)
+    assert response.status_code == 200
+
+    pages = [response.json()]
+    while NEXT_CURSOR_HEADER in response.headers:
+        cursor = response.headers[NEXT_CURSOR_HEADER]
+        response = await client.get(BOOK_API_BASE_URL, params={**params, "cursor": cursor})
+        assert response.status_code == 200
+        pages.append(response.json())
+
+    cursor_ids = [book["id"] for page in pages for book in page]
+
+    response = await client.get(BOOK_API_BASE_URL, params={**params, "limit": MAX_PAGINATION_LIMIT})
+    assert response.status_code == 200
+
+    assert cursor_ids == [book["id"] for book in response.json()]
+    assert sorted(cursor_ids) == sorted(str(book.id) for book in test_paged_books)
+
+
+@pytest.mark.asyncio
+async def test_get_books_list_title_filter_is_case_insensitive(
+    client: AsyncClient,
+    test_paged_books: list[Book],
+) -> None:
+    response = await client.get(BOOK_API_BASE_URL, params={"title": PAGED_BOOK_TITLE.upper()})
+
+    assert response.status_code == 200
+    assert {book["id"] for book in response.json()} == {str(book.id) for book in test_paged_books}
+
+
+@pytest.mark.asyncio
+async def test_get_books_list_title_filter_escapes_wildcards(
+    client: AsyncClient,
+    test_paged_books: list[Book],
+) -> None:
+    response = await client.get(BOOK_API_BASE_URL, params={"title": "%"})
+
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+@pytest.mark.asyncio
+async def test_get_books_list_limit_too_large(
+    client: AsyncClient,
+) -> None:
+    response = await client.get(BOOK_API_BASE_URL, params={"limit": MAX_PAGINATION_LIMIT + 1})
+
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_get_books_list_invalid_cursor(
+    client: AsyncClient,
+) -> None:
+    response = await client.get(BOOK_API_BASE_URL, params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "changed",
+    [{"order_by": "title"}, {"order_direction": "asc"}],
+    ids=["order_by", "order_direction"],
+)
+async def test_get_books_list_rejects_cursor_of_another_order(
+    client: AsyncClient,
+    test_paged_books: list[Book],
+    changed: dict[str, str],
+) -> None:
+    params = {"title": PAGED_BOOK_TITLE, "order_by": "create_at", "order_direction": "desc", "limit": 2}
+    response = await client.get(BOOK_API_BASE_URL, params=params)
+    assert response.status_code == 200
+    cursor = response.headers[NEXT_CURSOR_HEADER]
+
+    response = await client.get(BOOK_API_BASE_URL, params={**params, **changed, "cursor": cursor})
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_search_books_paginates_all_matches(
+    client: AsyncClient,
+    test_paged_books: list[Book],
+) -> None:
+    params = {"q": PAGED_BOOK_TITLE, "limit": 2}
+    response = await client.get(f"{BOOK_API_BASE_URL}search", params=params)
+    assert response.status_code == 200
+
+    found = response.json()
+    while NEXT_CURSOR_HEADER in response.headers:
+        cursor = response.headers[NEXT_CURSOR_HEADER]
+        response = await client.get(f"{BOOK_API_BASE_URL}search", params={**params, "cursor": cursor})
+        assert response.status_code == 200
+        found.extend(response.json())
+
+    assert sorted(book["id"] for book in found) == sorted(str(book.id) for book in test_paged_books)
+    assert all("rank" in book for book in found)
+
+
+@pytest.mark.asyncio
+async def test_search_books_empty_query(
+    client: AsyncClient,
+) -> None:
+    response = await client.get(f"{BOOK_API_BASE_URL}search", params={"q": ""})
+
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_list_endpoints_single_statement(
+    client: AsyncClient,
+    query_counter: QueryCounter,
+    test_book: Book,
+    test_paged_books: list[Book],
+) -> None:
+    for url, params in (
+        (BOOK_API_BASE_URL, {"limit": MAX_PAGINATION_LIMIT}),
+        (f"{BOOK_API_BASE_URL}search", {"q": PAGED_BOOK_TITLE}),
+    ):
+        with query_counter:
+            response = await client.get(url, params=params)
+
+        assert response.status_code == 200
+        assert query_counter.count == 1, query_counter.statements
+
+
+@pytest.mark.asyncio
+async def test_get_book_information_success(
+    client: AsyncClient,
+    test_book: Book,
+    test_author: Author,
+    test_book_reviews: list[Review],
+) -> None:
+    response = await client.get(f"{BOOK_API_BASE_URL}{test_book.id}/information")
+
+    assert response.status_code == 200
+
+    data = response.json()
+
+    assert data["id"] == str(test_book.id)
+    assert [author["id"] for author in data["authors"]] == [str(test_author.id)]
+    assert data["total_ratings"] == len(test_book_reviews)
+    assert data["average_rating"] == sum(r.rating for r in test_book_reviews) / len(test_book_reviews)
+    assert data["max_rating_count"] == len([r for r in test_book_reviews if r.rating == 5])
+    assert data["text_reviews_count"] == len([r for r in test_book_reviews if r.text])
+    assert {review["id"] for review in data["latest_reviews"]} == {str(r.id) for r in test_book_reviews}
+
+
+@pytest.mark.asyncio
+async def test_get_book_information_single_statement(
+    client: AsyncClient,
+    query_counter: QueryCounter,
+    test_book: Book,
+    test_book_reviews: list[Review],
+) -> None:
+    with query_counter:
+        response = await client.get(f"{BOOK_API_BASE_URL}{test_book.id}/information")
+
+    assert response.status_code == 200
+    assert query_counter.count == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_book_information_requests_share_one_query(
+    client: AsyncClient,
+    query_counter: QueryCounter,
+    test_book: Book,
+    test_book_reviews: list[Review],
+) -> None:
+    with query_counter:
+        responses = await asyncio.gather(
+            *(client.get(f"{BOOK_API_BASE_URL}{test_book.id}/information") for _ in range(5))
+        )
+
+    assert [response.status_code for response in responses] == [200] * 5
+    assert len({response.text for response in responses}) == 1
+    assert query_counter.count == 1
+
+
+@pytest.mark.asyncio
+async def test_book_information_cached_until_reviews_change(
+    client: AsyncClient,
+    query_counter: QueryCounter,
+    user_token: dict[str, Any],
+    test_book: Book,
+    test_book_reviews: list[Review],
+) -> None:
+    url = f"{BOOK_API_BASE_URL}{test_book.id}/information"
+    headers = {"Authorization": f"Bearer {user_token['token']['access_token']}"}
+    await client.get(url)
+
+    with query_counter:
+        response = await client.get(url)
+
+    assert response.status_code == 200
+    assert query_counter.count == 0
+
+    review = {"book_id": str(test_book.id), "rating": 1, "text": "Read it again"}
+    created = await client.post(REVIEW_API_BASE_URL, headers=headers, json=review)
+    assert created.status_code == 201
+    assert (await client.get(url)).json()["total_ratings"] == len(test_book_reviews) + 1
+
+    deleted = await client.delete(f"{REVIEW_API_BASE_URL}{created.json()['id']}", headers=headers)
+    assert deleted.status_code == 204
+    assert (await client.get(url)).json()["total_ratings"] == len(test_book_reviews)
+
+
+@pytest.mark.asyncio
+async def test_deleting_reviewer_removes_their_reviews_from_book_stats(
+    client: AsyncClient,
+    test_book: Book,
+    test_book_reviews: list[Review],
+) -> None:
+    url = f"{BOOK_API_BASE_URL}{test_book.id}/information"
+    before = (await client.get(url)).json()
+
+    created = await client.post(USER_API_BASE_URL, json=DELETED_REVIEWER)
+    assert created.status_code == 201
+    login = await client.post(
+        f"{AUTH_API_BASE_URL}login",
+        data={"username": DELETED_REVIEWER["username"], "password": DELETED_REVIEWER["password"]},
+    )
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    for review in ({"rating": 1, "text": "Not for me"}, {"rating": 5}):
+        response = await client.post(
+            REVIEW_API_BASE_URL, headers=headers, json={"book_id": str(test_book.id), **review}
+        )
+        assert response.status_code == 201
+    assert (await client.get(url)).json()["total_ratings"] == before["total_ratings"] + 2
+
+    response = await client.delete(f"{USER_API_BASE_URL}{created.json()['id']}")
+    assert response.status_code == 204
+
+    after = (await client.get(url)).json()
+    for field in ("total_ratings", "average_rating", "max_rating_count", "text_reviews_count"):
+        assert after[field] == before[field], field
+
+
+@pytest.mark.asyncio
+async def test_get_book_information_not_found(
+    client: AsyncClient,
+) -> None:
+    response = await client.get(f"{BOOK_API_BASE_URL}{uuid4()}/information")
+
+    assert response.status_code == 404
+
+
+async def get_book_stats(db_session: AsyncSession, book: Book) -> BookStats:
+    result = await db_session.execute(
+        select(BookStats).where(BookStats.book_id == book.id).execution_options(populate_existing=True)
+    )
+    return result.scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_book_stats_follow_review_changes(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_book: Book,
+    test_book_reviews: list[Review],
+    user_token: dict[str, Any],
+) -> None:
+    headers = {"Authorization": f"Bearer {user_token['token']['access_token']}"}
+    before = await get_book_stats(db_session, test_book)
+    count, rating_sum, rating_2, rating_4, text_count = (
+        before.rating_count,
+        before.rating_sum,
+        before.rating_2,
+        before.rating_4,
+        before.text_reviews_count,
+    )
+
+    response = await client.post(
+        REVIEW_API_BASE_URL, headers=headers, json={"book_id": str(test_book.id), "rating": 2, "text": None}
+    )
+    assert response.status_code == 201
+    review_id = response.json()["id"]
+
+    stats = await get_book_stats(db_session, test_book)
+    assert (stats.rating_count, stats.rating_sum, stats.rating_2) == (count + 1, rating_sum + 2, rating_2 + 1)
+    assert stats.text_reviews_count == text_count
+
+    response = await client.patch(
+        f"{REVIEW_API_BASE_URL}{review_id}", headers=headers, json={"rating": 4, "text": "Changed my mind"}
+    )
+    assert response.status_code == 200
+
+    stats = await get_book_stats(db_session, test_book)
+    assert (stats.rating_count, stats.rating_sum) == (count + 1, rating_sum + 4)
+    assert (stats.rating_2, stats.rating_4) == (rating_2, rating_4 + 1)
+    assert stats.text_reviews_count == text_count + 1
+
+    response = await client.delete(f"{REVIEW_API_BASE_URL}{review_id}", headers=headers)
+    assert response.status_code == 204
+
+    stats = await get_book_stats(db_session, test_book)
+    assert (stats.rating_count, stats.rating_sum, stats.rating_4) == (count, rating_sum, rating_4)
+    assert stats.text_reviews_count == text_count
+
+
+@pytest.mark.asyncio
+async def test_patch_book_authors_writes_only_the_difference(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_genre: Genre,
+) -> None:
+    kept, dropped, added = (Author(first_name="Linked", last_name=f"Author {i}") for i in range(3))
+    book = Book(title="Book With Changing Authors", genre_id=test_genre.id)
+    db_session.add_all([kept, dropped, added, book])
+    await db_session.flush()
+    db_session.add_all([AuthorBook(author_id=author.id, book_id=book.id) for author in (kept, dropped)])
+    await db_session.commit()
+
+    async def links() -> dict[Any, Any]:
+        result = await db_session.execute(
+            select(AuthorBook.author_id, AuthorBook.create_at).where(AuthorBook.book_id == book.id)
+        )
+        return dict(result.tuples().all())
+
+    before = await links()
+
+    response = await client.patch(f"{BOOK_API_BASE_URL}{book.id}", json={"authors": [str(kept.id), str(added.id)]})
+    assert response.status_code == 200, response.text
+
+    after = await links()
+    assert set(after) == {kept.id, added.id}
+    assert after[kept.id] == before[kept.id]
+
+
+@pytest.mark.asyncio
+async def test_new_rows_get_time_ordered_ids(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_genre: Genre,
+    test_book: Book,
+) -> None:
+    books = [Book(title=f"Time Ordered Book {i}", genre_id=test_genre.id) for i in range(3)]
+    for book in books:
+        db_session.add(book)
+        await db_session.flush()
+    await db_session.commit()
+
+    assert {book.id.version for book in books} == {7}
+    assert [book.id for book in books] == sorted(book.id for book in books)
+
+    # Rows keyed by uuid4 ids from before the switch keep working side by side
+    legacy = Book(id=uuid4(), title="Legacy uuid4 Book", genre_id=test_genre.id)
+    db_session.add(legacy)
+    await db_session.commit()
+    response = await client.get(f"{BOOK_API_BASE_URL}{legacy.id}")
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_import_books_csv(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    admin_token: dict[str, Any],
+    test_genre: Genre,
+) -> None:
+    headers = {"Authorization": f"Bearer {admin_token['token']['access_token']}"}
+    feed = (
+        "title,description,genre,authors\n"
+        f'CSV Import Book,"First line\nsecond, line",{test_genre.name},Import Writer; Import Coauthor\n'
+        f"CSV Import Unknown Genre,,No Such Genre,Import Writer\n"
+        f",,{test_genre.name},\n"
+    )
+
+    response = await client.post(
+        f"{BOOK_API_BASE_URL}import",
+        params={"format": "csv", "batch_size": 1},
+        content=feed.encode(),
+        headers=headers,
+    )
+    assert response.status_code == 200
+
+    report = response.json()
+    assert (report["total_rows"], report["imported"], report["failed"]) == (3, 1, 2)
+    assert [error["line"] for error in report["errors"]] == [4, 5]
+
+    result = await db_session.execute(
+        select(Book)
+        .where(Book.title == "CSV Import Book")
+        .options(selectinload(Book.authors), undefer(Book.description))
+    )
+    book = result.scalar_one()
+    assert book.description == "First line\nsecond, line"
+    assert sorted(author.last_name for author in book.authors) == ["Coauthor", "Writer"]
+
+
+@pytest.mark.asyncio
+async def test_import_books_ndjson_upserts_by_id(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    admin_token: dict[str, Any],
+    test_genre: Genre,
+) -> None:
+    headers = {"Authorization": f"Bearer {admin_token['token']['access_token']}"}
+    book_id = uuid4()
+
+    for title, author in (("NDJSON Import Book", "First Author"), ("NDJSON Import Book v2", "Second Author")):
+        record = {"id": str(book_id), "title": title, "genre": test_genre.name, "authors": [author]}
+        response = await client.post(f"{BOOK_API_BASE_URL}import", content=json.dumps(record), headers=headers)
+        assert response.status_code == 200
+        assert response.json()["imported"] == 1
+
+    book = await db_session.get(Book, book_id, options=[selectinload(Book.authors)], populate_existing=True)
+    assert book is not None
+    assert book.title == "NDJSON Import Book v2"
+    assert [author.first_name for author in book.authors] == ["Second"]
+
+
+@pytest.mark.asyncio
+async def test_import_books_requires_admin(
+    client: AsyncClient,
+    user_token: dict[str, Any],
+) -> None:
+    headers = {"Authorization": f"Bearer {user_token['token']['access_token']}"}
+    response = await client.post(f"{BOOK_API_BASE_URL}import", content=b"{}", headers=headers)
+
+    assert response.status_code == 403
@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.cache.reference_data import ReferenceDataStore
+from src.constants.user_role import UserRole
+from src.domains.genre.models import Genre
+from tests.utils import QueryCounter
+
+
+@pytest.mark.asyncio
+async def test_reloads_once_another_worker_bumps_the_version(
+    db_session: AsyncSession,
+    query_counter: QueryCounter,
+) -> None:
+    store = ReferenceDataStore(check_seconds=60)
+    snapshot = await store.get(db_session)
+    assert UserRole.USER in snapshot.role_ids
+
+    # Another worker's write: the counter moves but this store is not expired
+    genre = Genre(name="Other Worker Genre")
+    db_session.add(genre)
+    await store.bump(db_session)
+    await db_session.commit()
+
+    with query_counter:
+        assert await store.get(db_session) is snapshot
+    assert query_counter.count == 0
+
+    store.check_seconds = 0
+    reloaded = await store.get(db_session)
+
+    assert reloaded.version == snapshot.version + 1
+    assert reloaded.etag != snapshot.etag
+    assert genre.id in reloaded.genres_by_id
+
+    with query_counter:
+        assert await store.get(db_session) is reloaded
+    # Only the counter is read while it is unchanged
+    assert query_counter.count == 1
+
+
+@pytest.mark.asyncio
+async def test_serves_loaded_snapshot_while_one_request_checks(db_session: AsyncSession) -> None:
+    store = ReferenceDataStore(check_seconds=0)
+    snapshot = await store.get(db_session)
+
+    async with store._lock:
+        # A check is in flight: other requests keep the current snapshot instead of waiting
+        assert await asyncio.wait_for(store.get(db_session), timeout=1) is snapshot
+
+    store.expire()
+    assert await store.get(db_session) is not snapshot
@@ -0,0 +1,122 @@
+import asyncio
+from collections.abc import AsyncGenerator
+
+import fakeredis
+import pytest
+import pytest_asyncio
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.cache.backends import CacheBackend, MemoryCacheBackend, RedisCacheBackend
+from src.cache.result_cache import ResultCache, entity_tag, result_cache_hit_ratio
+
+
+class BookRow(BaseModel):
+    id: int
+    title: str
+
+
+class Source:
+    """Stand-in repository data that counts how often it is read."""
+
+    def __init__(self) -> None:
+        self.titles = {1: "War and Peace", 2: "Anna Karenina"}
+        self.reads = 0
+
+    async def read(self, session: AsyncSession, book_id: int) -> BookRow:
+        self.reads += 1
+        return BookRow(id=book_id, title=self.titles[book_id])
+
+
+@pytest_asyncio.fixture(params=["memory", "redis"])
+async def backend(request: pytest.FixtureRequest) -> AsyncGenerator[CacheBackend, None]:
+    if request.param == "memory":
+        yield MemoryCacheBackend(maxsize=100)
+        return
+
+    client = fakeredis.FakeAsyncRedis()
+    yield RedisCacheBackend(client, prefix="test")
+    await client.aclose()
+
+
+def make_cache(backend: CacheBackend, ttl: float = 60, stale_seconds: float = 0) -> ResultCache:
+    return ResultCache(backend, enabled=True, ttl=ttl, stale_seconds=stale_seconds, replica_lag_seconds=0)
+
+
+@pytest.mark.asyncio
+async def test_repeated_reads_are_served_from_cache(backend: CacheBackend, db_session: AsyncSession) -> None:
+    source = Source()
+    cache = make_cache(backend)
+    read = cache.cached(tags=lambda book_id: [entity_tag("book", book_id)])(source.read)
+
+    first = await read(db_session, 1)
+    second = await read(db_session, book_id=1)
+
+    assert first == second == BookRow(id=1, title="War and Peace")
+    assert source.reads == 1
+    assert result_cache_hit_ratio.value(function=source.read.__qualname__) > 0
+
+
+@pytest.mark.asyncio
+async def test_invalidating_a_tag_drops_its_entries(backend: CacheBackend, db_session: AsyncSession) -> None:
+    source = Source()
+    cache = make_cache(backend)
+    read = cache.cached(tags=lambda book_id: [entity_tag("book", book_id)])(source.read)
+    await read(db_session, 1)
+    await read(db_session, 2)
+
+    source.titles[1] = "Resurrection"
+    await cache.invalidate(entity_tag("book", 1))
+
+    assert await read(db_session, 1) == BookRow(id=1, title="Resurrection")
+    assert await read(db_session, 2) == BookRow(id=2, title="Anna Karenina")
+    assert source.reads == 3
+
+
+@pytest.mark.asyncio
+async def test_entity_invalidation_drops_wildcard_entries(backend: CacheBackend, db_session: AsyncSession) -> None:
+    source = Source()
+    cache = make_cache(backend)
+    read_any = cache.cached(tags=lambda book_id: [entity_tag("book")])(source.read)
+    await read_any(db_session, 2)
+
+    await cache.invalidate(entity_tag("book", 1))
+    await read_any(db_session, 2)
+
+    assert source.reads == 2
+
+
+@pytest.mark.asyncio
+async def test_result_read_before_invalidation_is_not_kept(backend: CacheBackend, db_session: AsyncSession) -> None:
+    source = Source()
+    cache = make_cache(backend)
+
+    async def read_during_write(session: AsyncSession, book_id: int) -> BookRow:
+        row = await source.read(session, book_id)
+        # A write commits and invalidates while this read is still running
+        source.titles[book_id] = "Resurrection"
+        await cache.invalidate(entity_tag("book", book_id))
+        return row
+
+    read = cache.cached(tags=lambda book_id: [entity_tag("book", book_id)])(read_during_write)
+
+    assert (await read(db_session, 1)).title == "War and Peace"
+    assert (await read(db_session, 1)).title == "Resurrection"
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_served_while_refreshed(backend: CacheBackend, db_session: AsyncSession) -> None:
+    source = Source()
+    cache = make_cache(backend, ttl=0.05, stale_seconds=60)
+    read = cache.cached(tags=lambda book_id: [entity_tag("book", book_id)])(source.read)
+    await read(db_session, 1)
+    source.titles[1] = "Resurrection"
+    await asyncio.sleep(0.1)
+
+    stale = await read(db_session, 1)
+    await asyncio.gather(*cache._tasks)
+    refreshed = await read(db_session, 1)
+
+    assert stale.title == "War and Peace"
+    assert refreshed.title == "Resurrection"
+    assert source.reads == 2
@@ -0,0 +1,32 @@
+import uuid
+
+from src.auth.cache import UserCache
+from src.domains.user.schema import UserReadSchema
+
+
+def make_user(username: str) -> UserReadSchema:
+    return UserReadSchema.model_validate(
+        {
+            "id": uuid.uuid4(),
+            "username": username,
+            "first_name": "Test",
+            "last_name": "User",
+            "email": f"{username}@example.com",
+            "disabled": False,
+            "role": "user",
+        }
+    )
+
+
+def test_invalidate_finds_a_hot_user_after_the_cache_filled_up() -> None:
+    cache = UserCache(maxsize=3, ttl=60)
+    hot_user = make_user("hot")
+    cache.set(hot_user, cache.generation)
+
+    for i in range(5):
+        cache.set(make_user(f"cold{i}"), cache.generation)
+        assert cache.get(hot_user.username) == hot_user
+
+    cache.invalidate(hot_user.id)
+
+    assert cache.get(hot_user.username) is None
@@ -6,9 +6,12 @@ from httpx import AsyncClient
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.cache.reference_data import LOAD_STATEMENTS
 from src.domains.category.models import Category
 from src.domains.user.models import User
+from src.setting import settings
 from tests.config import CATEGORY_API_BASE_URL
+from tests.utils import QueryCounter, count_auth_queries
 
 
 @pytest.mark.asyncio
@@ -29,6 +32,50 @@ async def test_get_all_categories(
     assert test_category.name in category_names
 
 
+@pytest.mark.asyncio
+async def test_get_all_categories_served_from_memory(
+    client: AsyncClient,
+    query_counter: QueryCounter,
+    test_category: Category,
+) -> None:
+    with query_counter:
+        response = await client.get(CATEGORY_API_BASE_URL)
+
+    assert response.status_code == 200
+    assert query_counter.count == LOAD_STATEMENTS
+
+    with query_counter:
+        response = await client.get(CATEGORY_API_BASE_URL)
+        by_id_response = await client.get(f"{CATEGORY_API_BASE_URL}{test_category.id}")
+
+    assert response.status_code == 200
+    assert by_id_response.status_code == 200
+    assert query_counter.count == 0, query_counter.statements
+
+
+@pytest.mark.asyncio
+async def test_get_all_categories_revalidated_by_etag(
+    client: AsyncClient,
+    test_category: Category,
+) -> None:
+    response = await client.get(CATEGORY_API_BASE_URL)
+
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"] == f"public, max-age={settings.reference_data_max_age_seconds}"
+
+    response = await client.get(CATEGORY_API_BASE_URL, headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+    response = await client.get(CATEGORY_API_BASE_URL, headers={"If-None-Match": '"0-stale"'})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] == etag
+
+
 @pytest.mark.asyncio
 async def test_get_category_by_id_success(
     client: AsyncClient,
@@ -365,3 +412,35 @@ async def test_delete_category_not_found(
     )
 
     assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_patch_and_delete_category_statements(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    query_counter: QueryCounter,
+    existing_active_test_admin: User,
+    admin_token: dict[str, Any],
+) -> None:
+    category = Category(name="Single Statement Category")
+    db_session.add(category)
+    await db_session.commit()
+
+    headers = {"Authorization": f"Bearer {admin_token['token']['access_token']}"}
+    auth_queries = await count_auth_queries(client, query_counter, headers)
+
+    with query_counter:
+        response = await client.patch(
+            f"{CATEGORY_API_BASE_URL}{category.id}", headers=headers, json={"name": "Renamed Category"}
+        )
+
+    assert response.status_code == 200
+    assert response.json()["name"] == "Renamed Category"
+    # The update and the reference data version bump
+    assert query_counter.count - auth_queries == 2, query_counter.statements
+
+    with query_counter:
+        response = await client.delete(f"{CATEGORY_API_BASE_URL}{category.id}", headers=headers)
+
+    assert response.status_code == 204
+    assert query_counter.count - auth_queries == 2, query_counter.statements
@@ -1,19 +1,29 @@
 from collections.abc import AsyncGenerator
 
+import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from src.db.db import get_async_session
+from src.auth.cache import user_cache
+from src.cache.reference_data import reference_data
+from src.cache.result_cache import result_cache
+from src.db.db import get_async_session, get_primary_read_session, get_read_session, get_snapshot_session
+from src.db.request_queries import track_request_queries
 from src.domains.common.models import Base
 from src.main import app
+from src.setting import settings
 from tests.role.conftest import seed_roles  # noqa: F401
 from tests.user.conftest import admin_token, existing_active_test_admin, existing_test_user, user_token  # noqa: F401
+from tests.utils import QueryCounter
 
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
 async_engine = create_async_engine(TEST_DATABASE_URL, echo=False, future=True)
 
+track_request_queries(async_engine)
+settings.query_budget_enforce = True
+
 SessionLocal = async_sessionmaker(bind=async_engine, expire_on_commit=False, class_=AsyncSession)
 
 
@@ -32,14 +42,25 @@ async def db_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+@pytest.fixture
+def query_counter() -> QueryCounter:
+    return QueryCounter(async_engine.sync_engine)
+
+
 @pytest_asyncio.fixture
 async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     async def override_get_async_session() -> AsyncGenerator[AsyncSession, None]:
         yield db_session
 
     app.dependency_overrides[get_async_session] = override_get_async_session
+    app.dependency_overrides[get_read_session] = override_get_async_session
+    app.dependency_overrides[get_primary_read_session] = override_get_async_session
+    app.dependency_overrides[get_snapshot_session] = override_get_async_session
 
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
         yield client
 
     app.dependency_overrides.clear()
+    user_cache.clear()
+    await result_cache.clear()
+    reference_data.expire()
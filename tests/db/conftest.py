@@ -0,0 +1,61 @@
+from collections.abc import AsyncGenerator
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.cache.reference_data import reference_data
+from src.db import db
+from src.domains.common.models import Base
+from src.domains.role.models import Role
+from tests.config import TEST_POSTGRES_DATABASE_URL
+from tests.role.conftest import ROLES
+
+
+@pytest_asyncio.fixture(scope="function")
+async def pg_session() -> AsyncGenerator[AsyncSession, None]:
+    if not TEST_POSTGRES_DATABASE_URL:
+        pytest.skip("TEST_POSTGRES_DATABASE_URL is not set")
+
+    engine = create_async_engine(TEST_POSTGRES_DATABASE_URL, poolclass=NullPool)
+
+    async with engine.begin() as connection:
+        await connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await connection.run_sync(Base.metadata.create_all)
+
+    async with AsyncSession(engine) as session:
+        yield session
+
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture(scope="function")
+async def primary_and_replica(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> AsyncGenerator[tuple[async_sessionmaker[AsyncSession], async_sessionmaker[AsyncSession]], None]:
+    """Two SQLite files standing in for the primary and a replica that has not caught up."""
+
+    engines = [create_async_engine(f"sqlite+aiosqlite:///{tmp_path / name}.db") for name in ("primary", "replica")]
+    for engine in engines:
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+
+    primary, replica = (async_sessionmaker(engine, expire_on_commit=False) for engine in engines)
+    async with primary() as session:
+        session.add_all(Role(name=name) for name in ROLES)
+        await session.commit()
+
+    monkeypatch.setattr(db, "async_session_maker", primary)
+    monkeypatch.setattr(db, "async_primary_read_session_maker", primary)
+    monkeypatch.setattr(db, "async_read_session_maker", replica)
+    # Reload roles from these databases rather than serving the shared test database's
+    reference_data.expire()
+    yield primary, replica
+    reference_data.expire()
+
+    for engine in engines:
+        await engine.dispose()
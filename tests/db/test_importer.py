@@ -0,0 +1,34 @@
+import asyncio
+import uuid
+
+import pytest
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domains.author.models import Author
+from src.domains.book.importer import _resolve_authors
+
+
+@pytest.mark.asyncio
+async def test_concurrent_imports_create_each_new_author_once(
+    pg_session: AsyncSession,
+) -> None:
+    last_name = f"Import {uuid.uuid4()}"
+    keys = {("Первый", last_name), ("Второй", last_name)}
+
+    async def resolve() -> dict[tuple[str, str], uuid.UUID]:
+        async with AsyncSession(pg_session.bind) as session:
+            author_ids = await _resolve_authors(session, keys)
+            # Holds the batch open while the other import looks the same names up
+            await asyncio.sleep(0.2)
+            await session.commit()
+            return author_ids
+
+    try:
+        first, second = await asyncio.gather(resolve(), resolve())
+
+        assert first == second
+        assert await pg_session.scalar(select(func.count()).where(Author.last_name == last_name)) == len(keys)
+    finally:
+        await pg_session.execute(delete(Author).where(Author.last_name == last_name))
+        await pg_session.commit()
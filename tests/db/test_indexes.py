@@ -0,0 +1,145 @@
+import uuid
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from datetime import datetime
+from typing import Any
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from src.constants.order_direction import OrderDirection
+from src.constants.reading_status import BookReadingStatus
+from src.domains.author.models import Author
+from src.domains.book.models import Book
+from src.domains.book.repository import get_book_information, get_books_list
+from src.domains.book.schema import BookFilters, BookListOrderSchema
+from src.domains.favorites.repository import list_favorites_by_user
+from src.domains.reading_status.repository import list_books_with_status
+from src.domains.reading_status.schema import ReadingStatusFiltersSchema, ReadingStatusOrderSchema
+from src.domains.review.models import Review
+from src.domains.review.repository import get_reviews_page
+from src.domains.review.schema import ReviewPageSchema
+from src.domains.user.models import User
+from src.exceptions.entity import EntityNotFound
+from src.utils.request_builder import apply_keyset_pagination, ilike_contains
+from tests.utils import explain, explain_calls
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("column", "index_name"),
+    [
+        (Book.title, "ix_book_title_trgm"),
+        (Author.first_name, "ix_author_first_name_trgm"),
+        (Author.last_name, "ix_author_last_name_trgm"),
+        (User.username, "ix_user_username_trgm"),
+        (User.first_name, "ix_user_first_name_trgm"),
+        (User.last_name, "ix_user_last_name_trgm"),
+        (User.email, "ix_user_email_trgm"),
+    ],
+)
+async def test_substring_filter_uses_trigram_index(
+    pg_session: AsyncSession,
+    column: InstrumentedAttribute,
+    index_name: str,
+) -> None:
+    stmt = select(column.class_).where(ilike_contains(column, "Tolst_%"))
+
+    plan = await explain(pg_session, stmt)
+
+    assert index_name in plan
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("column", "index_name"),
+    [
+        (Review.book_id, "ix_review_book_id_create_at"),
+        (Review.user_id, "ix_review_user_id_create_at"),
+    ],
+)
+async def test_review_page_uses_listing_index(
+    pg_session: AsyncSession,
+    column: InstrumentedAttribute,
+    index_name: str,
+) -> None:
+    after = [datetime(2026, 1, 1), uuid.uuid4()]
+    stmt = apply_keyset_pagination(
+        select(Review).where(column == uuid.uuid4()),
+        [Review.create_at, Review.id],
+        OrderDirection.desc,
+        after,
+    ).limit(50)
+
+    plan = await explain(pg_session, stmt)
+
+    assert index_name in plan
+    # The index already yields rows in page order
+    assert "Sort" not in plan
+
+
+async def _book_information(session: AsyncSession) -> None:
+    with suppress(EntityNotFound):
+        await get_book_information(session, uuid.uuid4())
+
+
+async def _book_category_ids(session: AsyncSession) -> None:
+    # The lookup Postgres runs to check the foreign key when a category is deleted
+    await session.execute(select(Book.id).where(Book.category_id == uuid.uuid4()))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("call", "index_name"),
+    [
+        (
+            lambda session: get_books_list(
+                session, BookFilters.model_validate({"genre_id": uuid.uuid4()}), BookListOrderSchema()
+            ),
+            "ix_book_genre_id_create_at",
+        ),
+        (_book_category_ids, "ix_book_category_id"),
+        (_book_information, "ix_author_book_book_id_author_id"),
+        (_book_information, "ix_review_book_id_create_at"),
+        (
+            lambda session: list_books_with_status(
+                session,
+                uuid.uuid4(),
+                ReadingStatusFiltersSchema(status=BookReadingStatus.READING),
+                ReadingStatusOrderSchema(),
+            ),
+            "ix_reading_status_user_id_status",
+        ),
+        (lambda session: list_favorites_by_user(session, uuid.uuid4()), "ix_favorites_user_id"),
+        (
+            lambda session: get_reviews_page(
+                session, ReviewPageSchema.model_validate({"book_id": uuid.uuid4(), "with_text": True})
+            ),
+            "ix_review_book_id_create_at_with_text",
+        ),
+        (
+            lambda session: get_reviews_page(session, ReviewPageSchema.model_validate({"user_id": uuid.uuid4()})),
+            "ix_review_user_id_create_at",
+        ),
+    ],
+    ids=[
+        "books_by_genre",
+        "books_by_category",
+        "book_information_authors",
+        "book_information_reviews",
+        "reading_status_by_user",
+        "favorites_by_user",
+        "reviews_with_text",
+        "reviews_by_user",
+    ],
+)
+async def test_repository_query_uses_foreign_key_index(
+    pg_session: AsyncSession,
+    call: Callable[[AsyncSession], Awaitable[Any]],
+    index_name: str,
+) -> None:
+    plans = await explain_calls(pg_session, lambda: call(pg_session))
+
+    assert any(index_name in plan for plan in plans), "\n\n".join(plans)
@@ -0,0 +1,17 @@
+from src.db.pgbouncer import pgbouncer_connect_args
+
+
+def test_pgbouncer_connect_args_move_session_settings_into_transactions() -> None:
+    connect_args, local_settings = pgbouncer_connect_args(
+        {
+            "application_name": "digital_library",
+            "statement_timeout": "1500",
+            "default_transaction_read_only": "on",
+        }
+    )
+
+    assert connect_args["statement_cache_size"] == 0
+    assert connect_args["prepared_statement_cache_size"] == 0
+    assert connect_args["prepared_statement_name_func"]() != connect_args["prepared_statement_name_func"]()
+    assert connect_args["server_settings"] == {"application_name": "digital_library"}
+    assert local_settings == {"statement_timeout": "1500", "transaction_read_only": "on"}
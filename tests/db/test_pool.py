@@ -0,0 +1,60 @@
+import pytest
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.db.pool import (
+    InstrumentedAsyncAdaptedQueuePool,
+    connection_route,
+    db_connection_hold_seconds,
+    db_pool_checked_out,
+    db_pool_checkout_timeouts,
+    db_pool_checkout_wait_seconds,
+)
+
+
+@pytest.mark.asyncio
+async def test_pool_reports_checkouts_and_timeouts() -> None:
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+        pool_logging_name="test_pool",
+    )
+    checkouts = db_pool_checkout_wait_seconds.count(pool="test_pool")
+    timeouts = db_pool_checkout_timeouts.value(pool="test_pool")
+
+    async with engine.connect() as connection:
+        await connection.execute(text("SELECT 1"))
+        assert db_pool_checked_out.value(pool="test_pool") == 1
+
+        with pytest.raises(exc.TimeoutError):
+            async with engine.connect():
+                pass
+
+    assert db_pool_checked_out.value(pool="test_pool") == 0
+    assert db_pool_checkout_wait_seconds.count(pool="test_pool") == checkouts + 2
+    assert db_pool_checkout_timeouts.value(pool="test_pool") == timeouts + 1
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_pool_reports_hold_time_by_route() -> None:
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_logging_name="test_hold_pool",
+    )
+    token = connection_route.set("GET /api/v1/book/{id}")
+
+    try:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+    finally:
+        connection_route.reset(token)
+
+    assert db_connection_hold_seconds.count(pool="test_hold_pool", route="GET /api/v1/book/{id}") == 1
+
+    await engine.dispose()
@@ -0,0 +1,54 @@
+from collections.abc import AsyncGenerator
+from typing import Annotated
+
+import pytest
+from fastapi import Depends, FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.request_queries import QUERY_COUNT_HEADER, QUERY_REPEATS_HEADER, QueryCountMiddleware, query_budget
+from src.exceptions.init import init_exception_handlers
+from tests.conftest import SessionLocal
+
+
+async def get_session() -> AsyncGenerator[AsyncSession, None]:
+    async with SessionLocal() as session:
+        yield session
+
+
+app = FastAPI()
+app.add_middleware(QueryCountMiddleware, n_plus_one_threshold=5)
+init_exception_handlers(app)
+
+
+@app.get("/loop")
+async def loop(session: Annotated[AsyncSession, Depends(get_session)]) -> int:
+    for value in range(6):
+        await session.execute(text("SELECT :value"), {"value": value})
+    return 6
+
+
+@app.get("/budgeted-loop")
+@query_budget(1)
+async def budgeted_loop(session: Annotated[AsyncSession, Depends(get_session)]) -> int:
+    return await loop(session)
+
+
+@pytest.mark.asyncio
+async def test_repeated_statements_reported() -> None:
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/loop")
+
+    assert response.status_code == 200
+    assert response.headers[QUERY_COUNT_HEADER] == "6"
+    assert response.headers[QUERY_REPEATS_HEADER] == "6"
+
+
+@pytest.mark.asyncio
+async def test_query_budget_enforced() -> None:
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/budgeted-loop")
+
+    assert response.status_code == 500
+    assert response.json()["message"] == "Handler budgeted_loop issued 6 SQL statements, budget is 1"
@@ -0,0 +1,91 @@
+import time
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.constants.user_role import UserRole
+from src.db import db
+from src.db.routing import READ_PRIMARY_COOKIE, READ_PRIMARY_HEADER
+from src.domains.book.models import Book
+from src.domains.genre.models import Genre
+from src.domains.review.models import Review
+from src.domains.role.models import Role
+from src.domains.user.models import User
+from src.main import app
+from tests.config import GENRE_API_BASE_URL, REVIEW_API_BASE_URL, USER_API_BASE_URL
+from tests.user.conftest import TEST_USER
+
+ROUTED_USER = {**TEST_USER, "username": "routeduser123", "email": "routeduser123@example.com"}
+
+
+@pytest.mark.asyncio
+async def test_reads_go_to_primary_after_write(
+    primary_and_replica: tuple[async_sessionmaker[AsyncSession], async_sessionmaker[AsyncSession]],
+) -> None:
+    primary, _ = primary_and_replica
+    async with primary() as session:
+        role_id = await session.scalar(select(Role.id).where(Role.name == UserRole.USER))
+        genre = Genre(name="Routed genre")
+        reviewer = User(
+            username="routedreviewer",
+            first_name="Routed",
+            last_name="Reviewer",
+            email="routedreviewer@example.com",
+            hashed_password="not-a-hash",
+            role_id=role_id,
+        )
+        session.add_all([genre, reviewer])
+        await session.flush()
+        book = Book(title="Routed book", genre_id=genre.id)
+        session.add(book)
+        await session.flush()
+        review = Review(user_id=reviewer.id, book_id=book.id, rating=5)
+        session.add(review)
+        await session.commit()
+    review_url = f"{REVIEW_API_BASE_URL}{review.id}"
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get(review_url)
+        assert response.status_code == 404
+        assert READ_PRIMARY_COOKIE not in response.cookies
+
+        response = await client.post(USER_API_BASE_URL, json=ROUTED_USER)
+        assert response.status_code == 201
+        until = response.headers[READ_PRIMARY_HEADER]
+        assert response.cookies[READ_PRIMARY_COOKIE] == until
+
+        response = await client.get(review_url)
+        assert response.status_code == 200
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get(review_url, headers={READ_PRIMARY_HEADER: until})
+        assert response.status_code == 200
+
+        forged = str(time.time() + 3600)
+        response = await client.get(review_url, headers={READ_PRIMARY_HEADER: forged})
+        assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_user_scoped_reads_use_read_only_primary_sessions(
+    primary_and_replica: tuple[async_sessionmaker[AsyncSession], async_sessionmaker[AsyncSession]],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # The replica never sees this user, so the lookup below only succeeds on the primary
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post(USER_API_BASE_URL, json=ROUTED_USER)
+        assert response.status_code == 201
+        user_id = response.json()["id"]
+
+        def read_write_session() -> AsyncSession:
+            raise AssertionError("GET routes must not open read-write sessions")
+
+        monkeypatch.setattr(db, "async_session_maker", read_write_session)
+
+        response = await client.get(f"{USER_API_BASE_URL}{user_id}")
+        assert response.status_code == 200
+
+        response = await client.get(GENRE_API_BASE_URL)
+        assert response.status_code == 200
@@ -0,0 +1,43 @@
+import pytest
+from sqlalchemy import delete, insert, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domains.author.models import Author
+from src.domains.book.models import Book
+from src.domains.book.repository import search_books
+from src.domains.book.schema import BookSearchSchema
+from src.domains.common.association.author_book import AuthorBook
+from src.domains.genre.models import Genre
+
+
+async def search_titles(session: AsyncSession, q: str) -> list[str]:
+    books, _ = await search_books(session, BookSearchSchema.model_validate({"q": q}))
+    return [book.title for book in books]
+
+
+@pytest.mark.asyncio
+async def test_search_vector_follows_books_and_authors(
+    pg_session: AsyncSession,
+) -> None:
+    genre = Genre(name="Search Test Genre")
+    pg_session.add(genre)
+    await pg_session.flush()
+
+    author = Author(first_name="Лев", last_name="Толстой")
+    russian_book = Book(title="Война и мир", description="Роман о войне 1812 года", genre_id=genre.id)
+    latin_book = Book(title="War and Peace", genre_id=genre.id)
+    pg_session.add_all([author, russian_book, latin_book])
+    await pg_session.flush()
+    await pg_session.execute(insert(AuthorBook), [{"author_id": author.id, "book_id": latin_book.id}])
+
+    assert await search_titles(pg_session, "войны") == ["Война и мир"]
+    assert await search_titles(pg_session, "peace") == ["War and Peace"]
+    assert await search_titles(pg_session, "Толстого") == ["War and Peace"]
+
+    await pg_session.execute(update(Author).where(Author.id == author.id).values(last_name="Tolstoy"))
+    assert await search_titles(pg_session, "tolstoy") == ["War and Peace"]
+
+    await pg_session.execute(delete(AuthorBook).where(AuthorBook.author_id == author.id))
+    assert await search_titles(pg_session, "tolstoy") == []
+
+    await pg_session.rollback()
@@ -0,0 +1,99 @@
+import asyncio
+from collections.abc import Awaitable
+from typing import Any
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.single_flight import single_flight, single_flight_coalesced
+
+
+class Source:
+    """Stand-in repository read that blocks until released and records each execution."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[int, str]] = []
+        self.release = asyncio.Event()
+
+    async def read(self, session: AsyncSession, book_id: int, order: str = "asc") -> dict[str, int]:
+        self.calls.append((book_id, order))
+        await self.release.wait()
+        if book_id < 0:
+            raise LookupError(book_id)
+        return {"book_id": book_id}
+
+
+async def gather_released(source: Source, *calls: Awaitable[Any]) -> list[Any]:
+    tasks = [asyncio.ensure_future(call) for call in calls]
+    await asyncio.sleep(0)
+    source.release.set()
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_identical_calls_share_one_execution(db_session: AsyncSession) -> None:
+    source = Source()
+    read = single_flight(source.read)
+    coalesced_before = single_flight_coalesced.value(function=source.read.__qualname__)
+
+    results = await gather_released(
+        source,
+        read(db_session, 1),
+        read(db_session, 1, "asc"),
+        read(db_session, book_id=1, order="asc"),
+    )
+
+    assert source.calls == [(1, "asc")]
+    assert results[0] is results[1] is results[2]
+    assert single_flight_coalesced.value(function=source.read.__qualname__) == coalesced_before + 2
+
+
+@pytest.mark.asyncio
+async def test_different_arguments_run_separately(db_session: AsyncSession) -> None:
+    source = Source()
+    read = single_flight(source.read)
+
+    results = await gather_released(source, read(db_session, 1), read(db_session, 2), read(db_session, 1, "desc"))
+
+    assert sorted(source.calls) == [(1, "asc"), (1, "desc"), (2, "asc")]
+    assert results == [{"book_id": 1}, {"book_id": 2}, {"book_id": 1}]
+
+
+@pytest.mark.asyncio
+async def test_sequential_calls_are_not_cached(db_session: AsyncSession) -> None:
+    source = Source()
+    source.release.set()
+    read = single_flight(source.read)
+
+    await read(db_session, 1)
+    await read(db_session, 1)
+
+    assert source.calls == [(1, "asc"), (1, "asc")]
+
+
+@pytest.mark.asyncio
+async def test_error_reaches_every_caller(db_session: AsyncSession) -> None:
+    source = Source()
+    read = single_flight(source.read)
+
+    results = await gather_released(source, read(db_session, -1), read(db_session, -1))
+
+    assert len(source.calls) == 1
+    assert all(isinstance(result, LookupError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_hands_over_to_waiting_caller(db_session: AsyncSession) -> None:
+    source = Source()
+    read = single_flight(source.read)
+
+    leader = asyncio.ensure_future(read(db_session, 1))
+    follower = asyncio.ensure_future(read(db_session, 1))
+    await asyncio.sleep(0)
+    leader.cancel()
+    await asyncio.sleep(0)
+    source.release.set()
+
+    assert await follower == {"book_id": 1}
+    assert leader.cancelled()
+    assert len(source.calls) == 2
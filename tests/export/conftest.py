@@ -0,0 +1 @@
+from tests.book.conftest import test_author, test_genre, test_paged_books  # noqa: F401
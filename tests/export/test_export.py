@@ -0,0 +1,59 @@
+import csv
+import io
+import json
+from typing import Any
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domains.author.models import Author
+from src.domains.book.models import Book
+from tests.config import EXPORT_API_BASE_URL
+
+
+@pytest.mark.asyncio
+async def test_export_books_ndjson(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    admin_token: dict[str, Any],
+    test_paged_books: list[Book],
+) -> None:
+    headers = {"Authorization": f"Bearer {admin_token['token']['access_token']}"}
+    response = await client.get(f"{EXPORT_API_BASE_URL}books", headers=headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+    books = [json.loads(line) for line in response.text.splitlines()]
+    assert len(books) == await db_session.scalar(select(func.count()).select_from(Book))
+    assert {str(book.id) for book in test_paged_books} <= {book["id"] for book in books}
+    assert set(books[0]) == {"id", "title", "description", "genre_id", "category_id", "create_at", "update_at"}
+
+
+@pytest.mark.asyncio
+async def test_export_authors_csv(
+    client: AsyncClient,
+    admin_token: dict[str, Any],
+    test_author: Author,
+) -> None:
+    headers = {"Authorization": f"Bearer {admin_token['token']['access_token']}"}
+    response = await client.get(f"{EXPORT_API_BASE_URL}authors", params={"format": "csv"}, headers=headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert str(test_author.id) in {row["id"] for row in rows}
+
+
+@pytest.mark.asyncio
+async def test_export_requires_admin(
+    client: AsyncClient,
+    user_token: dict[str, Any],
+) -> None:
+    headers = {"Authorization": f"Bearer {user_token['token']['access_token']}"}
+    response = await client.get(f"{EXPORT_API_BASE_URL}reviews", headers=headers)
+
+    assert response.status_code == 403
@@ -1,3 +1,4 @@
+import uuid
 from typing import Any
 
 import pytest
@@ -8,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.domains.book.models import Book
 from src.domains.favorites.models import Favorites
 from tests.config import FAVORIYES_API_BASE_URL
+from tests.utils import QueryCounter, count_auth_queries
 
 
 @pytest.mark.asyncio
@@ -37,3 +39,87 @@ async def test_add_book_to_favorites(
 
     assert data["book_id"] == str(test_book.id)
     assert "user_id" in data
+
+
+@pytest.mark.asyncio
+async def test_get_my_favorites_single_statement(
+    client: AsyncClient,
+    query_counter: QueryCounter,
+    user_token: dict[str, Any],
+    test_book: Book,
+) -> None:
+    headers = {"Authorization": f"Bearer {user_token['token']['access_token']}"}
+    auth_queries = await count_auth_queries(client, query_counter, headers)
+
+    with query_counter:
+        response = await client.get(FAVORIYES_API_BASE_URL, headers=headers)
+
+    assert response.status_code == 200
+    assert query_counter.count - auth_queries == 1
+
+
+@pytest.mark.asyncio
+async def test_add_book_to_favorites_is_idempotent(
+    client: AsyncClient, user_token: dict[str, Any], test_book: Book
+) -> None:
+    headers = {"Authorization": f"Bearer {user_token['token']['access_token']}"}
+    favorites_payload = {"user_id": str(user_token["user_id"]), "book_id": str(test_book.id)}
+
+    await client.post(FAVORIYES_API_BASE_URL, headers=headers, json=favorites_payload)
+    response = await client.post(FAVORIYES_API_BASE_URL, headers=headers, json=favorites_payload)
+
+    assert response.status_code == 200, response.text
+    assert response.json()["book_id"] == str(test_book.id)
+
+
+@pytest.mark.asyncio
+async def test_add_unknown_book_to_favorites(client: AsyncClient, user_token: dict[str, Any]) -> None:
+    headers = {"Authorization": f"Bearer {user_token['token']['access_token']}"}
+    favorites_payload = {"user_id": str(user_token["user_id"]), "book_id": str(uuid.uuid4())}
+
+    response = await client.post(FAVORIYES_API_BASE_URL, headers=headers, json=favorites_payload)
+
+    assert response.status_code == 404, response.text
+
+
+@pytest.mark.asyncio
+async def test_batch_favorites(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    query_counter: QueryCounter,
+    user_token: dict[str, Any],
+    test_book: Book,
+) -> None:
+    headers = {"Authorization": f"Bearer {user_token['token']['access_token']}"}
+    other_book = Book(title="Batch Favorite Book", genre_id=test_book.genre_id)
+    db_session.add(other_book)
+    await db_session.commit()
+    unknown_id = uuid.uuid4()
+
+    await client.post(
+        FAVORIYES_API_BASE_URL,
+        headers=headers,
+        json={"user_id": str(user_token["user_id"]), "book_id": str(test_book.id)},
+    )
+    auth_queries = await count_auth_queries(client, query_counter, headers)
+
+    with query_counter:
+        response = await client.post(
+            f"{FAVORIYES_API_BASE_URL}batch",
+            headers=headers,
+            json={"add": [str(other_book.id), str(unknown_id)], "remove": [str(test_book.id)]},
+        )
+
+    assert response.status_code == 200, response.text
+    assert response.json() == {
+        "added": [str(other_book.id)],
+        "removed": [str(test_book.id)],
+        "not_found": [str(unknown_id)],
+    }
+    # DELETE ... RETURNING, INSERT ... ON CONFLICT and the existence check of the skipped id
+    assert query_counter.count - auth_queries == 3
+
+    result = await db_session.execute(select(Favorites.book_id).where(Favorites.user_id == user_token["user_id"]))
+    favorite_ids = set(result.scalars())
+    assert other_book.id in favorite_ids
+    assert test_book.id not in favorite_ids
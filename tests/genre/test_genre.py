@@ -6,9 +6,12 @@ from httpx import AsyncClient
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.cache.reference_data import LOAD_STATEMENTS
 from src.domains.genre.models import Genre
 from src.domains.user.models import User
+from src.setting import settings
 from tests.config import GENRE_API_BASE_URL
+from tests.utils import QueryCounter
 
 
 @pytest.mark.asyncio
@@ -29,6 +32,78 @@ async def test_get_all_genres(
     assert test_genre.name in genre_names
 
 
+@pytest.mark.asyncio
+async def test_get_all_genres_served_from_memory(
+    client: AsyncClient,
+    query_counter: QueryCounter,
+    test_genre: Genre,
+) -> None:
+    with query_counter:
+        response = await client.get(GENRE_API_BASE_URL)
+
+    assert response.status_code == 200
+    assert query_counter.count == LOAD_STATEMENTS
+
+    with query_counter:
+        response = await client.get(GENRE_API_BASE_URL)
+        by_id_response = await client.get(f"{GENRE_API_BASE_URL}{test_genre.id}")
+
+    assert response.status_code == 200
+    assert by_id_response.status_code == 200
+    assert query_counter.count == 0, query_counter.statements
+
+
+@pytest.mark.asyncio
+async def test_get_all_genres_revalidated_by_etag(
+    client: AsyncClient,
+    test_genre: Genre,
+) -> None:
+    response = await client.get(GENRE_API_BASE_URL)
+
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"] == f"public, max-age={settings.reference_data_max_age_seconds}"
+
+    response = await client.get(GENRE_API_BASE_URL, headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+    response = await client.get(GENRE_API_BASE_URL, headers={"If-None-Match": '"0-stale"'})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] == etag
+
+
+@pytest.mark.asyncio
+async def test_genre_write_reloads_snapshot(
+    client: AsyncClient,
+    test_genre: Genre,
+    existing_active_test_admin: User,
+    admin_token: dict[str, Any],
+) -> None:
+    response = await client.get(GENRE_API_BASE_URL)
+    etag = response.headers["etag"]
+
+    headers = {"Authorization": f"Bearer {admin_token['token']['access_token']}"}
+    response = await client.post(GENRE_API_BASE_URL, headers=headers, json={"name": "Snapshot Genre"})
+    assert response.status_code == 201
+    genre_id = response.json()["id"]
+
+    response = await client.get(GENRE_API_BASE_URL, headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert genre_id in [genre["id"] for genre in response.json()]
+
+    response = await client.delete(f"{GENRE_API_BASE_URL}{genre_id}", headers=headers)
+    assert response.status_code == 204
+
+    response = await client.get(f"{GENRE_API_BASE_URL}{genre_id}")
+    assert response.status_code == 404
+
+
 @pytest.mark.asyncio
 async def test_get_genre_by_id_success(
     client: AsyncClient,
@@ -0,0 +1,78 @@
+import logging
+from typing import Any
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.db.pool import connection_route
+from src.db.query_stats import fingerprint, instrument_query_stats, query_stats
+from tests.config import METRICS_API_BASE_URL
+
+
+@pytest.mark.asyncio
+async def test_get_metrics(
+    client: AsyncClient,
+    admin_token: dict[str, Any],
+) -> None:
+    headers = {"Authorization": f"Bearer {admin_token['token']['access_token']}"}
+    response = await client.get(METRICS_API_BASE_URL, headers=headers)
+
+    assert response.status_code == 200
+    assert response.json()["auth_user_cache_misses_total"]["type"] == "counter"
+
+
+@pytest.mark.asyncio
+async def test_get_metrics_forbidden(
+    client: AsyncClient,
+    user_token: dict[str, Any],
+) -> None:
+    headers = {"Authorization": f"Bearer {user_token['token']['access_token']}"}
+    response = await client.get(METRICS_API_BASE_URL, headers=headers)
+
+    assert response.status_code == 403
+
+
+@pytest.mark.parametrize(
+    ("statement", "expected"),
+    [
+        ("SELECT book.id FROM book WHERE book.id = $1::UUID", "SELECT book.id FROM book WHERE book.id = ?::UUID"),
+        ("SELECT * FROM genre WHERE name = 'Роман' LIMIT 10", "SELECT * FROM genre WHERE name = ? LIMIT ?"),
+        ("SELECT * FROM author WHERE id IN (?, ?, ?)", "SELECT * FROM author WHERE id IN (...)"),
+        ("INSERT INTO t (a, b) VALUES (%(a_0)s, %(b_0)s), (%(a_1)s, %(b_1)s)", "INSERT INTO t (a, b) VALUES (...)"),
+        ("SELECT rating_1 -- comment\n  FROM  book_stats", "SELECT rating_1 FROM book_stats"),
+    ],
+)
+def test_fingerprint(statement: str, expected: str) -> None:
+    assert fingerprint(statement) == expected
+
+
+@pytest.mark.asyncio
+async def test_get_query_stats(
+    client: AsyncClient,
+    admin_token: dict[str, Any],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    instrument_query_stats(engine, query_stats, slow_threshold_seconds=0, sample_rate=1)
+    query_stats.clear()
+    token = connection_route.set("GET /slow")
+
+    try:
+        with caplog.at_level(logging.WARNING, logger="src.db.query_stats"):
+            async with engine.connect() as connection:
+                for value in (1, 2, 3):
+                    await connection.execute(text("SELECT :value + 1"), {"value": value})
+    finally:
+        connection_route.reset(token)
+        await engine.dispose()
+
+    assert "route GET /slow" in caplog.text
+
+    headers = {"Authorization": f"Bearer {admin_token['token']['access_token']}"}
+    response = await client.get(f"{METRICS_API_BASE_URL}queries", headers=headers, params={"order_by": "calls"})
+
+    assert response.status_code == 200
+    assert response.json()[0]["fingerprint"] == "SELECT ? + ?"
+    assert response.json()[0]["calls"] == 3
@@ -0,0 +1,126 @@
+import uuid
+from typing import Any
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.constants.reading_status import BookReadingStatus
+from src.domains.book.models import Book
+from src.domains.reading_status.models import ReadingStatus
+from tests.config import READING_STATUS_API_BASE_URL
+from tests.utils import QueryCounter, count_auth_queries
+
+
+@pytest.mark.asyncio
+async def test_get_reading_statuses_single_statement(
+    client: AsyncClient,
+    query_counter: QueryCounter,
+    user_token: dict[str, Any],
+    test_book: Book,
+) -> None:
+    headers = {"Authorization": f"Bearer {user_token['token']['access_token']}"}
+    payload = {"book_id": str(test_book.id), "status": BookReadingStatus.READING}
+    response = await client.post(f"{READING_STATUS_API_BASE_URL}reading-status", json=payload, headers=headers)
+    assert response.status_code in (201, 409), response.text
+
+    auth_queries = await count_auth_queries(client, query_counter, headers)
+
+    with query_counter:
+        response = await client.get(READING_STATUS_API_BASE_URL, params={"status": payload["status"]}, headers=headers)
+
+    assert response.status_code == 200
+    assert str(test_book.id) in {book["id"] for book in response.json()}
+    assert query_counter.count - auth_queries == 1
+
+
+@pytest.mark.asyncio
+async def test_set_reading_status_replaces_existing(
+    client: AsyncClient, user_token: dict[str, Any], test_book: Book
+) -> None:
+    headers = {"Authorization": f"Bearer {user_token['token']['access_token']}"}
+    url = f"{READING_STATUS_API_BASE_URL}reading-status"
+
+    for status in (BookReadingStatus.READING, BookReadingStatus.FINISHED):
+        response = await client.post(url, json={"book_id": str(test_book.id), "status": status}, headers=headers)
+        assert response.status_code == 201, response.text
+
+    response = await client.get(f"{READING_STATUS_API_BASE_URL}{test_book.id}/reading-status", headers=headers)
+    assert response.json()["status"] == BookReadingStatus.FINISHED
+
+
+@pytest.mark.asyncio
+async def test_set_reading_status_single_statement(
+    client: AsyncClient,
+    query_counter: QueryCounter,
+    user_token: dict[str, Any],
+    test_book: Book,
+) -> None:
+    headers = {"Authorization": f"Bearer {user_token['token']['access_token']}"}
+    payload = {"book_id": str(test_book.id), "status": BookReadingStatus.READING}
+
+    auth_queries = await count_auth_queries(client, query_counter, headers)
+
+    with query_counter:
+        response = await client.post(f"{READING_STATUS_API_BASE_URL}reading-status", json=payload, headers=headers)
+
+    assert response.status_code == 201, response.text
+    assert query_counter.count - auth_queries == 1
+
+
+@pytest.mark.asyncio
+async def test_set_reading_status_unknown_book(client: AsyncClient, user_token: dict[str, Any]) -> None:
+    headers = {"Authorization": f"Bearer {user_token['token']['access_token']}"}
+    payload = {"book_id": str(uuid.uuid4()), "status": BookReadingStatus.READING}
+
+    response = await client.post(f"{READING_STATUS_API_BASE_URL}reading-status", json=payload, headers=headers)
+
+    assert response.status_code == 404, response.text
+
+
+@pytest.mark.asyncio
+async def test_batch_reading_statuses(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    user_token: dict[str, Any],
+    test_book: Book,
+) -> None:
+    headers = {"Authorization": f"Bearer {user_token['token']['access_token']}"}
+    other_book = Book(title="Batch Reading Status Book", genre_id=test_book.genre_id)
+    db_session.add(other_book)
+    await db_session.commit()
+    unknown_id = uuid.uuid4()
+
+    await client.post(
+        f"{READING_STATUS_API_BASE_URL}reading-status",
+        json={"book_id": str(test_book.id), "status": BookReadingStatus.READING},
+        headers=headers,
+    )
+
+    response = await client.post(
+        f"{READING_STATUS_API_BASE_URL}reading-status/batch",
+        json={
+            "statuses": [
+                {"book_id": str(other_book.id), "status": BookReadingStatus.READING},
+                {"book_id": str(unknown_id), "status": BookReadingStatus.FINISHED},
+                {"book_id": str(other_book.id), "status": BookReadingStatus.FINISHED},
+            ],
+            "remove": [str(test_book.id)],
+        },
+        headers=headers,
+    )
+
+    assert response.status_code == 200, response.text
+    assert response.json() == {
+        "updated": [str(other_book.id)],
+        "removed": [str(test_book.id)],
+        "not_found": [str(unknown_id)],
+    }
+
+    result = await db_session.execute(
+        select(ReadingStatus.book_id, ReadingStatus.status).where(ReadingStatus.user_id == user_token["user_id"])
+    )
+    statuses = dict(result.tuples().all())
+    assert statuses[other_book.id] == BookReadingStatus.FINISHED
+    assert test_book.id not in statuses
@@ -1,3 +1,4 @@
+import json
 from typing import Any
 from uuid import UUID, uuid4
 
@@ -6,10 +7,12 @@ from httpx import AsyncClient
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.constants.pagination import NEXT_CURSOR_HEADER
 from src.domains.book.models import Book
 from src.domains.review.models import Review
 from src.domains.user.models import User
 from tests.config import REVIEW_API_BASE_URL
+from tests.utils import QueryCounter, count_auth_queries
 
 
 @pytest.mark.asyncio
@@ -27,6 +30,19 @@ async def test_get_all_reviews(
     assert len(data) > 0
 
 
+@pytest.mark.asyncio
+async def test_get_all_reviews_single_statement(
+    client: AsyncClient,
+    query_counter: QueryCounter,
+    test_review: Review,
+) -> None:
+    with query_counter:
+        response = await client.get(REVIEW_API_BASE_URL)
+
+    assert response.status_code == 200
+    assert query_counter.count == 1
+
+
 @pytest.mark.asyncio
 async def test_get_all_reviews_by_book_id(
     client: AsyncClient,
@@ -189,6 +205,23 @@ async def test_patch_review_success(
     assert updated_review.text == updated_text
 
 
+@pytest.mark.asyncio
+async def test_patch_review_rejects_null_rating(
+    client: AsyncClient,
+    test_review: Review,
+    user_token: dict[str, Any],
+) -> None:
+    headers = {"Authorization": f"Bearer {user_token['token']['access_token']}"}
+
+    response = await client.patch(
+        f"{REVIEW_API_BASE_URL}{test_review.id}",
+        headers=headers,
+        json={"rating": None, "text": "Still a review"},
+    )
+
+    assert response.status_code == 422
+
+
 @pytest.mark.asyncio
 async def test_patch_review_unauthorized(
     client: AsyncClient,
@@ -325,3 +358,118 @@ async def test_delete_review_not_found(
     )
 
     assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_patch_and_delete_review_query_count(
+    client: AsyncClient,
+    query_counter: QueryCounter,
+    test_review: Review,
+    user_token: dict[str, Any],
+) -> None:
+    headers = {"Authorization": f"Bearer {user_token['token']['access_token']}"}
+    auth_queries = await count_auth_queries(client, query_counter, headers)
+
+    with query_counter:
+        response = await client.patch(
+            f"{REVIEW_API_BASE_URL}{test_review.id}", headers=headers, json={"rating": 2}
+        )
+
+    assert response.status_code == 200
+    assert response.json()["rating"] == 2
+    # Stats UPDATE ... FROM review, then the ownership-checked UPDATE ... RETURNING
+    assert query_counter.count - auth_queries == 2, query_counter.statements
+
+    with query_counter:
+        response = await client.delete(f"{REVIEW_API_BASE_URL}{test_review.id}", headers=headers)
+
+    assert response.status_code == 204
+    # Ownership-checked DELETE ... RETURNING, then the stats UPDATE
+    assert query_counter.count - auth_queries == 2, query_counter.statements
+
+
+@pytest.mark.asyncio
+async def test_get_all_reviews_keyset_pagination(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    existing_test_user: User,
+    test_book: Book,
+) -> None:
+    paged_reviews_count = 5
+    book = Book(title="Book With Paged Reviews", genre_id=test_book.genre_id)
+    db_session.add(book)
+    await db_session.flush()
+    db_session.add_all(
+        Review(user_id=existing_test_user.id, book_id=book.id, rating=i % 5 + 1) for i in range(paged_reviews_count)
+    )
+    await db_session.commit()
+
+    seen: list[dict[str, Any]] = []
+    params: dict[str, Any] = {"book_id": str(book.id), "limit": 2}
+    while True:
+        response = await client.get(REVIEW_API_BASE_URL, params=params)
+        assert response.status_code == 200
+        seen.extend(response.json())
+        if NEXT_CURSOR_HEADER not in response.headers:
+            break
+        params["cursor"] = response.headers[NEXT_CURSOR_HEADER]
+
+    assert len({review["id"] for review in seen}) == paged_reviews_count
+    keys = [(review["create_at"], review["id"]) for review in seen]
+    assert keys == sorted(keys, reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_get_all_reviews_with_text(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    existing_test_user: User,
+    test_book: Book,
+) -> None:
+    book = Book(title="Book With Rating-Only Reviews", genre_id=test_book.genre_id)
+    db_session.add(book)
+    await db_session.flush()
+    with_text = Review(user_id=existing_test_user.id, book_id=book.id, rating=5, text="Great")
+    db_session.add_all(
+        [
+            with_text,
+            Review(user_id=existing_test_user.id, book_id=book.id, rating=4, text=""),
+            Review(user_id=existing_test_user.id, book_id=book.id, rating=3, text=None),
+        ]
+    )
+    await db_session.commit()
+
+    response = await client.get(REVIEW_API_BASE_URL, params={"book_id": str(book.id), "with_text": True})
+
+    assert response.status_code == 200
+    assert [review["id"] for review in response.json()] == [str(with_text.id)]
+
+
+@pytest.mark.asyncio
+async def test_stream_reviews(
+    client: AsyncClient,
+    test_review: Review,
+    test_book: Book,
+    admin_token: dict[str, Any],
+) -> None:
+    headers = {"Authorization": f"Bearer {admin_token['token']['access_token']}"}
+    response = await client.get(f"{REVIEW_API_BASE_URL}stream", params={"book_id": str(test_book.id)}, headers=headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert str(test_review.id) in {row["id"] for row in rows}
+    assert {row["book_id"] for row in rows} == {str(test_book.id)}
+
+
+@pytest.mark.asyncio
+async def test_stream_reviews_requires_admin(
+    client: AsyncClient,
+    user_token: dict[str, Any],
+) -> None:
+    response = await client.get(f"{REVIEW_API_BASE_URL}stream")
+    assert response.status_code == 401
+
+    headers = {"Authorization": f"Bearer {user_token['token']['access_token']}"}
+    response = await client.get(f"{REVIEW_API_BASE_URL}stream", headers=headers)
+    assert response.status_code == 403
@@ -0,0 +1,99 @@
+from typing import Any
+
+import pytest
+from httpx import AsyncClient
+
+from src.auth.cache import user_cache_hits
+from src.auth.utils import password_hash_duration_seconds, password_hash_queue_depth
+from src.constants.pagination import MAX_PAGINATION_LIMIT
+from src.domains.user.models import User
+from tests.config import AUTH_API_BASE_URL, GENRE_API_BASE_URL, USER_API_BASE_URL
+from tests.user.conftest import TEST_USER
+from tests.utils import QueryCounter, count_auth_queries
+
+CACHED_USER = {**TEST_USER, "username": "cacheduser123", "email": "cacheduser123@example.com"}
+REFERENCE_DATA_USER = {**TEST_USER, "username": "refdatauser123", "email": "refdatauser123@example.com"}
+
+
+@pytest.mark.asyncio
+async def test_get_all_users_query_count(
+    client: AsyncClient,
+    query_counter: QueryCounter,
+    user_token: dict[str, Any],
+) -> None:
+    with query_counter:
+        response = await client.get(USER_API_BASE_URL, params={"limit": MAX_PAGINATION_LIMIT})
+
+    assert response.status_code == 200
+    assert str(user_token["user_id"]) in {user["id"] for user in response.json()}
+    # users and their roles (selectinload)
+    assert query_counter.count == 2, query_counter.statements
+
+
+@pytest.mark.asyncio
+async def test_create_user_takes_role_from_reference_data(
+    client: AsyncClient,
+    query_counter: QueryCounter,
+) -> None:
+    await client.get(GENRE_API_BASE_URL)
+
+    with query_counter:
+        response = await client.post(USER_API_BASE_URL, json=REFERENCE_DATA_USER)
+
+    assert response.status_code == 201
+    assert response.json()["role"] == REFERENCE_DATA_USER["role"]
+    assert not any("FROM role" in statement for statement in query_counter.statements), query_counter.statements
+
+
+@pytest.mark.asyncio
+async def test_current_user_served_from_cache(
+    client: AsyncClient,
+    query_counter: QueryCounter,
+    user_token: dict[str, Any],
+) -> None:
+    headers = {"Authorization": f"Bearer {user_token['token']['access_token']}"}
+    hits = user_cache_hits.value()
+
+    assert await count_auth_queries(client, query_counter, headers) == 0
+    assert user_cache_hits.value() >= hits + 1
+
+
+@pytest.mark.asyncio
+async def test_disabled_user_rejected_despite_cache(
+    client: AsyncClient,
+) -> None:
+    response = await client.post(USER_API_BASE_URL, json=CACHED_USER)
+    assert response.status_code == 201
+    user_id = response.json()["id"]
+
+    credentials = {"username": CACHED_USER["username"], "password": CACHED_USER["password"]}
+    response = await client.post(f"{AUTH_API_BASE_URL}login", data=credentials)
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    response = await client.get(f"{USER_API_BASE_URL}me", headers=headers)
+    assert response.status_code == 200
+
+    response = await client.patch(f"{USER_API_BASE_URL}{user_id}", json={"disabled": True})
+    assert response.status_code == 200
+
+    response = await client.get(f"{USER_API_BASE_URL}me", headers=headers)
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_login_verifies_password_in_hash_pool(
+    client: AsyncClient,
+    existing_test_user: User,
+) -> None:
+    verified = password_hash_duration_seconds.count(operation="verify")
+
+    credentials = {"username": TEST_USER["username"], "password": "WrongPass123!"}
+    response = await client.post(f"{AUTH_API_BASE_URL}login", data=credentials)
+    assert response.status_code == 401
+
+    credentials["password"] = TEST_USER["password"]
+    response = await client.post(f"{AUTH_API_BASE_URL}login", data=credentials)
+    assert response.status_code == 200
+
+    assert password_hash_duration_seconds.count(operation="verify") == verified + 2
+    assert password_hash_queue_depth.value() == 0
@@ -0,0 +1,83 @@
+from collections.abc import Awaitable, Callable
+from typing import Any, Self
+
+from httpx import AsyncClient
+from sqlalchemy import ClauseElement, Engine, event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tests.config import USER_API_BASE_URL
+
+
+class QueryCounter:
+    """Counts SQL statements sent to the engine inside a `with` block."""
+
+    def __init__(self, engine: Engine) -> None:
+        self.engine = engine
+        self.statements: list[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def _on_execute(self, conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        self.statements.append(statement)
+
+    def __enter__(self) -> Self:
+        self.statements = []
+        event.listen(self.engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        event.remove(self.engine, "before_cursor_execute", self._on_execute)
+
+
+async def count_auth_queries(client: AsyncClient, counter: QueryCounter, headers: dict[str, str]) -> int:
+    """Statements the auth guard issues for `headers` once warmed up, to subtract from a request's count."""
+
+    for _ in range(2):
+        with counter:
+            response = await client.get(f"{USER_API_BASE_URL}me", headers=headers)
+        assert response.status_code == 200
+
+    return counter.count
+
+
+async def explain(session: AsyncSession, stmt: ClauseElement) -> str:
+    """Return the Postgres plan for `stmt` with sequential scans discouraged.
+
+    Test tables are tiny, so without `enable_seqscan = off` the planner would never pick an index.
+    """
+
+    await session.execute(text("SET LOCAL enable_seqscan = off"))
+    compiled = stmt.compile(dialect=session.get_bind().dialect, compile_kwargs={"literal_binds": True})
+    connection = await session.connection()
+    result = await connection.exec_driver_sql(f"EXPLAIN {compiled}")
+    return "\n".join(row[0] for row in result)
+
+
+async def explain_calls(session: AsyncSession, call: Callable[[], Awaitable[Any]]) -> list[str]:
+    """Run `call` on `session` and return the Postgres plan of every statement it issued.
+
+    Statements are explained with the parameters they were executed with, after `call`
+    has returned, so repository functions are checked as they are rather than as copies
+    of their SQL. Sequential scans are discouraged as in `explain`.
+    """
+
+    await session.execute(text("SET LOCAL enable_seqscan = off"))
+    connection = await session.connection()
+    executed: list[tuple[str, Any]] = []
+
+    def record(conn: Any, cursor: Any, statement: str, parameters: Any, *args: Any) -> None:
+        executed.append((statement, parameters))
+
+    event.listen(connection.sync_connection, "before_cursor_execute", record)
+    try:
+        await call()
+    finally:
+        event.remove(connection.sync_connection, "before_cursor_execute", record)
+
+    plans = []
+    for statement, parameters in executed:
+        result = await connection.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+        plans.append("\n".join(row[0] for row in result))
+    return plans